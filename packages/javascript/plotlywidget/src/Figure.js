@@ -171,6 +171,29 @@ var FigureModel = widgets.DOMWidgetModel.extend(
        */
       _py2js_animate: null,
 
+      /**
+       * @typedef {null|Object} Py2JsExtendTracesMsg
+       * @property {Object} extend_data
+       *  Object from property paths to arrays of arrays of new values, with
+       *  one array per trace index, as accepted by Plotly.extendTraces
+       * @property {Array.<Number>} extend_traces
+       *  Array of indexes of the traces that the extendTraces operation
+       *  applies to
+       * @property {null|Number|Object} max_points
+       *  Maximum number of points to keep in each extended array, or null
+       *  to keep all points. Either a number, or an object from every
+       *  property path of extend_data to an array with one number per
+       *  trace index, where -1 keeps all points, as accepted by
+       *  Plotly.extendTraces
+       * @property {Number} trace_edit_id
+       *  Edit ID to use when returning trace deltas using
+       *  the _js2py_traceDeltas message
+       * @property {Number} layout_edit_id
+       *  Edit ID to use when returning layout deltas using
+       *  the _js2py_layoutDelta message
+       */
+      _py2js_extendTraces: null,
+
       /**
        * @typedef {null|Object} Py2JsRemoveLayoutPropsMsg
        * @property {Array.<Array.<String|Number>>} remove_props
@@ -399,6 +422,7 @@ var FigureModel = widgets.DOMWidgetModel.extend(
       this.on("change:_py2js_relayout", this.do_relayout, this);
       this.on("change:_py2js_update", this.do_update, this);
       this.on("change:_py2js_animate", this.do_animate, this);
+      this.on("change:_py2js_extendTraces", this.do_extendTraces, this);
       this.on(
         "change:_py2js_removeLayoutProps",
         this.do_removeLayoutProps,
@@ -568,6 +592,22 @@ var FigureModel = widgets.DOMWidgetModel.extend(
       }
     },
 
+    /**
+     * Handle extendTraces message
+     */
+    do_extendTraces: function () {
+      /** @type {Py2JsExtendTracesMsg} */
+      var msgData = this.get("_py2js_extendTraces");
+      if (msgData !== null) {
+        performExtendTracesLike(
+          this.get("_data"),
+          msgData.extend_data,
+          msgData.extend_traces,
+          msgData.max_points
+        );
+      }
+    },
+
     /**
      * Handle removeLayoutProps message
      */
@@ -633,6 +673,10 @@ var FigureModel = widgets.DOMWidgetModel.extend(
           deserialize: py2js_deserializer,
           serialize: js2py_serializer,
         },
+        _py2js_extendTraces: {
+          deserialize: py2js_deserializer,
+          serialize: js2py_serializer,
+        },
         _py2js_removeLayoutProps: {
           deserialize: py2js_deserializer,
           serialize: js2py_serializer,
@@ -703,6 +747,7 @@ var FigureView = widgets.DOMWidgetView.extend({
     this.model.on("change:_py2js_relayout", this.do_relayout, this);
     this.model.on("change:_py2js_update", this.do_update, this);
     this.model.on("change:_py2js_animate", this.do_animate, this);
+    this.model.on("change:_py2js_extendTraces", this.do_extendTraces, this);
 
     // MathJax configuration
     // ---------------------
@@ -1322,6 +1367,39 @@ var FigureView = widgets.DOMWidgetView.extend({
     }
   },
 
+  /**
+   * Handle Plotly.extendTraces request
+   */
+  do_extendTraces: function () {
+    /** @type {Py2JsExtendTracesMsg} */
+    var msgData = this.model.get("_py2js_extendTraces");
+
+    if (msgData !== null) {
+      var extendData = msgData.extend_data;
+      var traceIndexes = msgData.extend_traces;
+
+      if (msgData.max_points === null) {
+        Plotly.extendTraces(this.el, extendData, traceIndexes);
+      } else {
+        Plotly.extendTraces(
+          this.el,
+          extendData,
+          traceIndexes,
+          msgData.max_points
+        );
+      }
+
+      // ### Send trace deltas ###
+      // We create an array of deltas corresponding to the extended
+      // traces.
+      this._sendTraceDeltas(msgData.trace_edit_id);
+
+      // ### Send layout delta ###
+      var layout_edit_id = msgData.layout_edit_id;
+      this._sendLayoutDelta(layout_edit_id);
+    }
+  },
+
   /**
    * Construct layout delta object and send layoutDelta message to the
    * Python side
@@ -1426,6 +1504,131 @@ function serializeTypedArray(v) {
   return res;
 }
 
+/**
+ * Deserialize a buffer/dtype/shape object that corresponds to a numpy array
+ * on the Python side
+ *
+ * Numeric arrays are converted into typed arrays. Arrays with more than one
+ * dimension are converted into nested arrays, where the innermost arrays are
+ * typed arrays that share the received buffer. Arrays with a dtype of 'bool'
+ * are converted into arrays of booleans, and arrays with a dtype of
+ * 'datetime64[D]' or 'datetime64[us]' are converted into arrays of ISO date
+ * strings.
+ *
+ * @param {Object} v
+ *  Object with a buffer (or value), dtype and shape property
+ * @returns {Array|TypedArray}
+ */
+function deserializeTypedArray(v) {
+  // Note plotly.py<=3.1.1 called the buffer object `buffer`
+  // This was renamed `value` in 3.2 to work around a naming conflict
+  // when saving widget state to a notebook.
+  var dataView = _.has(v, "value") ? v.value : v.buffer;
+
+  var dtype = v.dtype;
+  var typedarray_type;
+  if (dtype === "bool") {
+    typedarray_type = Uint8Array;
+  } else if (_.startsWith(dtype, "datetime64")) {
+    typedarray_type = Float64Array;
+  } else {
+    typedarray_type = numpy_dtype_to_typedarray_type[dtype];
+  }
+
+  // Typed arrays must start at a multiple of their element size in the
+  // underlying buffer, so copy the data if needed
+  var buffer = dataView.buffer;
+  var byteOffset = dataView.byteOffset;
+  var byteLength = dataView.byteLength;
+  if (byteOffset % typedarray_type.BYTES_PER_ELEMENT !== 0) {
+    buffer = buffer.slice(byteOffset, byteOffset + byteLength);
+    byteOffset = 0;
+  }
+  var values = new typedarray_type(
+    buffer,
+    byteOffset,
+    byteLength / typedarray_type.BYTES_PER_ELEMENT
+  );
+
+  if (dtype === "bool") {
+    values = Array.prototype.map.call(values, function (x) {
+      return x !== 0;
+    });
+  } else if (_.startsWith(dtype, "datetime64")) {
+    var unit = dtype === "datetime64[D]" ? "D" : "us";
+    values = Array.prototype.map.call(values, function (x) {
+      return datetimeToString(x, unit);
+    });
+  }
+
+  return reshapeArray(values, v.shape);
+}
+
+/**
+ * Convert a datetime value into an ISO date string, formatted like the
+ * date strings of datetime64 arrays that are serialized as lists
+ *
+ * @param {Number} value
+ *  Number of days (unit "D") or microseconds (unit "us") since the epoch,
+ *  or NaN for NaT
+ * @param {String} unit
+ *  "D" or "us"
+ * @returns {null|String}
+ *  Date string ('2020-01-31' for unit "D", '2020-01-31T12:30:00' or
+ *  '2020-01-31T12:30:00.000001' for unit "us"), or null for NaN
+ */
+function datetimeToString(value, unit) {
+  if (isNaN(value)) {
+    return null;
+  } else if (unit === "D") {
+    return new Date(value * 86400000).toISOString().slice(0, 10);
+  }
+
+  var seconds = Math.floor(value / 1e6);
+  var res = new Date(seconds * 1000).toISOString().slice(0, 19);
+  var microseconds = value - seconds * 1e6;
+  if (microseconds !== 0) {
+    res += "." + ("00000" + microseconds).slice(-6);
+  }
+  return res;
+}
+
+/**
+ * Reshape a flat array into nested arrays
+ *
+ * @param {Array|TypedArray} values
+ *  Flat array of values in row-major order
+ * @param {Array.<Number>} shape
+ *  Shape of the nested arrays
+ * @returns {Array|TypedArray}
+ *  values if shape has a single dimension, nested arrays otherwise. The
+ *  innermost arrays of a typed array are views of the same buffer.
+ */
+function reshapeArray(values, shape) {
+  if (shape.length <= 1) {
+    return values;
+  }
+
+  var innerShape = shape.slice(1);
+  var innerSize = _.reduce(
+    innerShape,
+    function (a, b) {
+      return a * b;
+    },
+    1
+  );
+
+  var res = new Array(shape[0]);
+  for (var i = 0; i < shape[0]; i++) {
+    var start = i * innerSize;
+    var inner = isTypedArray(values)
+      ? values.subarray(start, start + innerSize)
+      : values.slice(start, start + innerSize);
+    res[i] = reshapeArray(inner, innerShape);
+  }
+  return res;
+}
+
 /**
  * ipywidget JavaScript -> Python serializer
  */
@@ -1480,13 +1683,7 @@ function py2js_deserializer(v, widgetManager) {
     ) {
       // Deserialize special buffer/dtype/shape objects into typed arrays
       // These objects correspond to numpy arrays on the Python side
-      //
-      // Note plotly.py<=3.1.1 called the buffer object `buffer`
-      // This was renamed `value` in 3.2 to work around a naming conflict
-      // when saving widget state to a notebook.
-      var typedarray_type = numpy_dtype_to_typedarray_type[v.dtype];
-      var buffer = _.has(v, "value") ? v.value.buffer : v.buffer.buffer;
-      res = new typedarray_type(buffer);
+      res = deserializeTypedArray(v);
     } else {
       // Deserialize object properties recursively
       res = {};
@@ -1634,6 +1831,97 @@ function performRestyleLike(parentArray, restyleData, restyleTraces) {
   }
 }
 
+/**
+ * Perform a Plotly.extendTraces like operation on an input object array
+ *
+ * @param {Array.<Object>} parentArray
+ *  The object that the extendTraces operation should be applied to
+ * @param {Object} extendData
+ *  Object from property paths to arrays of arrays of new values, with one
+ *  array per trace index, as accepted by Plotly.extendTraces
+ * @param {Array.<Number>} extendTraces
+ *  Array of indexes of the traces that the extendTraces operation applies to
+ * @param {null|Number|Object} maxPoints
+ *  Maximum number of points to keep in each extended array, as accepted by
+ *  Plotly.extendTraces, or null to keep all points. Negative numbers keep
+ *  all points of an array
+ *
+ *  Examples:
+ *      var d = [{x: [1, 2]}, {x: [3]}]
+ *      performExtendTracesLike(d, {x: [[4, 5], [6]]}, [0, 1], null)
+ *      d -> [{x: [1, 2, 4, 5]}, {x: [3, 6]}]
+ *
+ *      var d = [{x: [1, 2]}, {x: [3]}]
+ *      performExtendTracesLike(d, {x: [[4, 5]]}, [0], 3)
+ *      d -> [{x: [2, 4, 5]}, {x: [3]}]
+ */
+function performExtendTracesLike(
+  parentArray,
+  extendData,
+  extendTraces,
+  maxPoints
+) {
+  // Loop over the properties of extendData
+  for (var rawKey in extendData) {
+    if (!extendData.hasOwnProperty(rawKey)) {
+      continue;
+    }
+
+    var valArray = extendData[rawKey];
+
+    // Loop over the indexes of the traces being extended
+    for (var i = 0; i < extendTraces.length; i++) {
+      var trace = parentArray[extendTraces[i]];
+
+      // Get maximum number of points for this trace
+      var traceMaxPoints = maxPoints;
+      if (_.isPlainObject(traceMaxPoints)) {
+        traceMaxPoints = traceMaxPoints[rawKey];
+      }
+      if (Array.isArray(traceMaxPoints)) {
+        traceMaxPoints = traceMaxPoints[i % traceMaxPoints.length];
+      }
+
+      // Set property value
+      var newVal = concatArrays(_.get(trace, rawKey), valArray[i]);
+      if (
+        typeof traceMaxPoints === "number" &&
+        traceMaxPoints >= 0 &&
+        newVal.length > traceMaxPoints
+      ) {
+        newVal = newVal.slice(newVal.length - traceMaxPoints);
+      }
+      _.set(trace, rawKey, newVal);
+    }
+  }
+}
+
+/**
+ * Concatenate two arrays, either of which may be a typed array. The result
+ * is a typed array if both inputs are typed arrays of the same type, and a
+ * regular array otherwise.
+ *
+ * @param {undefined|null|Array|TypedArray} a
+ * @param {Array|TypedArray} b
+ * @returns {Array|TypedArray}
+ */
+function concatArrays(a, b) {
+  if (a === undefined || a === null) {
+    return b;
+  } else if (
+    isTypedArray(a) &&
+    isTypedArray(b) &&
+    a.constructor === b.constructor
+  ) {
+    var result = new a.constructor(a.length + b.length);
+    result.set(a);
+    result.set(b, a.length);
+    return result;
+  } else {
+    return Array.prototype.slice.call(a).concat(Array.prototype.slice.call(b));
+  }
+}
+
 /**
  * Perform a Plotly.moveTraces like operation on an input object array
  * @param parentArray
@@ -10,7 +10,8 @@ import io
 from copy import deepcopy
 import re
 import sys
-from six import string_types
+import warnings
+from six import string_types, integer_types
 
 from _plotly_utils.optional_imports import get_module
 
@@ -25,6 +26,60 @@ def fullmatch(regex, string, flags=0):
     return re.match("(?:" + regex_string + r")\Z", string, flags=flags)
 
 
+# Array configuration
+# -------------------
+class ArrayConfig(object):
+    """
+    Global configuration of how validators store array property values
+    """
+
+    _valid_copy_policies = ("copy", "borrow")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all array configuration settings to their default values
+        """
+        self._copy_policy = "copy"
+
+    @property
+    def copy_policy(self):
+        """
+        How numeric numpy arrays are stored by validators.
+
+        When "copy" (the default), validators store a read-only copy of
+        every array.
+
+        When "borrow", numpy arrays (including memory-mapped arrays) that
+        already have a requested dtype and are C-contiguous are not copied.
+        Validators store a read-only view of the caller's buffer instead.
+        The caller must not modify a borrowed array for as long as any
+        figure refers to it.
+
+        Returns
+        -------
+        str
+        """
+        return self._copy_policy
+
+    @copy_policy.setter
+    def copy_policy(self, val):
+        if val not in self._valid_copy_policies:
+            raise ValueError(
+                "Supported array copy policies include {valid}\n"
+                "    Received {val}".format(
+                    valid=self._valid_copy_policies, val=repr(val)
+                )
+            )
+        self._copy_policy = val
+
+
+array_config = ArrayConfig()
+del ArrayConfig
+
+
 # Utility functions
 # -----------------
 def to_scalar_or_list(v):
@@ -97,12 +152,14 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
             # Get the numeric numpy array so we use fast path below
             v = v.values
         elif v.dtype.kind == "M":
-            # Convert datetime Series/Index to numpy array of datetimes
+            # Convert datetime Series/Index to a datetime64 numpy array.
+            # Timezone-aware values are converted to an array of datetimes
+            # instead, so that they are serialized with their UTC offset
             if isinstance(v, pd.Series):
-                v = v.dt.to_pydatetime()
+                v = v.dt.to_pydatetime() if v.dt.tz is not None else v.values
             else:
                 # DatetimeIndex
-                v = v.to_pydatetime()
+                v = v.to_pydatetime() if v.tz is not None else v.values
     if not isinstance(v, np.ndarray):
         # v has its own logic on how to convert itself into a numpy array
         if is_numpy_convertable(v):
@@ -125,6 +182,14 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
             # Convert to the default dtype for the first kind
             dtype = kind_default_dtypes.get(first_kind, None)
             new_v = np.ascontiguousarray(v.astype(dtype))
+        elif (
+            array_config.copy_policy == "borrow"
+            and type(v) in (np.ndarray, np.memmap)
+            and v.flags.c_contiguous
+        ):
+            # Borrow the caller's buffer. A view is taken so that making it
+            # read-only below doesn't modify the caller's array
+            new_v = v.view(np.ndarray)
         else:
             # Either no kind was requested or requested kind is satisfied
             new_v = np.ascontiguousarray(v.copy())
@@ -145,8 +210,11 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
         # Here we make sure that non-numeric arrays have the object
         # datatype. This works around cases like np.array([1, 2, '3']) where
         # numpy converts the integers to strings and returns array of dtype
-        # '<U21'
-        if new_v.dtype.kind not in ["u", "i", "f", "O"]:
+        # '<U21'. datetime64 arrays are kept as-is when no kind was
+        # requested, they are serialized as date strings
+        if new_v.dtype.kind not in ["u", "i", "f", "O"] and not (
+            new_v.dtype.kind == "M" and not kind
+        ):
             new_v = np.array(v, dtype="object")
 
     # Set new array to be read-only
@@ -156,6 +224,37 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
     return new_v
 
 
+def copy_sharing_readonly_arrays(v):
+    """
+    Deep copy a structure of nested dicts, lists and tuples, sharing any
+    read-only numpy arrays it contains instead of copying them.
+
+    Read-only arrays (such as the arrays produced by
+    copy_to_readonly_numpy_array) can't be modified in place, so sharing
+    them between copies is safe.
+
+    Parameters
+    ----------
+    v
+        Value to copy
+
+    Returns
+    -------
+    Copy of v
+    """
+    if isinstance(v, dict):
+        return {k: copy_sharing_readonly_arrays(e) for k, e in v.items()}
+    elif isinstance(v, list):
+        return [copy_sharing_readonly_arrays(e) for e in v]
+    elif isinstance(v, tuple):
+        return tuple(copy_sharing_readonly_arrays(e) for e in v)
+
+    np = get_module("numpy", should_load=False)
+    if np is not None and isinstance(v, np.ndarray) and not v.flags.writeable:
+        return v
+    return deepcopy(v)
+
+
 def is_numpy_convertable(v):
     """
     Return whether a value is meaningfully convertable to a numpy array
@@ -200,6 +299,136 @@ def is_array(v):
     return is_simple_array(v) or is_homogeneous_array(v)
 
 
+# Native Python number types that are accepted by the NumberValidator and
+# IntegerValidator element-wise checks (isinstance(e, numbers.Number) and
+# isinstance(e, int) respectively)
+_native_number_types = frozenset(integer_types + (float, bool))
+_native_integer_types = frozenset((int, bool))
+
+
+def is_number_list_in_range(v, number_types, min_val=None, max_val=None):
+    """
+    Return whether all elements of a list or tuple have one of the given
+    number types and lie in the interval [min_val, max_val].
+
+    The element types are checked in a single pass over the list, and the
+    interval is checked in a single vectorized step on the array returned
+    by np.asarray. numpy is only used if it has already been imported.
+
+    A return value of False means that the list couldn't be validated in
+    bulk. It may still be valid (e.g. if it contains numpy scalars), so
+    callers should fall back to validating the elements one at a time.
+
+    Parameters
+    ----------
+    v : list or tuple
+        Value to check
+    number_types : frozenset of type
+        The accepted element types
+    min_val : number or None
+    max_val : number or None
+        The interval bounds, or None if the elements aren't restricted to
+        an interval
+
+    Returns
+    -------
+    bool
+    """
+    if not number_types.issuperset(map(type, v)):
+        return False
+
+    if min_val is None and max_val is None:
+        return True
+
+    np = get_module("numpy", should_load=False)
+    if not np:
+        return False
+
+    v_array = np.asarray(v)
+    if v_array.dtype.kind not in ("b", "i", "u", "f"):
+        # e.g. integers that don't fit in 64 bits
+        return False
+
+    return bool(np.all((min_val <= v_array) & (v_array <= max_val)))
+
+
+def factorize_array(v):
+    """
+    Split a one-dimensional homogeneous array into its unique values and
+    the position of each element's value in the unique values.
+
+    Array elements are often drawn from a small set of values, so this lets
+    validators validate each unique value only once. The categories and
+    codes of pandas categorical Series and Index objects are used directly.
+
+    Parameters
+    ----------
+    v : array like
+        Homogeneous array (numpy array, pandas Series, etc.)
+
+    Returns
+    -------
+    tuple or None
+        (uniques, codes) tuple, where uniques is an array of the unique
+        values and codes is an integer array such that uniques[codes] is
+        equivalent to v. None if v is not one-dimensional or can't be
+        factorized (e.g. because it contains unhashable or missing values)
+    """
+    np = get_module("numpy")
+    pd = get_module("pandas", should_load=False)
+
+    if pd and isinstance(v, (pd.Series, pd.Index)) and v.dtype.name == "category":
+        categorical = v.cat if isinstance(v, pd.Series) else v
+        uniques = np.asarray(categorical.categories)
+        codes = np.asarray(categorical.codes)
+    else:
+        v = np.asarray(v)
+        if v.ndim != 1:
+            return None
+
+        try:
+            if pd and v.dtype.kind in "OUS":
+                # Hash-based factorization, faster than sorting strings
+                codes, uniques = pd.factorize(v)
+            else:
+                uniques, codes = np.unique(v, return_inverse=True)
+                codes = codes.ravel()
+        except TypeError:
+            # Unhashable or unorderable elements
+            return None
+
+    if (codes < 0).any():
+        # Missing values
+        return None
+
+    return uniques, codes
+
+
+def unique_values(v):
+    """
+    Return the unique values of a one-dimensional array
+
+    Parameters
+    ----------
+    v : array like
+        List, tuple, or homogeneous array
+
+    Returns
+    -------
+    sequence or None
+        The unique values of v, or None if they can't be determined (e.g.
+        because v contains unhashable values)
+    """
+    if is_homogeneous_array(v):
+        factorized = factorize_array(v)
+        return factorized[0] if factorized is not None else None
+
+    try:
+        return set(v)
+    except TypeError:
+        return None
+
+
 def type_str(v):
     """
     Return a type string of the form module.name for the input value v
@@ -351,6 +580,57 @@ class BaseValidator(object):
         else:
             return v
 
+    @staticmethod
+    def coerce_unvalidated(v):
+        """
+        Convert a list that was stored without validation (e.g. by
+        plotly.io.from_json(..., validate=False)) into a read-only numpy
+        array if it holds rectangular numeric data. None values in numeric
+        data are converted to NaN.
+
+        Parameters
+        ----------
+        v: list
+
+        Returns
+        -------
+        numpy.ndarray or list
+            The converted array, or v itself if numpy is not installed or
+            v doesn't hold numeric data
+        """
+        np = get_module("numpy")
+        if not np:
+            return v
+
+        with warnings.catch_warnings():
+            # Ragged nested lists raise an error or a deprecation warning
+            # depending on the numpy version
+            warnings.simplefilter("ignore")
+            try:
+                new_v = np.array(v)
+            except ValueError:
+                return v
+
+        if new_v.dtype.kind == "O":
+            values = [e for e in new_v.flat if e is not None]
+            is_numeric = bool(values) and all(
+                isinstance(e, numbers.Number) and not isinstance(e, bool)
+                for e in values
+            )
+        else:
+            is_numeric = False
+
+        if is_numeric:
+            # Numbers mixed with None, which is how non-finite numbers are
+            # encoded in JSON
+            new_v = new_v.astype("float64")
+
+        if new_v.dtype.kind not in ["u", "i", "f"]:
+            return v
+
+        new_v.flags["WRITEABLE"] = False
+        return new_v
+
 
 class DataArrayValidator(BaseValidator):
     """
@@ -460,7 +740,14 @@ class EnumeratedValidator(BaseValidator):
         objects don't support deepcopy
         """
         cls = self.__class__
-        return cls(self.plotly_name, self.parent_name, values=self.values)
+        res = cls.__new__(cls)
+        for k, v in self.__dict__.items():
+            if k in ("val_regexs", "regex_replacements"):
+                # Compiled regex objects are immutable and can be shared
+                res.__dict__[k] = list(v)
+            else:
+                res.__dict__[k] = deepcopy(v, memodict)
+        return res
 
     @staticmethod
     def build_regex_replacement(regex_str):
@@ -580,11 +867,18 @@ class EnumeratedValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
-            v_replaced = [self.perform_replacemenet(v_el) for v_el in v]
+            # Validate each unique value once. If any of them is invalid,
+            # or v can't be factorized, check every element so the invalid
+            # elements can be reported
+            uniques = unique_values(v)
+            if uniques is None or not all(
+                self.in_values(self.perform_replacemenet(e)) for e in uniques
+            ):
+                v_replaced = [self.perform_replacemenet(v_el) for v_el in v]
 
-            invalid_els = [e for e in v_replaced if (not self.in_values(e))]
-            if invalid_els:
-                self.raise_invalid_elements(invalid_els[:10])
+                invalid_els = [e for e in v_replaced if (not self.in_values(e))]
+                if invalid_els:
+                    self.raise_invalid_elements(invalid_els[:10])
 
             if is_homogeneous_array(v):
                 v = copy_to_readonly_numpy_array(v)
@@ -764,20 +1058,34 @@ class NumberValidator(BaseValidator):
 
             v = v_array  # Always numeric numpy array
         elif self.array_ok and is_simple_array(v):
-            # Check numeric
-            invalid_els = [e for e in v if not isinstance(e, numbers.Number)]
-
-            if invalid_els:
-                self.raise_invalid_elements(invalid_els[:10])
-
-            # Check min/max
             if self.has_min_max:
-                invalid_els = [e for e in v if not (self.min_val <= e <= self.max_val)]
+                valid = is_number_list_in_range(
+                    v, _native_number_types, self.min_val, self.max_val
+                )
+            else:
+                valid = is_number_list_in_range(v, _native_number_types)
+
+            if valid:
+                # All elements are native numbers, so there's nothing to
+                # convert
+                v = list(v)
+            else:
+                # Check numeric
+                invalid_els = [e for e in v if not isinstance(e, numbers.Number)]
 
                 if invalid_els:
                     self.raise_invalid_elements(invalid_els[:10])
 
-            v = to_scalar_or_list(v)
+                # Check min/max
+                if self.has_min_max:
+                    invalid_els = [
+                        e for e in v if not (self.min_val <= e <= self.max_val)
+                    ]
+
+                    if invalid_els:
+                        self.raise_invalid_elements(invalid_els[:10])
+
+                v = to_scalar_or_list(v)
         else:
             # Check numeric
             if not isinstance(v, numbers.Number):
@@ -893,20 +1201,34 @@ class IntegerValidator(BaseValidator):
 
             v = v_array
         elif self.array_ok and is_simple_array(v):
-            # Check integer type
-            invalid_els = [e for e in v if not isinstance(e, int)]
-
-            if invalid_els:
-                self.raise_invalid_elements(invalid_els[:10])
-
-            # Check min/max
             if self.has_min_max:
-                invalid_els = [e for e in v if not (self.min_val <= e <= self.max_val)]
+                valid = is_number_list_in_range(
+                    v, _native_integer_types, self.min_val, self.max_val
+                )
+            else:
+                valid = is_number_list_in_range(v, _native_integer_types)
+
+            if valid:
+                # All elements are native integers, so there's nothing to
+                # convert
+                v = list(v)
+            else:
+                # Check integer type
+                invalid_els = [e for e in v if not isinstance(e, int)]
 
                 if invalid_els:
                     self.raise_invalid_elements(invalid_els[:10])
 
-            v = to_scalar_or_list(v)
+                # Check min/max
+                if self.has_min_max:
+                    invalid_els = [
+                        e for e in v if not (self.min_val <= e <= self.max_val)
+                    ]
+
+                    if invalid_els:
+                        self.raise_invalid_elements(invalid_els[:10])
+
+                v = to_scalar_or_list(v)
         else:
             # Check int
             if not isinstance(v, int):
@@ -1027,9 +1349,13 @@ class StringValidator(BaseValidator):
 
             # If strict, make sure all elements are strings.
             if self.strict:
-                invalid_els = [e for e in v if not isinstance(e, string_types)]
-                if invalid_els:
-                    self.raise_invalid_elements(invalid_els)
+                uniques = unique_values(v)
+                if uniques is None or not all(
+                    isinstance(e, string_types) for e in uniques
+                ):
+                    invalid_els = [e for e in v if not isinstance(e, string_types)]
+                    if invalid_els:
+                        self.raise_invalid_elements(invalid_els)
 
             if is_homogeneous_array(v):
                 np = get_module("numpy")
@@ -1113,6 +1439,12 @@ class ColorValidator(BaseValidator):
     re_rgb_etc = re.compile(r"(rgb|hsl|hsv)a?\([\d.]+%?(,[\d.]+%?){2,3}\)")
     re_ddk = re.compile(r"var\(\-\-.*\)")
 
+    # Cache from color strings to whether they are valid colors, shared by
+    # all ColorValidator instances. The cache is cleared when it reaches
+    # _color_str_cache_size entries
+    _color_str_cache = {}
+    _color_str_cache_size = 10000
+
     named_colors = [
         "aliceblue",
         "antiquewhite",
@@ -1332,6 +1664,8 @@ class ColorValidator(BaseValidator):
                 # Numbers are allowed and we have an array of numbers.
                 # All good
                 pass
+            elif self._is_str_array(v):
+                v = self.validate_coerce_str_array(v, should_raise=should_raise)
             else:
                 validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
 
@@ -1346,9 +1680,13 @@ class ColorValidator(BaseValidator):
                 else:
                     v = copy_to_readonly_numpy_array(validated_v, kind="U")
         elif self.array_ok and is_simple_array(v):
-            validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
-
-            invalid_els = self.find_invalid_els(v, validated_v)
+            if all(isinstance(e, string_types) for e in v):
+                # Flat list of strings, skip the array checks for each element
+                validated_v = [self.vc_scalar(e) for e in v]
+                invalid_els = [e for e, ve in zip(v, validated_v) if ve is None]
+            else:
+                validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
+                invalid_els = self.find_invalid_els(v, validated_v)
 
             if invalid_els and should_raise:
                 self.raise_invalid_elements(invalid_els)
@@ -1364,6 +1702,67 @@ class ColorValidator(BaseValidator):
 
         return v
 
+    @staticmethod
+    def _is_str_array(v):
+        """
+        Return whether the numpy array v is a non-empty object array
+        containing only strings
+        """
+        if v.dtype.kind != "O" or not v.size:
+            return False
+
+        # Elements may be unhashable (e.g. lists in a ragged object array),
+        # so type check the elements rather than their unique values
+        return all(isinstance(e, string_types) for e in v.flat)
+
+    def validate_coerce_str_array(self, v, should_raise=True):
+        """
+        Validate an object array of strings, validating each unique string
+        only once.
+
+        The result is identical to validating each element separately.
+
+        Parameters
+        ----------
+        v : np.ndarray
+            Object array containing only strings
+        should_raise : bool
+            Whether to raise a ValueError if any element is invalid
+
+        Returns
+        -------
+        np.ndarray
+            Read-only array with the dtype kind 'U', or 'O' if numbers are
+            allowed or there are invalid elements (which are replaced with
+            None)
+        """
+        np = get_module("numpy")
+
+        # Find unique values
+        # ------------------
+        flat = v.ravel()
+        uniques, codes = factorize_array(flat)
+
+        # Validate unique values and broadcast back
+        # -----------------------------------------
+        unique_valid = np.array([self.vc_scalar(e) is not None for e in uniques])
+        invalid = ~unique_valid[codes]
+
+        if invalid.any():
+            if should_raise:
+                self.raise_invalid_elements(flat[invalid].tolist())
+
+            validated_v = flat.copy()
+            validated_v[invalid] = None
+        elif self.numbers_allowed():
+            validated_v = flat.copy()
+        else:
+            validated_v = flat.astype("U")
+
+        validated_v = validated_v.reshape(v.shape)
+        validated_v.flags["WRITEABLE"] = False
+        return validated_v
+
     def find_invalid_els(self, orig, validated, invalid_els=None):
         """
         Helper method to find invalid elements in orig array.
@@ -1416,29 +1815,46 @@ class ColorValidator(BaseValidator):
             # If not allow_numbers then value must be a string
             return None
         else:
-            # Remove spaces so regexes don't need to bother with them.
-            v_normalized = v.replace(" ", "").lower()
+            # Look up previously validated strings
+            cache = ColorValidator._color_str_cache
+            is_valid = cache.get(v)
+            if is_valid is None:
+                is_valid = ColorValidator._is_valid_color_str(v)
 
-            # if ColorValidator.re_hex.fullmatch(v_normalized):
-            if fullmatch(ColorValidator.re_hex, v_normalized):
-                # valid hex color (e.g. #f34ab3)
-                return v
-            elif fullmatch(ColorValidator.re_rgb_etc, v_normalized):
-                # elif ColorValidator.re_rgb_etc.fullmatch(v_normalized):
-                # Valid rgb(a), hsl(a), hsv(a) color
-                # (e.g. rgba(10, 234, 200, 50%)
-                return v
-            elif fullmatch(ColorValidator.re_ddk, v_normalized):
-                # Valid var(--*) DDK theme variable, inspired by CSS syntax
-                # (e.g. var(--accent) )
-                # DDK will crawl & eval var(-- colors for Graph theming
-                return v
-            elif v_normalized in ColorValidator.named_colors:
-                # Valid named color (e.g. 'coral')
-                return v
-            else:
-                # Not a valid color
-                return None
+                if len(cache) >= ColorValidator._color_str_cache_size:
+                    cache.clear()
+                cache[v] = is_valid
+
+            return v if is_valid else None
+
+    @staticmethod
+    def _is_valid_color_str(v):
+        """
+        Return whether the string v is a valid color
+        """
+        # Remove spaces so regexes don't need to bother with them.
+        v_normalized = v.replace(" ", "").lower()
+
+        # if ColorValidator.re_hex.fullmatch(v_normalized):
+        if fullmatch(ColorValidator.re_hex, v_normalized):
+            # valid hex color (e.g. #f34ab3)
+            return True
+        elif fullmatch(ColorValidator.re_rgb_etc, v_normalized):
+            # elif ColorValidator.re_rgb_etc.fullmatch(v_normalized):
+            # Valid rgb(a), hsl(a), hsv(a) color
+            # (e.g. rgba(10, 234, 200, 50%)
+            return True
+        elif fullmatch(ColorValidator.re_ddk, v_normalized):
+            # Valid var(--*) DDK theme variable, inspired by CSS syntax
+            # (e.g. var(--accent) )
+            # DDK will crawl & eval var(-- colors for Graph theming
+            return True
+        elif v_normalized in ColorValidator.named_colors:
+            # Valid named color (e.g. 'coral')
+            return True
+        else:
+            # Not a valid color
+            return False
 
 
 class ColorlistValidator(BaseValidator):
@@ -1848,6 +2264,24 @@ class FlaglistValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            np = get_module("numpy", should_load=False)
+
+            # Coerce each unique string once for homogeneous arrays
+            factorized = factorize_array(v) if is_homogeneous_array(v) else None
+            if factorized is not None:
+                uniques, codes = factorized
+                validated_uniques = [self.vc_scalar(e) for e in uniques]
+                if None not in validated_uniques:
+                    validated_v = np.array(validated_uniques)[codes]
+                    validated_v.flags["WRITEABLE"] = False
+                    return validated_v
+
+            elif is_simple_array(v):
+                uniques = unique_values(v)
+                if uniques is not None and all(
+                    self.vc_scalar(e) is not None for e in uniques
+                ):
+                    return to_scalar_or_list(v)
 
             # Coerce individual strings
             validated_v = [self.vc_scalar(e) for e in v]
@@ -2614,6 +3048,29 @@ class BaseDataValidator(BaseValidator):
 
         return self._class_map[trace_name]
 
+    @staticmethod
+    def clone_trace(trace):
+        """
+        Return a new orphan trace with a copy of the properties of trace.
+
+        The properties of trace are already validated, so they are copied
+        into the new trace without validating them again. Read-only arrays
+        are shared between the two traces.
+
+        Parameters
+        ----------
+        trace : BaseTraceType
+            Trace to clone
+
+        Returns
+        -------
+        BaseTraceType
+        """
+        clone = trace.__class__()
+        clone._orphan_props.update(copy_sharing_readonly_arrays(trace._props))
+        clone._validate = trace._validate
+        return clone
+
     def validate_coerce(self, v, skip_invalid=False, _validate=True):
         from plotly.basedatatypes import BaseTraceType
 
@@ -2629,14 +3086,32 @@ class BaseDataValidator(BaseValidator):
 
             res = []
             invalid_els = []
+            adopted_ids = set()
             for v_el in v:
 
                 if isinstance(v_el, BaseTraceType):
-                    # Clone input traces
-                    v_el = v_el.to_plotly_json()
+                    if not v_el._validate:
+                        # The properties of traces that were constructed
+                        # without validation (e.g. in a trusted() context)
+                        # are validated like those of a dict
+                        v_el = v_el.to_plotly_json()
+                    elif v_el._parent is None and id(v_el) not in adopted_ids:
+                        # Take ownership of orphan traces. Their properties
+                        # were validated when they were constructed, so
+                        # they don't need to be validated or copied again
+                        adopted_ids.add(id(v_el))
+                        res.append(v_el)
+                        continue
+                    else:
+                        # Clone traces that already belong to a figure (or
+                        # that appear more than once in v)
+                        res.append(self.clone_trace(v_el))
+                        continue
 
                 if isinstance(v_el, dict):
-                    v_copy = deepcopy(v_el)
+                    # Validated arrays are read-only, so they are shared
+                    # rather than copied
+                    v_copy = copy_sharing_readonly_arrays(v_el)
 
                     if "type" in v_copy:
                         trace_type = v_copy.pop("type")
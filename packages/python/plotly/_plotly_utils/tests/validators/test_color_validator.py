@@ -234,6 +234,70 @@ def test_rejection_aok_colorscale(val, validator_aok_colorscale):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+# Arrays of repeated strings
+# --------------------------
+# Unique values are validated once and broadcast back
+@pytest.mark.parametrize("use_pandas", [True, False])
+def test_str_array_unique_values(validator_aok, use_pandas, monkeypatch):
+    if not use_pandas:
+        import _plotly_utils.basevalidators as basevalidators
+
+        get_module = basevalidators.get_module
+        monkeypatch.setattr(
+            basevalidators,
+            "get_module",
+            lambda name, **kwargs: None
+            if name == "pandas"
+            else get_module(name, **kwargs),
+        )
+
+    val = np.array(["red", "rgb(255, 0, 0)", "red", "#abc"] * 3, dtype="object")
+    coerce_val = validator_aok.validate_coerce(val.reshape(3, 4))
+    assert coerce_val.dtype == np.dtype("<U14")
+    assert coerce_val.shape == (3, 4)
+    assert not coerce_val.flags.writeable
+    assert np.array_equal(coerce_val.ravel(), val)
+
+    val[5] = "redd"
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+    assert "Invalid elements include: ['redd']" in str(validation_failure.value)
+
+    coerce_val = validator_aok.validate_coerce(val, should_raise=False)
+    assert coerce_val.dtype == np.dtype("object")
+    assert coerce_val[5] is None
+    assert list(coerce_val[:5]) == list(val[:5])
+
+
+def test_str_array_numbers_allowed(validator_aok_colorscale):
+    val = np.array(["red", "blue", "red"], dtype="object")
+    coerce_val = validator_aok_colorscale.validate_coerce(val)
+    assert coerce_val.dtype == np.dtype("object")
+    assert list(coerce_val) == ["red", "blue", "red"]
+
+
+def test_color_str_cache(validator):
+    cache = ColorValidator._color_str_cache
+    cache_size = ColorValidator._color_str_cache_size
+    try:
+        ColorValidator._color_str_cache_size = 2
+        cache.clear()
+
+        assert validator.validate_coerce("red") == "red"
+        assert cache == {"red": True}
+
+        with pytest.raises(ValueError):
+            validator.validate_coerce("redd")
+        assert cache == {"red": True, "redd": False}
+
+        # The cache is cleared when it's full
+        validator.validate_coerce("blue")
+        assert cache == {"blue": True}
+    finally:
+        ColorValidator._color_str_cache_size = cache_size
+        cache.clear()
+
+
 # Description
 # -----------
 # Test dynamic description logic
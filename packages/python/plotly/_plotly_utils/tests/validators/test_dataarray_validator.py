@@ -48,3 +48,82 @@ def test_rejection(val, validator):
         validator.validate_coerce(val)
 
     assert "Invalid value" in str(validation_failure.value)
+
+
+# ### Unvalidated values ###
+@pytest.mark.parametrize(
+    "val,expected",
+    [
+        ([1, 2, 3], np.array([1, 2, 3])),
+        ([1.5, None, 2], np.array([1.5, np.nan, 2])),
+        ([[1, 2], [3, 4]], np.array([[1, 2], [3, 4]])),
+    ],
+)
+def test_coerce_unvalidated_numeric(val, expected, validator):
+    coerce_val = validator.coerce_unvalidated(val)
+    assert isinstance(coerce_val, np.ndarray)
+    assert not coerce_val.flags.writeable
+    np.testing.assert_array_equal(coerce_val, expected)
+
+
+@pytest.mark.parametrize(
+    "val", [["a", "b"], [1, "a"], [True, False], [None, None], [[1, 2], [3]]]
+)
+def test_coerce_unvalidated_non_numeric(val, validator):
+    assert validator.coerce_unvalidated(val) is val
+
+
+# ### Borrowing arrays ###
+@pytest.fixture()
+def borrow_policy():
+    from _plotly_utils.basevalidators import array_config
+
+    array_config.copy_policy = "borrow"
+    yield
+    array_config.reset()
+
+
+def test_copy_policy_default(validator):
+    val = np.arange(5.0)
+    coerce_val = validator.validate_coerce(val)
+    assert not np.shares_memory(coerce_val, val)
+    assert not coerce_val.flags.writeable
+
+
+def test_copy_policy_borrow(validator, borrow_policy):
+    val = np.arange(5.0, dtype="float32")
+    coerce_val = validator.validate_coerce(val)
+
+    # A read-only view of the input is stored, the input stays writeable
+    assert np.shares_memory(coerce_val, val)
+    assert coerce_val.dtype == np.dtype("float32")
+    assert not coerce_val.flags.writeable
+    assert val.flags.writeable
+
+
+def test_copy_policy_borrow_memmap(validator, borrow_policy, tmp_path):
+    val = np.memmap(str(tmp_path / "data.bin"), dtype="float32", mode="w+", shape=5)
+    coerce_val = validator.validate_coerce(val)
+    assert type(coerce_val) is np.ndarray
+    assert np.shares_memory(coerce_val, val)
+
+
+@pytest.mark.parametrize(
+    "val",
+    [
+        np.arange(10.0)[::2],
+        np.ma.masked_array([1.0, 2.0], mask=[0, 1]),
+        np.asfortranarray(np.ones((2, 3))),
+    ],
+)
+def test_copy_policy_borrow_copies_incompatible(val, validator, borrow_policy):
+    coerce_val = validator.validate_coerce(val)
+    assert not np.shares_memory(coerce_val, val)
+
+
+def test_invalid_copy_policy():
+    from _plotly_utils.basevalidators import array_config
+
+    with pytest.raises(ValueError):
+        array_config.copy_policy = "bogus"
+    assert array_config.copy_policy == "copy"
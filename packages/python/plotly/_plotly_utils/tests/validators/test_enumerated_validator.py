@@ -1,3 +1,4 @@
+import copy
 import pytest
 import numpy as np
 import pandas as pd
@@ -149,3 +150,51 @@ def test_rejection_by_element_aok(val, validator_aok_re):
         validator_aok_re.validate_coerce(val)
 
     assert "Invalid element(s)" in str(validation_failure.value)
+
+
+# Array ok, repeated values
+# -------------------------
+# Each unique value is validated once
+@pytest.mark.parametrize(
+    "val",
+    [
+        ["first", 4, "second"] * 10,
+        np.array(["first", "third", "first"] * 10),
+        pd.Series(["first", "second"] * 10, dtype="category"),
+        pd.Index(["first", "second"] * 10, dtype="category"),
+    ],
+)
+def test_acceptance_aok_repeated(val, validator_aok):
+    coerce_val = validator_aok.validate_coerce(val)
+    if isinstance(val, list):
+        assert coerce_val == val
+    else:
+        assert np.array_equal(coerce_val, np.asarray(val))
+
+
+@pytest.mark.parametrize(
+    "val",
+    [
+        ["first", "fourth", "second"] * 10,
+        np.array(["first", "fourth"] * 10),
+        pd.Series(["first", "fourth"] * 10, dtype="category"),
+        ["first", None] * 10,
+        ["first", ["second"]],
+    ],
+)
+def test_rejection_aok_repeated(val, validator_aok):
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid element(s)" in str(validation_failure.value)
+
+
+# Deep copy
+# ---------
+def test_deepcopy(validator_aok_re):
+    validator_copy = copy.deepcopy(validator_aok_re)
+
+    assert validator_copy.array_ok
+    assert validator_copy.values == validator_aok_re.values
+    assert validator_copy.values is not validator_aok_re.values
+    assert list(validator_copy.validate_coerce(["foo", "bar12"])) == ["foo", "bar12"]
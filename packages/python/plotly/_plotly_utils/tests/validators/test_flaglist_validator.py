@@ -209,3 +209,21 @@ def test_rejection_aok_element_val(val, validator_extra_aok):
         validator_extra_aok.validate_coerce(val)
 
     assert "Invalid element(s)" in str(validation_failure.value)
+
+
+# ### Repeated values ###
+# Each unique value is coerced once
+def test_coercion_aok_repeated(validator_extra_aok):
+    val = np.array(["lines", "lines + markers", "all"] * 10)
+    coerce_val = validator_extra_aok.validate_coerce(val)
+    assert coerce_val.dtype == np.dtype("<U13")
+    assert not coerce_val.flags.writeable
+    assert list(coerce_val) == ["lines", "lines+markers", "all"] * 10
+
+
+def test_rejection_aok_repeated(validator_extra_aok):
+    val = np.array(["lines", "lines+all"] * 10)
+    with pytest.raises(ValueError) as validation_failure:
+        validator_extra_aok.validate_coerce(val)
+
+    assert "Invalid element(s)" in str(validation_failure.value)
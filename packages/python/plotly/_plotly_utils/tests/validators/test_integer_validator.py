@@ -136,9 +136,23 @@ def test_coercion_aok_list(val, expected, validator_aok):
         assert validator_aok.present(v) == expected
 
 
+@pytest.mark.parametrize(
+    "val,expected",
+    [
+        # Lists of native integers are validated in bulk and keep their types
+        ([1, True, 0], [1, True, 0]),
+        ((1, 2), [1, 2]),
+    ],
+)
+def test_coercion_aok_list_types(val, expected, validator_aok):
+    v = validator_aok.validate_coerce(val)
+    assert v == expected
+    assert [type(e) for e in v] == [type(e) for e in expected]
+
+
 # ### Rejection ###
 #
-@pytest.mark.parametrize("val", [["a", 4], [[], 3, 4]])
+@pytest.mark.parametrize("val", [["a", 4], [[], 3, 4], [1, 2 ** 70]])
 def test_integer_validator_rejection_aok(val, validator_aok):
     with pytest.raises(ValueError) as validation_failure:
         validator_aok.validate_coerce(val)
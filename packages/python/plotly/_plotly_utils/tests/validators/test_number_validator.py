@@ -129,6 +129,21 @@ def test_coercion_aok_list(val, expected, validator_aok):
         assert validator_aok.present(v) == tuple(val)
 
 
+@pytest.mark.parametrize(
+    "val,expected",
+    [
+        # Lists of native numbers are validated in bulk and keep their types
+        ([1, 0.5, True], [1, 0.5, True]),
+        # Lists with numpy scalars are converted element-wise
+        ([np.float32(0.5), 1, np.int64(0)], [0.5, 1, 0]),
+    ],
+)
+def test_coercion_aok_list_types(val, expected, validator_aok):
+    v = validator_aok.validate_coerce(val)
+    assert v == expected
+    assert [type(e) for e in v] == [type(e) for e in expected]
+
+
 # ### Rejection ###
 #
 @pytest.mark.parametrize("val", [["a", 4]])
@@ -150,3 +165,12 @@ def test_rejection_aok_min_max(val, validator_aok):
 
     assert "Invalid element(s)" in str(validation_failure.value)
     assert "in the interval [-1, 1.5]" in str(validation_failure.value)
+
+
+def test_rejection_aok_min_max_elements(validator_aok):
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce([0, 2, 1, -3] * 10)
+
+    assert "Invalid elements include: [2, -3, 2, -3, 2, -3, 2, -3, 2, -3]" in str(
+        validation_failure.value
+    )
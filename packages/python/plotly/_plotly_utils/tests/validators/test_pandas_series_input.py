@@ -181,7 +181,36 @@ def test_data_array_validator_dates(data_array_validator, datetime_pandas, dates
     assert isinstance(res, np.ndarray)
 
     # Check dtype
-    assert res.dtype == "object"
+    assert res.dtype == "datetime64[ns]"
 
     # Check values
-    np.testing.assert_array_equal(res, dates_array)
+    np.testing.assert_array_equal(res, dates_array.astype("datetime64[ns]"))
+
+
+def test_data_array_validator_tz_aware_dates(data_array_validator, pandas_type):
+    v = pandas_type(pd.date_range("2020-01-01", periods=3, tz="Europe/Paris"))
+
+    res = data_array_validator.validate_coerce(v)
+
+    # Timezone-aware dates are stored as datetime objects, which keep their
+    # UTC offset
+    assert res.dtype == "object"
+    assert [d.isoformat() for d in res] == [
+        "2020-01-01T00:00:00+01:00",
+        "2020-01-02T00:00:00+01:00",
+        "2020-01-03T00:00:00+01:00",
+    ]
+
+
+def test_factorize_categorical(pandas_type):
+    from _plotly_utils.basevalidators import factorize_array
+
+    v = pandas_type(pd.Categorical(["b", "a", "b", "c"], categories=["c", "b", "a"]))
+    uniques, codes = factorize_array(v)
+
+    # The categories and codes are used directly
+    assert list(uniques) == ["c", "b", "a"]
+    assert list(uniques[codes]) == ["b", "a", "b", "c"]
+
+    # Missing values can't be factorized
+    assert factorize_array(pandas_type(pd.Categorical(["a", None]))) is None
@@ -9,6 +9,9 @@ from _plotly_utils.basevalidators import ImageUriValidator
 
 PY36_OR_LATER = sys.version_info >= (3, 6)
 
+# Whitespace characters that are allowed around JSON separators
+_JSON_WHITESPACE = " \t\n\r"
+
 
 class PlotlyJSONEncoder(_json.JSONEncoder):
     """
@@ -35,7 +38,8 @@ class PlotlyJSONEncoder(_json.JSONEncoder):
 
     def encode(self, o):
         """
-        Load and then dump the result using parse_constant kwarg
+        Encode in a single pass when the result is already strict JSON.
+        Otherwise, load and then dump the result using parse_constant kwarg
 
         Note that setting invalid separators will cause a failure at this step.
 
@@ -44,6 +48,22 @@ class PlotlyJSONEncoder(_json.JSONEncoder):
         # this will raise errors in a normal-expected way
         encoded_o = super(PlotlyJSONEncoder, self).encode(o)
 
+        # In the common case the encoded string contains none of the 'NaN',
+        # 'Infinity' and '-Infinity' extended JSON constants (non-finite
+        # values in numpy arrays are converted to None by encode_as_numpy).
+        # The string is then already strict JSON, and the round trip below
+        # would return it unchanged, so we return it as-is. This doesn't hold
+        # if the output isn't ASCII (the round trip escapes non-ASCII
+        # characters) or if the separators aren't valid JSON.
+        if (
+            self.ensure_ascii
+            and self.item_separator.strip(_JSON_WHITESPACE) == ","
+            and self.key_separator.strip(_JSON_WHITESPACE) == ":"
+            and "NaN" not in encoded_o
+            and "Infinity" not in encoded_o
+        ):
+            return encoded_o
+
         # now:
         #    1. `loads` to switch Infinity, -Infinity, NaN to None
         #    2. `dumps` again so you get 'null' instead of extended JSON
@@ -158,13 +178,40 @@ class PlotlyJSONEncoder(_json.JSONEncoder):
 
     @staticmethod
     def encode_as_numpy(obj):
-        """Attempt to convert numpy.ma.core.masked"""
+        """
+        Attempt to convert numpy.ma.core.masked, numpy float arrays and
+        numpy datetime64 arrays.
+
+        Non-finite values (NaN, Inf, -Inf) in float arrays are converted to
+        None in a single vectorized step, so that they are encoded as null.
+        datetime64 arrays are converted to date strings in a single
+        vectorized step as well (see datetime64_array_to_list).
+        """
         numpy = get_module("numpy", should_load=False)
         if not numpy:
             raise NotEncodable
 
         if obj is numpy.ma.core.masked:
             return float("nan")
+        elif (
+            isinstance(obj, numpy.ndarray)
+            and not isinstance(obj, numpy.ma.MaskedArray)
+            and obj.dtype.kind == "f"
+            and obj.dtype.itemsize <= 8
+        ):
+            finite = numpy.isfinite(obj)
+            if finite.all():
+                return obj.tolist()
+            else:
+                obj = obj.astype("object")
+                obj[~finite] = None
+                return obj.tolist()
+        elif (
+            isinstance(obj, numpy.ndarray)
+            and not isinstance(obj, numpy.ma.MaskedArray)
+            and obj.dtype.kind == "M"
+        ):
+            return datetime64_array_to_list(obj)
         else:
             raise NotEncodable
 
@@ -225,6 +272,47 @@ def iso_to_plotly_time_string(iso_string):
         return iso_string.replace("T", " ")
 
 
+def datetime64_array_to_list(v):
+    """
+    Convert a numpy datetime64 array into a (possibly nested) list of ISO
+    date strings, with NaT values converted to None
+
+    The strings match the isoformat output of the datetime.date and
+    datetime.datetime objects that the tolist method of the array would
+    return. Arrays with a unit of a day or coarser are converted to dates,
+    and arrays with a finer unit are converted to datetimes that only
+    include microseconds when they are non-zero.
+
+    Parameters
+    ----------
+    v : np.ndarray
+        Array with a datetime64 dtype
+
+    Returns
+    -------
+    list
+    """
+    np = get_module("numpy")
+
+    unit = np.datetime_data(v.dtype)[0]
+    if unit in ("Y", "M", "W", "D", "generic"):
+        strs = np.datetime_as_string(v, unit="D")
+    else:
+        strs = np.datetime_as_string(v, unit="s")
+        if unit not in ("h", "m", "s"):
+            v_us = v.astype("datetime64[us]")
+            has_us = v_us != v_us.astype("datetime64[s]")
+            if has_us.any():
+                strs = np.where(has_us, np.datetime_as_string(v_us, unit="us"), strs)
+
+    is_nat = np.isnat(v)
+    if is_nat.any():
+        strs = strs.astype("object")
+        strs[is_nat] = None
+
+    return strs.tolist()
+
+
 def template_doc(**names):
     def _decorator(func):
         if not sys.version_info[:2] == (3, 2):
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 import os.path as opath
@@ -23,6 +24,8 @@ from codegen.utils import (
 from codegen.validators import (
     write_validator_py,
     write_data_validator_py,
+    write_validator_specs,
+    write_schema_hash_py,
     get_data_validator_instance,
 )
 
@@ -116,8 +119,11 @@ def perform_codegen():
         packages_py, "plotly", "codegen", "resources", "plot-schema.json"
     )
 
-    with open(plot_schema_path, "r") as f:
-        plotly_schema = json.load(f)
+    with open(plot_schema_path, "rb") as f:
+        plot_schema_bytes = f.read()
+
+    plotly_schema = json.loads(plot_schema_bytes.decode("utf-8"))
+    schema_hash = hashlib.sha256(plot_schema_bytes).hexdigest()
 
     # Preprocess Schema
     # -----------------
@@ -184,6 +190,10 @@ def perform_codegen():
     # ### Data (traces) validator ###
     write_data_validator_py(outdir, base_traces_node)
 
+    # ### Validator specs ###
+    write_schema_hash_py(outdir, schema_hash)
+    write_validator_specs(outdir, all_datatype_nodes, schema_hash)
+
     # Alls
     # ----
     alls = {}
@@ -266,6 +276,9 @@ def perform_codegen():
     for dep_clas in DEPRECATED_DATATYPES:
         root_datatype_imports.append(f"._deprecations.{dep_clas}")
 
+    # ### Add trusted context manager ###
+    root_datatype_imports.append("..basedatatypes.trusted")
+
     optional_figure_widget_import = f"""
 if sys.version_info < (3, 7):
     try:
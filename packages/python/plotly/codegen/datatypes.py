@@ -158,13 +158,23 @@ class {datatype_class}(_{node.name_base_datatype}):\n"""
     valid_props_list = sorted(
         [node.name_property for node in subtype_nodes + literal_nodes]
     )
+    if datatype_class == "Layout":
+        # Layout instances hold their own _valid_props set (see constructor)
+        valid_props_str = ""
+        slots_str = '("_valid_props",)'
+    else:
+        valid_props_str = f"""
+    _valid_props = {{"{'", "'.join(valid_props_list)}"}}"""
+        slots_str = "()"
+
     buffer.write(
         f"""
     # class properties
     # --------------------
     _parent_path_str = '{node.parent_path_str}'
-    _path_str = '{node.path_str}'
-    _valid_props = {{"{'", "'.join(valid_props_list)}"}}
+    _path_str = '{node.path_str}'{valid_props_str}
+    _validator_table = {{}}
+    __slots__ = {slots_str}
 """
     )
 
@@ -314,22 +324,26 @@ class {datatype_class}(_{node.name_base_datatype}):\n"""
     buffer.write(
         f"""
         super({datatype_class}, self).__init__('{node.name_property}')
-
-        if '_parent' in kwargs:
-            self._parent = kwargs['_parent']
-            return
 """
     )
 
     if datatype_class == "Layout":
         buffer.write(
             f"""
-        # Override _valid_props for instance so that instance can mutate set
-        # to support subplot properties (e.g. xaxis2)
+        # Initialize _valid_props for instance so that instance can mutate
+        # set to support subplot properties (e.g. xaxis2)
         self._valid_props = {{"{'", "'.join(valid_props_list)}"}}
 """
         )
 
+    buffer.write(
+        f"""
+        if '_parent' in kwargs:
+            self._parent = kwargs['_parent']
+            return
+"""
+    )
+
     buffer.write(
         f"""
         # Validate arg
@@ -349,7 +363,8 @@ an instance of :class:`{class_name}`\"\"\")
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop('skip_invalid', False)
-        self._validate = kwargs.pop('_validate', True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop('_validate', True) and self._validate
         """
     )
 
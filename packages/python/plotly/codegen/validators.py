@@ -1,9 +1,15 @@
+import os
 import os.path as opath
+import pickle
 from io import StringIO
 
 import _plotly_utils.basevalidators
 from codegen.utils import PlotlyNode, TraceNode, write_source_py
 
+# Version of the validator specs format. Must match
+# plotly.validator_cache.ValidatorCache._specs_version
+VALIDATOR_SPECS_VERSION = 1
+
 
 def build_validator_py(node: PlotlyNode):
     """
@@ -265,3 +271,116 @@ def write_data_validator_py(outdir, base_trace_node: TraceNode):
     # filepath = opath.join(outdir, "validators", "__init__.py")
     filepath = opath.join(outdir, "validators", "_data.py")
     write_source_py(source, filepath, leading_newlines=2)
+
+
+def build_validator_specs(nodes):
+    """
+    Build the validator specs that plotly.validator_cache.ValidatorCache
+    uses to construct validators without importing the validator modules
+
+    Parameters
+    ----------
+    nodes : list of PlotlyNode
+        The datatype nodes for which validators are written
+
+    Returns
+    -------
+    dict
+        Dict from parent path strings (e.g. 'scatter.marker') to dicts from
+        property names to (validator class name, params) tuples. The class
+        names are names of _plotly_utils.basevalidators classes and the
+        params are the evaluated constructor params, without plotly_name.
+    """
+    specs = {}
+    for node in nodes:
+        if node.is_mapped or node.datatype == "literal":
+            # No validator is written for mapped nodes, and literal (type)
+            # validators are constructed by ValidatorCache directly
+            continue
+
+        validator_parts = node.name_base_validator.split(".")
+        if validator_parts[:-1] != ["_plotly_utils", "basevalidators"]:
+            continue
+
+        # Evaluate validator params to convert repr strings into values
+        # e.g. '2' -> 2
+        params = {
+            prop: eval(repr_val)
+            for prop, repr_val in node.get_validator_params().items()
+            if prop != "plotly_name"
+        }
+
+        specs.setdefault(node.parent_path_str, {})[node.name_property] = (
+            validator_parts[-1],
+            params,
+        )
+
+    return specs
+
+
+def write_schema_hash_py(outdir, schema_hash):
+    """
+    Write the hash of the plot schema that the validators are generated from
+    to plotly/validators/_schema_hash.py
+
+    ValidatorCache compares it to the hash stored in the validator specs
+    file, so that specs built from a different schema are not used.
+
+    Parameters
+    ----------
+    outdir : str
+        Root outdir in which the validators package should reside
+    schema_hash : str
+        Hex digest of the plot-schema.json file
+
+    Returns
+    -------
+    None
+    """
+    filepath = opath.join(outdir, "validators", "_schema_hash.py")
+    os.makedirs(opath.dirname(filepath), exist_ok=True)
+    with open(filepath, "wt") as f:
+        f.write(
+            f"""\
+# DO NOT EDIT
+# This file is generated by codegen
+__schema_hash__ = "{schema_hash}"
+"""
+        )
+
+
+def write_validator_specs(outdir, nodes, schema_hash):
+    """
+    Build the validator specs and write them to
+    plotly/package_data/validators.pickle
+
+    The specs of each parent path are pickled separately, so that
+    ValidatorCache only needs to unpickle the specs of the objects that are
+    used.
+
+    Parameters
+    ----------
+    outdir : str
+        Root outdir in which the package_data directory resides
+    nodes : list of PlotlyNode
+        The datatype nodes for which validators are written
+    schema_hash : str
+        Hex digest of the plot-schema.json file the nodes were built from
+    Returns
+    -------
+    None
+    """
+    specs = build_validator_specs(nodes)
+    blob = {
+        "version": VALIDATOR_SPECS_VERSION,
+        "schema_hash": schema_hash,
+        "specs": {
+            parent_path: pickle.dumps(path_specs, protocol=2)
+            for parent_path, path_specs in specs.items()
+        },
+    }
+
+    filepath = opath.join(outdir, "package_data", "validators.pickle")
+    os.makedirs(opath.dirname(filepath), exist_ok=True)
+    with open(filepath, "wb") as f:
+        pickle.dump(blob, f, protocol=2)
@@ -2,15 +2,21 @@ from __future__ import absolute_import
 
 import collections
 from collections import OrderedDict
+import hashlib
+import numbers
 import re
 import six
+import struct
 from six import string_types
+import threading
 import warnings
+import weakref
 from contextlib import contextmanager
 from copy import deepcopy, copy
 
 from _plotly_utils.utils import _natural_sort_strings, _get_int_type
 from .optional_imports import get_module
+from .validator_cache import ValidatorCache
 
 # Create Undefined sentinel value
 #   - Setting a property to None removes any existing value
@@ -18,6 +24,381 @@ from .optional_imports import get_module
 Undefined = object()
 
 
+class _ReadOnlyDict(dict):
+    """
+    dict subclass that raises a TypeError on any attempt to modify it.
+
+    Used to build the read-only views of a figure's properties that are
+    returned by `BaseFigure.to_dict(copy=False)`. Copies of a _ReadOnlyDict
+    are regular (mutable) dicts.
+    """
+
+    def _raise_read_only(self, *args, **kwargs):
+        raise TypeError(
+            "This figure dictionary is a read-only view.\n"
+            "Use Figure.to_dict() to get a copy that can be modified."
+        )
+
+    __setitem__ = _raise_read_only
+    __delitem__ = _raise_read_only
+    __ior__ = _raise_read_only
+    clear = _raise_read_only
+    pop = _raise_read_only
+    popitem = _raise_read_only
+    setdefault = _raise_read_only
+    update = _raise_read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memodict={}):
+        return {k: deepcopy(v, memodict) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+def _to_read_only(v):
+    """
+    Build a read-only view of a nested properties structure without copying
+    numpy array data. dicts become _ReadOnlyDict instances and writeable numpy
+    arrays are replaced by read-only views of the same buffer. Lists are
+    copied into tuples, because the JSON encoders and validators that consume
+    the view only accept built-in sequence types, so data arrays stored as
+    lists are not zero-copy. All other values are shared as-is.
+    """
+    if isinstance(v, dict):
+        return _ReadOnlyDict([(k, _to_read_only(e)) for k, e in v.items()])
+    elif isinstance(v, (list, tuple)):
+        return tuple([_to_read_only(e) for e in v])
+
+    np = get_module("numpy", should_load=False)
+    if np is not None and isinstance(v, np.ndarray) and v.flags.writeable:
+        v = v.view()
+        v.flags.writeable = False
+    return v
+
+
+# Largest magnitude up to which every integer is exactly representable as a
+# double precision float
+_max_exact_float_int = 2 ** 53
+
+
+def _content_digest(v):
+    """
+    Compute the digest of a figure property value (e.g. the properties dict
+    of a trace) for use in BaseFigure.content_hash.
+
+    Values that compare equal produce the same digest. In particular, lists
+    and tuples are interchangeable, numbers are compared by value regardless
+    of their type, and numeric lists hash the same as the equivalent numpy
+    arrays. NaN values are considered equal to each other.
+
+    Returns
+    -------
+    bytes
+    """
+    h = hashlib.sha1()
+    np = get_module("numpy")
+    _update_content_digest(h, v, np)
+    return h.digest()
+
+
+def _update_content_digest(h, v, np):
+    """
+    Feed a canonical encoding of value v into the hashlib object h
+    """
+    if isinstance(v, dict):
+        h.update(b"{")
+        for k in sorted(v, key=str):
+            _update_content_digest(h, k, np)
+            _update_content_digest(h, v[k], np)
+        h.update(b"}")
+        return
+
+    if np is not None:
+        if isinstance(v, (list, tuple)) and v and _is_array_like_head(v[0], np):
+            # Numeric (possibly nested) lists are hashed as numpy arrays, so
+            # they match the corresponding arrays
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                try:
+                    arr = np.asarray(v)
+                except ValueError:
+                    # Ragged nested lists
+                    arr = None
+            if arr is not None and _update_content_digest_array(h, arr, np):
+                return
+
+        elif isinstance(v, np.ndarray):
+            if _update_content_digest_array(h, v, np):
+                return
+            v = v.tolist()
+
+        elif isinstance(v, np.generic):
+            v = v.item()
+
+    if isinstance(v, (list, tuple)):
+        h.update(("[%d:" % len(v)).encode("ascii"))
+        for e in v:
+            _update_content_digest(h, e, np)
+        h.update(b"]")
+    elif isinstance(v, string_types):
+        if isinstance(v, six.text_type):
+            v = v.encode("utf-8")
+        h.update(("s%d:" % len(v)).encode("ascii"))
+        h.update(v)
+    elif v is None:
+        h.update(b"n")
+    elif isinstance(v, numbers.Real):
+        h.update(_content_digest_number(v))
+    else:
+        r = repr(v)
+        if isinstance(r, six.text_type):
+            r = r.encode("utf-8")
+        h.update(("o%d:" % len(r)).encode("ascii"))
+        h.update(r)
+
+
+def _is_array_like_head(e, np):
+    return isinstance(e, (numbers.Real, np.generic, list, tuple, np.ndarray))
+
+
+def _content_digest_number(v):
+    """
+    Return the canonical encoding of a real number. Numbers that are exactly
+    representable as doubles are encoded as doubles, so that equal ints,
+    floats and bools have equal encodings.
+    """
+    f = float(v)
+    if f != f:
+        return b"fnan"
+    elif f == v:
+        # Adding 0.0 turns -0.0 into 0.0
+        return b"f" + struct.pack("<d", f + 0.0)
+    else:
+        return ("i%d" % v).encode("ascii")
+
+
+def _update_content_digest_array(h, arr, np):
+    """
+    Feed the canonical encoding of a numeric numpy array into the hashlib
+    object h.
+
+    Numeric arrays are hashed as float64 buffers, and datetime arrays as
+    64-bit integer buffers, which is much faster than hashing their elements
+    one at a time.
+
+    Returns
+    -------
+    bool
+        True if the array was hashed, False if it must be hashed element
+        by element instead
+    """
+    kind = arr.dtype.kind
+    if kind in "Mm":
+        h.update(("t%s%r:" % (arr.dtype.str[1:], arr.shape)).encode("ascii"))
+        h.update(np.ascontiguousarray(arr).view("i8").tobytes())
+        return True
+    elif kind not in "biuf" or arr.dtype.itemsize > 8 or not arr.size:
+        return False
+
+    if kind in "iu":
+        # Larger integers may not be exactly representable as doubles
+        if arr.max() > _max_exact_float_int or arr.min() < -_max_exact_float_int:
+            return False
+
+    # Canonicalize the values as float64, with positive zeros and a single
+    # NaN representation
+    canonical = arr.astype("<f8") + 0.0
+    nans = np.isnan(canonical)
+    if nans.any():
+        canonical[nans] = np.nan
+
+    h.update(("a%r:" % (canonical.shape,)).encode("ascii"))
+    h.update(np.ascontiguousarray(canonical).tobytes())
+    return True
+
+
+def _hashable_subplot_ref(subplot_ref):
+    """
+    Convert a SubplotRef (or None) into a hashable key for the secondary
+    trace indexes of BaseFigure. Subplot refs that compare equal are
+    converted to equal keys.
+    """
+    if isinstance(subplot_ref, dict):
+        return tuple(
+            sorted((k, _hashable_subplot_ref(v)) for k, v in subplot_ref.items())
+        )
+    elif isinstance(subplot_ref, (list, tuple)):
+        return tuple(_hashable_subplot_ref(v) for v in subplot_ref)
+    return subplot_ref
+
+
+class _ArrayBuffer(object):
+    """
+    Growable store for a 1D numeric trace array that is extended by
+    BaseFigure.extend_traces.
+
+    New values are written into spare capacity at the end of a numpy
+    buffer, and the buffer is reallocated with twice the required capacity
+    when it is full. Extending an array of length N by k values therefore
+    costs O(k) amortized time instead of O(N + k). When the number of
+    points is limited, the buffer holds a rolling window of the most recent
+    values, and the window is only copied into a new buffer once the spare
+    capacity is used up.
+
+    The property value is a read-only view of the occupied part of the
+    buffer. Values are never overwritten once they are part of a view, so
+    views that were returned previously remain unchanged.
+    """
+
+    __slots__ = ("buffer", "start", "stop", "view")
+
+    # Minimum number of elements to allocate
+    _min_capacity = 16
+
+    def __init__(self, np, values, max_points=None):
+        self.buffer = None
+        self.start = 0
+        self.stop = 0
+        self.view = None
+        self._reallocate(np, values[:0], values, max_points)
+
+    @staticmethod
+    def supports(np, v):
+        """
+        True if v is an array that can be stored in an _ArrayBuffer
+        """
+        return isinstance(v, np.ndarray) and v.ndim == 1 and v.dtype.kind in "biufM"
+
+    def extend(self, np, values, max_points=None):
+        """
+        Append values to the buffer
+
+        Parameters
+        ----------
+        np
+            The numpy module
+        values : numpy.ndarray
+            1D array of values to append
+        max_points : int or None
+            If not None, only the most recent max_points values are kept
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only view of the extended array
+        """
+        current = self.buffer[self.start : self.stop]
+        dtype = np.result_type(current, values)
+        n = len(values)
+        if (
+            dtype == self.buffer.dtype
+            and self.stop + n <= len(self.buffer)
+            and (max_points is None or n <= max_points)
+        ):
+            self.buffer[self.stop : self.stop + n] = values
+            self.stop += n
+            if max_points is not None:
+                self.start = max(self.start, self.stop - max_points)
+            self._update_view()
+        else:
+            self._reallocate(np, current, values, max_points)
+
+        return self.view
+
+    def _reallocate(self, np, current, values, max_points):
+        # Only keep the values that are part of the new window
+        if max_points is not None:
+            values = values[max(len(values) - max_points, 0) :]
+            current = current[max(len(current) + len(values) - max_points, 0) :]
+
+        size = len(current) + len(values)
+        dtype = np.result_type(current, values)
+        self.buffer = np.empty(max(2 * size, self._min_capacity), dtype=dtype)
+        self.buffer[: len(current)] = current
+        self.buffer[len(current) : size] = values
+        self.start = 0
+        self.stop = size
+        self._update_view()
+
+    def _update_view(self):
+        self.view = self.buffer[self.start : self.stop]
+        self.view.flags.writeable = False
+
+
+# Trusted mode
+# ------------
+# Number of active trusted() contexts, tracked per thread so that figures
+# built concurrently in other threads are still validated
+_trusted_state = threading.local()
+
+
+def _in_trusted_mode():
+    """
+    True if called within a trusted() context in the current thread
+    """
+    return getattr(_trusted_state, "depth", 0) > 0
+
+
+@contextmanager
+def trusted():
+    """
+    A context manager that disables property validation and coercion for
+    every figure and graph object constructed within it.
+
+    Property values are stored in the object as-is, so the specification
+    must already be valid (e.g. because the code that builds it is tested
+    against validated figures). Objects constructed in the context,
+    including the nested objects of their compound properties, remain
+    unvalidated after the context exits. This also applies to later calls
+    to methods like `update_layout` and `update_traces` on these objects.
+
+    Objects constructed outside of the context are validated as usual,
+    even when they are updated within it.
+
+    Examples
+    --------
+    >>> import plotly.graph_objects as go
+    >>> with go.trusted():
+    ...     fig = go.Figure(data=[go.Scatter(y=[2, 1, 3])], layout_title_text="Fast")
+    >>> fig.layout.title.text
+    'Fast'
+    """
+    _trusted_state.depth = getattr(_trusted_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _trusted_state.depth -= 1
+
+
+class _CompoundChildRef(weakref.ref):
+    """
+    Weak reference from a BasePlotlyType object to one of its compound child
+    objects (e.g. scatter.marker), stored in the parent's _compound_props
+    dict. The reference removes itself from the dict when the child is
+    garbage collected.
+    """
+
+    __slots__ = ("prop", "parent_ref")
+
+    def __new__(cls, child, parent, prop):
+        self = weakref.ref.__new__(cls, child, _CompoundChildRef._remove)
+        self.prop = prop
+        self.parent_ref = weakref.ref(parent)
+        return self
+
+    def __init__(self, child, parent, prop):
+        super(_CompoundChildRef, self).__init__(child, _CompoundChildRef._remove)
+
+    @staticmethod
+    def _remove(ref):
+        parent = ref.parent_ref()
+        if parent is not None and parent._compound_props.get(ref.prop) is ref:
+            del parent._compound_props[ref.prop]
+
+
 class BaseFigure(object):
     """
     Base class for all figure types (both widget and non-widget)
@@ -36,6 +417,24 @@ class BaseFigure(object):
         "plot_bgcolor": "plot-bgcolor",
     }
 
+    # Matches any of the _valid_underscore_properties
+    _underscore_properties_re = re.compile(
+        "|".join(re.escape(prop) for prop in _valid_underscore_properties)
+    )
+
+    # Least recently used cache of key path strings parsed by
+    # _str_to_dict_path, bounded to _key_path_cache_size entries. The cache
+    # is shared by all figures, so it is only accessed while holding
+    # _key_path_cache_lock
+    _key_path_cache = OrderedDict()
+    _key_path_cache_size = 4096
+    _key_path_cache_lock = threading.Lock()
+
+    # Trace properties that are indexed for select_traces, along with the
+    # top-level trace properties that determine a trace's subplot reference
+    _trace_index_props = ("type", "name", "legendgroup")
+    _trace_index_subplot_props = ("xaxis", "yaxis", "geo", "scene", "subplot", "domain")
+
     _set_trace_uid = False
     _allow_disable_validation = True
 
@@ -93,7 +492,7 @@ class BaseFigure(object):
         super(BaseFigure, self).__init__()
 
         # Initialize validation
-        self._validate = kwargs.pop("_validate", True)
+        self._validate = kwargs.pop("_validate", True) and not _in_trusted_mode()
 
         # Assign layout_plotly to layout
         # ------------------------------
@@ -150,10 +549,17 @@ class BaseFigure(object):
         # ### Save tuple of trace objects ###
         self._data_objs = data
 
-        # ### Import clone of trace properties ###
+        # ### Adopt trace properties ###
         # The _data property is a list of dicts containing the properties
         # explicitly set by the user for each trace.
-        self._data = [deepcopy(trace._props) for trace in data]
+        #
+        # The data validator returns newly constructed trace objects, or
+        # orphan traces that the figure adopts (see
+        # BaseDataValidator.validate_coerce), so nothing else references
+        # their properties dicts. The figure takes ownership of these dicts
+        # instead of deep copying them, so the read-only arrays produced by
+        # the validators are not copied again.
+        self._data = [trace._props for trace in data]
 
         # ### Create data defaults ###
         # _data_defaults is a tuple of dicts, one for each trace. When
@@ -165,19 +571,37 @@ class BaseFigure(object):
         # _data_defaults for the same trace.
         self._data_defaults = [{} for _ in data]
 
-        # ### Reparent trace objects ###
-        for trace_ind, trace in enumerate(data):
-            # By setting the trace's parent to be this figure, we tell the
-            # trace object to use the figure's _data and _data_defaults
-            # dicts to get/set it's properties, rather than using the trace
-            # object's internal _orphan_props dict.
-            trace._parent = self
-
-            # We clear the orphan props since the trace no longer needs then
-            trace._orphan_props.clear()
-
-            # Set trace index
-            trace._trace_ind = trace_ind
+        # Note: The trace objects are reparented at the end of the
+        # constructor (see "Reparent trace objects" below)
+
+        # ### Trace indexes ###
+        # Secondary indexes from the values of the _trace_index_props (and
+        # from each trace's subplot reference) to the indexes of the traces
+        # that have those values. These are built on first use by
+        # select_traces. Traces whose indexed properties may have changed
+        # are added to _trace_index_dirty and are reindexed lazily.
+        self._trace_index = None
+        self._trace_index_entries = None
+        self._trace_index_dirty = set()
+
+        # ### Trace uid index ###
+        # Dict from trace uids to trace indexes, used to look up the traces
+        # of messages from the frontend. Built on first use, and rebuilt on
+        # use after traces are deleted or moved. Entries are checked against
+        # the trace's current uid when they are used.
+        self._trace_uid_index = None
+
+        # ### Content digests ###
+        # Digests of each trace's properties, used by content_hash. A value
+        # of None means that the trace was modified since its digest was
+        # last computed
+        self._trace_digests = [None for _ in data]
+
+        # ### Grid subplot refs cache ###
+        # Dict from normalized (row, col, secondary_y) arguments of
+        # select_traces to the matching subplot refs of _grid_ref
+        self._grid_subplot_refs_cache = {}
+        self._grid_subplot_refs_cache_grid = None
 
         # Layout
         # ------
@@ -190,14 +614,19 @@ class BaseFigure(object):
             layout, skip_invalid=skip_invalid, _validate=self._validate
         )
 
-        # ### Import clone of layout properties ###
-        self._layout = deepcopy(self._layout_obj._props)
+        # ### Adopt layout properties ###
+        # As with the traces above, the validated layout object is newly
+        # constructed so its properties dict can be adopted without copying
+        self._layout = self._layout_obj._props
 
         # ### Initialize layout defaults dict ###
         self._layout_defaults = {}
 
+        # ### Layout content digest ###
+        self._layout_digest = None
+
         # ### Reparent layout object ###
-        self._layout_obj._orphan_props.clear()
+        self._layout_obj._orphan_props = {}
         self._layout_obj._parent = self
 
         # Config
@@ -270,6 +699,28 @@ class BaseFigure(object):
             elif not skip_invalid:
                 raise TypeError("invalid Figure property: {}".format(k))
 
+        # Reparent trace objects
+        # ----------------------
+        # Orphan trace objects passed by the caller are adopted by the data
+        # validator, so they are only reparented once the rest of the
+        # constructor has succeeded. If it raises, the caller's traces are
+        # left untouched rather than belonging to a partially constructed
+        # figure. Until then, the figure's _data list and the traces share
+        # the same properties dicts.
+        for trace_ind, trace in enumerate(self._data_objs):
+            # By setting the trace's parent to be this figure, we tell the
+            # trace object to use the figure's _data and _data_defaults
+            # dicts to get/set it's properties, rather than using the trace
+            # object's internal _orphan_props dict.
+            trace._parent = self
+
+            # The figure now owns the trace's original orphan props dict, so
+            # the trace gets a new empty one
+            trace._orphan_props = {}
+
+            # Set trace index
+            trace._trace_ind = trace_ind
+
     # Magic Methods
     # -------------
     def __reduce__(self):
@@ -392,15 +843,116 @@ class BaseFigure(object):
         if not isinstance(other, BaseFigure):
             # Require objects to both be BaseFigure instances
             return False
+        elif len(self._data) != len(other._data):
+            return False
+        elif self._cached_digests_differ(other):
+            # Figures are only compared in full if their cached digests match
+            return False
         else:
-            # Compare plotly_json representations
-
-            # Use _vals_equal instead of `==` to handle cases where
-            # underlying dicts contain numpy arrays
+            # Compare the properties of the figures in place, without copying
+            # them as to_plotly_json does. Use _vals_equal instead of `==` to
+            # handle cases where underlying dicts contain numpy arrays
             return BasePlotlyType._vals_equal(
-                self.to_plotly_json(), other.to_plotly_json()
+                (self._data, self._layout, [f._props for f in self._frame_objs]),
+                (other._data, other._layout, [f._props for f in other._frame_objs]),
             )
 
+    def _cached_digests_differ(self, other):
+        """
+        Return whether any trace or layout content digest that is cached by
+        both this figure and other differs (see content_hash)
+
+        Digests that are not cached are not computed, so this never walks
+        the figures. Figures with a differing digest are not equal, but
+        figures with matching digests must still be compared in full.
+
+        Parameters
+        ----------
+        other : BaseFigure
+            Figure with the same number of traces as this figure
+
+        Returns
+        -------
+        bool
+        """
+        for digest, other_digest in zip(self._trace_digests, other._trace_digests):
+            if digest is not None and other_digest is not None:
+                if digest != other_digest:
+                    return True
+
+        return (
+            self._layout_digest is not None
+            and other._layout_digest is not None
+            and self._layout_digest != other._layout_digest
+        )
+
+    def content_hash(self):
+        """
+        Compute a hash of the figure's data, layout and frames.
+
+        Figures with equal contents have equal hashes, so the hash can be
+        used as a cache key (e.g. to avoid exporting the same figure to an
+        image more than once). Numpy arrays are hashed directly from their
+        buffers, and numeric lists hash the same as the equivalent arrays.
+
+        The hashes of individual traces and of the layout are cached, and
+        are only recomputed when the corresponding properties are modified.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest
+        """
+        h = hashlib.sha1()
+
+        # Handle data
+        # -----------
+        h.update(("data%d:" % len(self._data)).encode("ascii"))
+        for trace_ind, trace_data in enumerate(self._data):
+            trace_digest = self._trace_digests[trace_ind]
+            if trace_digest is None:
+                trace_digest = _content_digest(trace_data)
+                self._trace_digests[trace_ind] = trace_digest
+            h.update(trace_digest)
+
+        # Handle layout
+        # -------------
+        if self._layout_digest is None:
+            self._layout_digest = _content_digest(self._layout)
+        h.update(b"layout")
+        h.update(self._layout_digest)
+
+        # Handle frames
+        # -------------
+        # Frames are not reparented to the figure, so changes to them can't
+        # be tracked and their digest is not cached
+        if self._frame_objs:
+            h.update(b"frames")
+            h.update(_content_digest([frame._props for frame in self._frame_objs]))
+
+        return h.hexdigest()
+
+    def _invalidate_content_digests(self, trace_indexes=(), layout=False):
+        """
+        Discard the cached content digests of modified traces and/or layout
+
+        Parameters
+        ----------
+        trace_indexes : iterable of int
+            Indexes of the traces that were modified
+        layout : bool
+            Whether the layout was modified
+
+        Returns
+        -------
+        None
+        """
+        for trace_ind in trace_indexes:
+            self._trace_digests[trace_ind] = None
+
+        if layout:
+            self._layout_digest = None
+
     def __repr__(self):
         """
         Customize Figure representation when displayed in the
@@ -638,9 +1190,11 @@ class BaseFigure(object):
             if id(trace) in remove_uids:
                 delete_inds.append(i)
 
-                # Unparent trace object to be removed
+                # Unparent trace object to be removed. The trace's properties
+                # dict is removed from _data below, so the trace can take it
+                # back as its orphan props dict without copying it
                 old_trace = self.data[i]
-                old_trace._orphan_props.update(deepcopy(old_trace._props))
+                old_trace._orphan_props = old_trace._props
                 old_trace._parent = None
                 old_trace._trace_ind = None
 
@@ -709,6 +1263,10 @@ class BaseFigure(object):
             for i, _trace in sorted(zip(new_inds, traces_prop_defaults_post_removal))
         ]
 
+        # Reorder content digests
+        trace_digests = dict(zip(orig_uids, self._trace_digests))
+        self._trace_digests = [trace_digests[uid] for uid in new_uids]
+
         # Update trace objects tuple
         self._data_objs = list(new_data)
 
@@ -716,6 +1274,11 @@ class BaseFigure(object):
         for trace_ind, trace in enumerate(self._data_objs):
             trace._trace_ind = trace_ind
 
+        # Rebuild secondary trace indexes on next use
+        if delete_inds or new_inds != current_inds:
+            self._invalidate_trace_index()
+            self._trace_uid_index = None
+
     def select_traces(self, selector=None, row=None, col=None, secondary_y=None):
         """
         Select traces from a particular subplot cell and/or traces
@@ -756,35 +1319,8 @@ class BaseFigure(object):
             selector = {}
 
         if row is not None or col is not None or secondary_y is not None:
-            grid_ref = self._validate_get_grid_ref()
+            grid_subplot_refs = self._get_grid_subplot_refs(row, col, secondary_y)
             filter_by_subplot = True
-
-            if row is None and col is not None:
-                # All rows for column
-                grid_subplot_ref_tuples = [ref_row[col - 1] for ref_row in grid_ref]
-            elif col is None and row is not None:
-                # All columns for row
-                grid_subplot_ref_tuples = grid_ref[row - 1]
-            elif col is not None and row is not None:
-                # Single grid cell
-                grid_subplot_ref_tuples = [grid_ref[row - 1][col - 1]]
-            else:
-                # row and col are None, secondary_y not None
-                grid_subplot_ref_tuples = [
-                    refs for refs_row in grid_ref for refs in refs_row
-                ]
-
-            # Collect list of subplot refs, taking secondary_y into account
-            grid_subplot_refs = []
-            for refs in grid_subplot_ref_tuples:
-                if not refs:
-                    continue
-                if secondary_y is not True:
-                    grid_subplot_refs.append(refs[0])
-
-                if secondary_y is not False and len(refs) > 1:
-                    grid_subplot_refs.append(refs[1])
-
         else:
             filter_by_subplot = False
             grid_subplot_refs = None
@@ -793,13 +1329,102 @@ class BaseFigure(object):
             filter_by_subplot, grid_subplot_refs, selector
         )
 
+    def _get_grid_subplot_refs(self, row, col, secondary_y):
+        """
+        Return the list of subplot refs in the figure's grid that match the
+        row, col, and secondary_y arguments of select_traces.
+
+        The refs are cached per set of arguments for as long as the figure's
+        _grid_ref is unchanged.
+        """
+        grid_ref = self._validate_get_grid_ref()
+        if grid_ref is not self._grid_subplot_refs_cache_grid:
+            self._grid_subplot_refs_cache = {}
+            self._grid_subplot_refs_cache_grid = grid_ref
+
+        # secondary_y is compared by identity below, so normalize it
+        # before using it as a cache key
+        cache_key = (row, col, secondary_y is True, secondary_y is False)
+        if cache_key in self._grid_subplot_refs_cache:
+            return self._grid_subplot_refs_cache[cache_key]
+
+        if row is None and col is not None:
+            # All rows for column
+            grid_subplot_ref_tuples = [ref_row[col - 1] for ref_row in grid_ref]
+        elif col is None and row is not None:
+            # All columns for row
+            grid_subplot_ref_tuples = grid_ref[row - 1]
+        elif col is not None and row is not None:
+            # Single grid cell
+            grid_subplot_ref_tuples = [grid_ref[row - 1][col - 1]]
+        else:
+            # row and col are None, secondary_y not None
+            grid_subplot_ref_tuples = [
+                refs for refs_row in grid_ref for refs in refs_row
+            ]
+
+        # Collect list of subplot refs, taking secondary_y into account
+        grid_subplot_refs = []
+        for refs in grid_subplot_ref_tuples:
+            if not refs:
+                continue
+            if secondary_y is not True:
+                grid_subplot_refs.append(refs[0])
+
+            if secondary_y is not False and len(refs) > 1:
+                grid_subplot_refs.append(refs[1])
+
+        self._grid_subplot_refs_cache[cache_key] = grid_subplot_refs
+        return grid_subplot_refs
+
     def _perform_select_traces(self, filter_by_subplot, grid_subplot_refs, selector):
-        from plotly.subplots import _get_subplot_ref_for_trace
+        # Narrow down candidate traces using the secondary trace indexes
+        # --------------------------------------------------------------
+        candidate_inds = None
+        trace_index = None
+        if filter_by_subplot or (selector and self._is_indexed_selector(selector)):
+            trace_index = self._get_trace_index()
+
+        if filter_by_subplot:
+            candidate_inds = set()
+            subplot_index = trace_index["subplot"]
+            for subplot_ref in grid_subplot_refs:
+                candidate_inds.update(
+                    subplot_index.get(_hashable_subplot_ref(subplot_ref), ())
+                )
+
+        if trace_index is not None and selector:
+            for k in BaseFigure._trace_index_props:
+                if k not in selector:
+                    continue
+                try:
+                    inds = trace_index[k].get(selector[k], ())
+                except TypeError:
+                    # Unhashable selector value, can't use index
+                    continue
+
+                if candidate_inds is None:
+                    candidate_inds = set(inds)
+                else:
+                    candidate_inds.intersection_update(inds)
+
+        if candidate_inds is None:
+            candidate_inds = range(len(self._data_objs))
+        else:
+            candidate_inds = sorted(candidate_inds)
+
+        # Filter candidate traces
+        # -----------------------
+        # The index only narrows down the candidates, so every candidate is
+        # still checked against the full selection criteria
+        data = self._data_objs
+        entries = self._trace_index_entries
+        for trace_ind in candidate_inds:
+            trace = data[trace_ind]
 
-        for trace in self.data:
             # Filter by subplot
             if filter_by_subplot:
-                trace_subplot_ref = _get_subplot_ref_for_trace(trace)
+                trace_subplot_ref = entries[trace_ind]["subplot"][0]
                 if trace_subplot_ref not in grid_subplot_refs:
                     continue
 
@@ -809,6 +1434,150 @@ class BaseFigure(object):
 
             yield trace
 
+    @staticmethod
+    def _is_indexed_selector(selector):
+        return any(k in selector for k in BaseFigure._trace_index_props)
+
+    def _get_trace_index(self):
+        """
+        Return the figure's secondary trace indexes, building the indexes
+        (or reindexing any dirty traces) as needed.
+
+        Returns
+        -------
+        dict[str, dict]
+            Dict from each of the _trace_index_props, and 'subplot', to a
+            dict from property values (or hashable subplot refs) to sets of
+            trace indexes
+        """
+        if self._trace_index is None:
+            self._trace_index = {k: {} for k in BaseFigure._trace_index_props}
+            self._trace_index["subplot"] = {}
+            self._trace_index_entries = [None] * len(self._data_objs)
+            self._trace_index_dirty = set(range(len(self._data_objs)))
+
+        if self._trace_index_dirty:
+            for trace_ind in sorted(self._trace_index_dirty):
+                self._reindex_trace(trace_ind)
+            self._trace_index_dirty = set()
+
+        return self._trace_index
+
+    def _reindex_trace(self, trace_ind):
+        """
+        Update the secondary trace indexes for a single trace
+        """
+        from plotly.subplots import _get_subplot_ref_for_trace
+
+        entries = self._trace_index_entries
+        while len(entries) <= trace_ind:
+            entries.append(None)
+
+        # Remove old index entries
+        # ------------------------
+        old_entry = entries[trace_ind]
+        if old_entry is not None:
+            for k, v in old_entry.items():
+                index_key = v[1] if k == "subplot" else v
+                self._trace_index[k][index_key].discard(trace_ind)
+
+        # Add new index entries
+        # ---------------------
+        trace = self._data_objs[trace_ind]
+        new_entry = {}
+        for k in BaseFigure._trace_index_props:
+            if k in trace:
+                v = trace[k]
+                try:
+                    self._trace_index[k].setdefault(v, set()).add(trace_ind)
+                except TypeError:
+                    # Unhashable value, leave it unindexed
+                    continue
+                new_entry[k] = v
+
+        subplot_ref = _get_subplot_ref_for_trace(trace)
+        subplot_key = _hashable_subplot_ref(subplot_ref)
+        self._trace_index["subplot"].setdefault(subplot_key, set()).add(trace_ind)
+        new_entry["subplot"] = (subplot_ref, subplot_key)
+
+        entries[trace_ind] = new_entry
+
+    def _get_trace_ind_by_uid(self, uid):
+        """
+        Return the index of the trace with the specified uid
+
+        Parameters
+        ----------
+        uid : str
+            Trace uid
+
+        Returns
+        -------
+        int
+            Index of the first trace with the specified uid
+
+        Raises
+        ------
+        ValueError
+            If none of the figure's traces has the specified uid
+        """
+        uid_index = self._trace_uid_index
+        trace_ind = uid_index.get(uid, None) if uid_index is not None else None
+        if (
+            trace_ind is None
+            or trace_ind >= len(self._data)
+            or self._data[trace_ind].get("uid", None) != uid
+        ):
+            # The index is missing or out of date (e.g. because a trace's uid
+            # was changed), so rebuild it
+            uid_index = {}
+            for i, trace_data in enumerate(self._data):
+                uid_index.setdefault(trace_data.get("uid", None), i)
+
+            self._trace_uid_index = uid_index
+            trace_ind = uid_index.get(uid, None)
+
+        if trace_ind is None:
+            raise ValueError("No trace with uid {uid!r}".format(uid=uid))
+
+        return trace_ind
+
+    def _invalidate_trace_index(self, trace_indexes=None, key_path_str=None):
+        """
+        Mark the secondary trace indexes as out of date
+
+        Parameters
+        ----------
+        trace_indexes : list[int] or None
+            Indexes of traces that should be reindexed. If None (the default)
+            all of the trace indexes are rebuilt on next use.
+        key_path_str : str or None
+            If specified, the key path of the trace property that changed.
+            Changes to properties that are not indexed are ignored.
+
+        Returns
+        -------
+        None
+        """
+        if self._trace_index is None:
+            return
+
+        if trace_indexes is None:
+            self._trace_index = None
+            self._trace_index_entries = None
+            self._trace_index_dirty = set()
+            return
+
+        if key_path_str is not None:
+            prop = BaseFigure._str_to_dict_path(key_path_str)[0]
+            if (
+                prop not in BaseFigure._trace_index_props
+                and prop not in BaseFigure._trace_index_subplot_props
+            ):
+                return
+
+        self._trace_index_dirty.update(trace_indexes)
+
     @staticmethod
     def _selector_matches(obj, selector):
         if selector is None:
@@ -1227,10 +1996,137 @@ because subplot does not have a secondary y-axis"""
         # ----------------
         for key_path_str, v in restyle_data.items():
 
-            # Track whether any of the new values are cause a change in
-            # self._data
-            any_vals_changed = False
-            for i, trace_ind in enumerate(trace_indexes):
+            # Parse key path once for all traces
+            key_path = BaseFigure._str_to_dict_path(key_path_str)
+
+            # Track whether any of the new values are cause a change in
+            # self._data
+            any_vals_changed = False
+            for i, trace_ind in enumerate(trace_indexes):
+                if trace_ind >= len(self._data):
+                    raise ValueError(
+                        "Trace index {trace_ind} out of range".format(
+                            trace_ind=trace_ind
+                        )
+                    )
+
+                # Get new value for this particular trace
+                trace_v = v[i % len(v)] if isinstance(v, list) else v
+
+                if trace_v is not Undefined:
+
+                    # Get trace being updated
+                    trace_obj = self.data[trace_ind]
+
+                    # Validate key_path_str
+                    if not BaseFigure._is_key_path_compatible(key_path, trace_obj):
+
+                        trace_class = trace_obj.__class__.__name__
+                        raise ValueError(
+                            """
+Invalid property path '{key_path_str}' for trace class {trace_class}
+""".format(
+                                key_path_str=key_path_str, trace_class=trace_class
+                            )
+                        )
+
+                    # Apply set operation for this trace and thist value
+                    val_changed = BaseFigure._set_in(
+                        self._data[trace_ind], key_path, trace_v
+                    )
+
+                    # Update any_vals_changed status
+                    any_vals_changed = any_vals_changed or val_changed
+
+            if any_vals_changed:
+                restyle_changes[key_path_str] = v
+                self._invalidate_trace_index(trace_indexes, key_path_str)
+                self._invalidate_content_digests(trace_indexes)
+
+        return restyle_changes
+
+    def extend_traces(self, extend_data, trace_indexes=None, max_points=None):
+        """
+        Append values to array properties of the figure's traces, like
+        Plotly.extendTraces
+
+        Only the new values are validated and, in the case of a
+        FigureWidget, sent to the frontend. Numeric 1D arrays are stored in
+        growable buffers, so the cost of each call is proportional to the
+        number of new values rather than to the length of the arrays. This
+        makes extend_traces well suited for streaming data into a figure.
+
+        Parameters
+        ----------
+        extend_data : dict
+            Dict from property key path strings (e.g. 'x' or
+            'marker.color') to lists of arrays of new values, with one array
+            per trace index. When trace_indexes is a single int, the values
+            are the arrays of new values themselves.
+        trace_indexes : int or list of int
+            Trace index, or list of trace indexes, of the traces to extend.
+            Defaults to all trace indexes.
+        max_points : int or list or dict or None
+            Maximum number of points to keep in each extended array, where
+            the most recent values are kept. May also be a list of ints with
+            one element per trace index, or a dict from the keys of
+            extend_data to an int or to such a list. Keys that are missing
+            from the dict, and elements that are None or negative, don't
+            limit the number of points. Defaults to None, in which case the
+            arrays grow without limit.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If called within a batch_update or batch_animate context, where
+            the extension could not be ordered with the batched updates
+
+        Examples
+        --------
+        >>> import plotly.graph_objects as go
+        >>> fig = go.Figure(go.Scatter(x=[0, 1], y=[2, 3]))
+        >>> fig.extend_traces(dict(x=[[2, 3]], y=[[1, 0]]), [0], max_points=3)
+        >>> fig.data[0].y
+        array([3, 1, 0])
+        """
+        from _plotly_utils.basevalidators import is_array
+
+        if self._in_batch_mode:
+            raise ValueError(
+                "extend_traces cannot be called within a batch_update or "
+                "batch_animate context"
+            )
+
+        # Normalize trace indexes
+        # -----------------------
+        if trace_indexes is not None and not isinstance(trace_indexes, (list, tuple)):
+            extend_data = {k: [v] for k, v in extend_data.items()}
+        trace_indexes = self._normalize_trace_indexes(trace_indexes)
+
+        # Validate new values
+        # -------------------
+        # Only the new values are validated, so the cost doesn't depend on
+        # the current length of the arrays. Everything that may fail happens
+        # before the first array is extended, so that a failing call leaves
+        # the figure unchanged
+        validated_data = {}
+        for key_path_str, vals in extend_data.items():
+            if not isinstance(vals, (list, tuple)) or len(vals) != len(trace_indexes):
+                raise ValueError(
+                    """
+The '{key_path_str}' value of extend_data must be a list with one array of
+new values per trace index ({n} expected)""".format(
+                        key_path_str=key_path_str, n=len(trace_indexes)
+                    )
+                )
+
+            key_path = BaseFigure._str_to_dict_path(key_path_str)
+            validated_vals = []
+            for trace_ind, v in zip(trace_indexes, vals):
                 if trace_ind >= len(self._data):
                     raise ValueError(
                         "Trace index {trace_ind} out of range".format(
@@ -1238,38 +2134,142 @@ because subplot does not have a secondary y-axis"""
                         )
                     )
 
-                # Get new value for this particular trace
-                trace_v = v[i % len(v)] if isinstance(v, list) else v
+                trace_obj = self.data[trace_ind]
+                trace_class = trace_obj.__class__.__name__
+                if not BaseFigure._is_key_path_compatible(key_path, trace_obj):
+                    raise ValueError(
+                        """
+Invalid property path '{key_path_str}' for trace class {trace_class}
+""".format(
+                            key_path_str=key_path_str, trace_class=trace_class
+                        )
+                    )
 
-                if trace_v is not Undefined:
+                validator = trace_obj._get_prop_validator(key_path_str)
+                if trace_obj._validate:
+                    v = validator.validate_coerce(v)
 
-                    # Get trace being updated
-                    trace_obj = self.data[trace_ind]
+                if not validator.array_ok or not is_array(v):
+                    raise ValueError(
+                        """
+The '{key_path_str}' property of trace class {trace_class} cannot be extended
+with a value of type {typ}""".format(
+                            key_path_str=key_path_str,
+                            trace_class=trace_class,
+                            typ=type(v),
+                        )
+                    )
 
-                    # Validate key_path_str
-                    if not BaseFigure._is_key_path_compatible(key_path_str, trace_obj):
+                # Convert the new values to the type of the current array
+                # (e.g. dates to datetime64)
+                v = trace_obj._coerce_extend_values(key_path, v)
 
-                        trace_class = trace_obj.__class__.__name__
-                        raise ValueError(
-                            """
-Invalid property path '{key_path_str}' for trace class {trace_class}
-""".format(
-                                key_path_str=key_path_str, trace_class=trace_class
-                            )
-                        )
+                validated_vals.append(v)
 
-                    # Apply set operation for this trace and thist value
-                    val_changed = BaseFigure._set_in(
-                        self._data[trace_ind], key_path_str, trace_v
+            validated_data[key_path_str] = validated_vals
+
+        max_points = BaseFigure._normalize_extend_max_points(
+            max_points, list(validated_data), len(trace_indexes)
+        )
+
+        # Nothing to do if there are no new values. Extending an array by an
+        # empty array could still change its dtype
+        if not any(len(v) for vals in validated_data.values() for v in vals):
+            return
+
+        # Extend arrays
+        # -------------
+        for key_path_str, vals in validated_data.items():
+            key_path = BaseFigure._str_to_dict_path(key_path_str)
+            for i, (trace_ind, v) in enumerate(zip(trace_indexes, vals)):
+                if len(v):
+                    trace_max_points = BaseFigure._get_extend_max_points(
+                        max_points, key_path_str, i
                     )
+                    self.data[trace_ind]._extend_array(key_path, v, trace_max_points)
 
-                    # Update any_vals_changed status
-                    any_vals_changed = any_vals_changed or val_changed
+            self._invalidate_trace_index(trace_indexes, key_path_str)
 
-            if any_vals_changed:
-                restyle_changes[key_path_str] = v
+        self._invalidate_content_digests(trace_indexes)
 
-        return restyle_changes
+        # Send only the new values to the frontend (if any)
+        self._send_extendTraces_msg(validated_data, trace_indexes, max_points)
+
+        self._dispatch_trace_change_callbacks(validated_data, trace_indexes)
+
+    @staticmethod
+    def _normalize_extend_max_points(max_points, key_path_strs, n):
+        """
+        Normalize the max_points argument of extend_traces to the form
+        accepted by Plotly.extendTraces, which is either a single number, or
+        an object with an array of numbers for every extended property, with
+        one number per trace index. Negative numbers don't limit the number
+        of points.
+
+        Parameters
+        ----------
+        max_points : int or list or dict or None
+            See docstring for extend_traces
+        key_path_strs : list[str]
+            Key path strings of the extended properties
+        n : int
+            Number of extended traces
+
+        Returns
+        -------
+        int or dict or None
+            None if no array is limited, an int if all arrays are limited to
+            the same number of points, or else a dict from every key path
+            string to a list of n ints, where -1 means unlimited
+        """
+        if max_points is None or not isinstance(max_points, (list, tuple, dict)):
+            return max_points
+
+        normalized = {}
+        for key_path_str in key_path_strs:
+            key_max_points = (
+                max_points.get(key_path_str, None)
+                if isinstance(max_points, dict)
+                else max_points
+            )
+            if not isinstance(key_max_points, (list, tuple)):
+                key_max_points = [key_max_points]
+            elif not key_max_points:
+                raise ValueError(
+                    "The max_points value of '{key_path_str}' is an empty "
+                    "list".format(key_path_str=key_path_str)
+                )
+
+            normalized[key_path_str] = [
+                -1 if mp is None else mp
+                for mp in (key_max_points[i % len(key_max_points)] for i in range(n))
+            ]
+
+        return normalized
+
+    @staticmethod
+    def _get_extend_max_points(max_points, key_path_str, i):
+        """
+        Get the maximum number of points of a single extended array
+
+        Parameters
+        ----------
+        max_points : int or dict or None
+            max_points as returned by _normalize_extend_max_points
+        key_path_str : str
+            Key path string of the extended property
+        i : int
+            Position of the trace in the trace_indexes of extend_traces
+
+        Returns
+        -------
+        int or None
+        """
+        if isinstance(max_points, dict):
+            max_points = max_points[key_path_str][i]
+        if max_points is None or max_points < 0:
+            return None
+        return max_points
 
     def _restyle_child(self, child, key_path_str, val):
         """
@@ -1298,6 +2298,11 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         # -------------------
         trace_index = child._trace_ind
 
+        # Keep secondary trace indexes and content digests in sync
+        # -------------------------------------------------------
+        self._invalidate_trace_index([trace_index], key_path_str)
+        self._invalidate_content_digests([trace_index])
+
         # Not in batch mode
         # -----------------
         # Dispatch change callbacks and send restyle message
@@ -1339,6 +2344,10 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         """
         Convert a key path string into a tuple of key path elements
 
+        Parsed key paths are cached, so repeated calls with the same key
+        path string (e.g. from restyle and relayout messages) only parse
+        the string once.
+
         Parameters
         ----------
         key_path_str : str
@@ -1360,54 +2369,79 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         elif isinstance(key_path_str, tuple):
             # Nothing to do
             return key_path_str
-        else:
-            # Split string on periods.
-            # e.g. 'foo.bar_baz[1]' -> ['foo', 'bar_baz[1]']
-            key_path = key_path_str.split(".")
-
-            # Split out bracket indexes.
-            # e.g. ['foo', 'bar_baz[1]'] -> ['foo', 'bar_baz', '1']
-            key_path2 = []
-            for key in key_path:
-                match = BaseFigure._bracket_re.match(key)
-                if match:
-                    key_path2.extend(match.groups())
-                else:
-                    key_path2.append(key)
-
-            # Split out underscore
-            # e.g. ['foo', 'bar_baz', '1'] -> ['foo', 'bar', 'baz', '1']
-            key_path3 = []
-            underscore_props = BaseFigure._valid_underscore_properties
-            for key in key_path2:
-                if "_" in key[1:]:
-                    # For valid properties that contain underscores (error_x)
-                    # replace the underscores with hyphens to protect them
-                    # from being split up
-                    for under_prop, hyphen_prop in underscore_props.items():
-                        key = key.replace(under_prop, hyphen_prop)
-
-                    # Split key on underscores
-                    key = key.split("_")
-
-                    # Replace hyphens with underscores to restore properties
-                    # that include underscores
-                    for i in range(len(key)):
-                        key[i] = key[i].replace("-", "_")
-
-                    key_path3.extend(key)
-                else:
-                    key_path3.append(key)
+        elif not isinstance(key_path_str, string_types):
+            return BaseFigure._parse_key_path_str(key_path_str)
 
-            # Convert elements to ints if possible.
-            # e.g. ['foo', 'bar', '0'] -> ['foo', 'bar', 0]
-            for i in range(len(key_path3)):
-                try:
-                    key_path3[i] = int(key_path3[i])
-                except ValueError as _:
-                    pass
+        # Look up key path in cache, moving it to the most recently used end
+        cache = BaseFigure._key_path_cache
+        with BaseFigure._key_path_cache_lock:
+            try:
+                key_path = cache.pop(key_path_str)
+            except KeyError:
+                key_path = BaseFigure._parse_key_path_str(key_path_str)
+
+                # Evict least recently used key path
+                if len(cache) >= BaseFigure._key_path_cache_size:
+                    cache.popitem(last=False)
 
-            return tuple(key_path3)
+            cache[key_path_str] = key_path
+
+        return key_path
+
+    @staticmethod
+    def _parse_key_path_str(key_path_str):
+        """
+        Parse a key path string into a tuple of key path elements, without
+        caching. See _str_to_dict_path.
+        """
+        # Split string on periods.
+        # e.g. 'foo.bar_baz[1]' -> ['foo', 'bar_baz[1]']
+        key_path = key_path_str.split(".")
+
+        # Split out bracket indexes.
+        # e.g. ['foo', 'bar_baz[1]'] -> ['foo', 'bar_baz', '1']
+        key_path2 = []
+        for key in key_path:
+            match = BaseFigure._bracket_re.match(key)
+            if match:
+                key_path2.extend(match.groups())
+            else:
+                key_path2.append(key)
+
+        # Split out underscore
+        # e.g. ['foo', 'bar_baz', '1'] -> ['foo', 'bar', 'baz', '1']
+        key_path3 = []
+        underscore_props = BaseFigure._valid_underscore_properties
+        for key in key_path2:
+            if "_" in key[1:]:
+                # For valid properties that contain underscores (error_x)
+                # replace the underscores with hyphens to protect them
+                # from being split up
+                key = BaseFigure._underscore_properties_re.sub(
+                    lambda match: underscore_props[match.group(0)], key
+                )
+
+                # Split key on underscores
+                key = key.split("_")
+
+                # Replace hyphens with underscores to restore properties
+                # that include underscores
+                for i in range(len(key)):
+                    key[i] = key[i].replace("-", "_")
+
+                key_path3.extend(key)
+            else:
+                key_path3.append(key)
+
+        # Convert elements to ints if possible.
+        # e.g. ['foo', 'bar', '0'] -> ['foo', 'bar', 0]
+        for i in range(len(key_path3)):
+            try:
+                key_path3[i] = int(key_path3[i])
+            except ValueError as _:
+                pass
+
+        return tuple(key_path3)
 
     @staticmethod
     def _set_in(d, key_path_str, v):
@@ -1419,10 +2453,11 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         ----------
         d : dict
             Input dict to set property in
-        key_path_str : str
+        key_path_str : str or tuple
             Key path string, where nested keys are joined on '.' characters
             and array indexes are specified using brackets
-            (e.g. 'foo.bar[1]')
+            (e.g. 'foo.bar[1]'), or a key path tuple as returned by
+            _str_to_dict_path
         v
             New value
         Returns
@@ -1719,10 +2754,6 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         # Validate traces
         data = self._data_validator.validate_coerce(data)
 
-        # Set trace indexes
-        for ind, new_trace in enumerate(data):
-            new_trace._trace_ind = ind + len(self.data)
-
         # Allow integers as inputs to subplots
         int_type = _get_int_type()
 
@@ -1762,22 +2793,48 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
 
         # Apply rows / cols
         if rows is not None:
-            for trace, row, col, secondary_y in zip(data, rows, cols, secondary_ys):
-                self._set_trace_grid_position(trace, row, col, secondary_y)
+            # Orphan traces passed by the caller are adopted rather than
+            # copied, so their properties are restored if a grid position
+            # is invalid
+            orig_props = [dict(trace._props) for trace in data]
+            try:
+                for trace, row, col, secondary_y in zip(data, rows, cols, secondary_ys):
+                    self._set_trace_grid_position(trace, row, col, secondary_y)
+            except Exception:
+                for trace, props in zip(data, orig_props):
+                    trace._props.clear()
+                    trace._props.update(props)
+                raise
+
+        # Set trace indexes
+        for ind, new_trace in enumerate(data):
+            new_trace._trace_ind = ind + len(self.data)
 
-        # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        # Adopt the properties dicts of the newly validated traces. See the
+        # note in the constructor for why these don't need to be copied
+        new_traces_data = [trace._props for trace in data]
 
         # Update trace parent
         for trace in data:
             trace._parent = self
-            trace._orphan_props.clear()
+            trace._orphan_props = {}
 
         # Update python side
         #  Use extend instead of assignment so we don't trigger serialization
         self._data.extend(new_traces_data)
         self._data_defaults = self._data_defaults + [{} for _ in data]
         self._data_objs = self._data_objs + data
+        self._trace_digests = self._trace_digests + [None for _ in data]
+
+        # Index new traces on next use
+        self._invalidate_trace_index(
+            range(len(self._data_objs) - len(data), len(self._data_objs))
+        )
+        if self._trace_uid_index is not None:
+            for trace_ind in range(len(self._data) - len(data), len(self._data)):
+                self._trace_uid_index.setdefault(
+                    self._data[trace_ind].get("uid", None), trace_ind
+                )
 
         # Update messages
         self._send_addTraces_msg(new_traces_data)
@@ -2026,21 +3083,24 @@ Please use the add_trace method with the row and col parameters.
         # Validate new layout
         # -------------------
         new_layout = self._layout_validator.validate_coerce(new_layout)
-        new_layout_data = deepcopy(new_layout._props)
+        new_layout_data = new_layout._props
 
         # Unparent current layout
         # -----------------------
+        # The current layout properties dict is replaced below, so the old
+        # layout object can take it back as its orphan props dict
         if self._layout_obj:
-            old_layout_data = deepcopy(self._layout_obj._props)
-            self._layout_obj._orphan_props.update(old_layout_data)
+            old_layout_data = self._layout_obj._props
+            self._layout_obj._orphan_props = old_layout_data
             self._layout_obj._parent = None
 
         # Parent new layout
         # -----------------
         self._layout = new_layout_data
         new_layout._parent = self
-        new_layout._orphan_props.clear()
+        new_layout._orphan_props = {}
         self._layout_obj = new_layout
+        self._invalidate_content_digests(layout=True)
 
         # Initialize template object
         # --------------------------
@@ -2118,7 +3178,10 @@ Please use the add_trace method with the row and col parameters.
         # ----------------
         for key_path_str, v in relayout_data.items():
 
-            if not BaseFigure._is_key_path_compatible(key_path_str, self.layout):
+            # Parse key path once for the compatibility check and set
+            key_path = BaseFigure._str_to_dict_path(key_path_str)
+
+            if not BaseFigure._is_key_path_compatible(key_path, self.layout):
 
                 raise ValueError(
                     """
@@ -2129,19 +3192,20 @@ Invalid property path '{key_path_str}' for layout
                 )
 
             # Apply set operation on the layout dict
-            val_changed = BaseFigure._set_in(self._layout, key_path_str, v)
+            val_changed = BaseFigure._set_in(self._layout, key_path, v)
 
             if val_changed:
                 relayout_changes[key_path_str] = v
+                self._invalidate_content_digests(layout=True)
 
         return relayout_changes
 
     @staticmethod
     def _is_key_path_compatible(key_path_str, plotly_obj):
         """
-        Return whether the specifieid key path string is compatible with
-        the specified plotly object for the purpose of relayout/restyle
-        operation
+        Return whether the specifieid key path string (or key path tuple) is
+        compatible with the specified plotly object for the purpose of
+        relayout/restyle operation
         """
 
         # Convert string to tuple of path components
@@ -2180,6 +3244,10 @@ Invalid property path '{key_path_str}' for layout
         # --------------
         assert child is self.layout
 
+        # Discard cached layout digest
+        # ----------------------------
+        self._invalidate_content_digests(layout=True)
+
         # Not in batch mode
         # -------------
         # Dispatch change callbacks and send relayout message
@@ -2462,6 +3530,9 @@ Invalid property path '{key_path_str}' for layout
     def _send_restyle_msg(self, style, trace_indexes=None, source_view_id=None):
         pass
 
+    def _send_extendTraces_msg(self, extend_data, trace_indexes, max_points=None):
+        pass
+
     def _send_relayout_msg(self, layout, source_view_id=None):
         pass
 
@@ -2759,34 +3830,51 @@ Invalid property path '{key_path_str}' for layout
 
     # Exports
     # -------
-    def to_dict(self):
+    def to_dict(self, copy=True):
         """
         Convert figure to a dictionary
 
         Note: the dictionary includes the properties explicitly set by the
         user, it does not include default values of unspecified properties
 
+        Parameters
+        ----------
+        copy: bool (default True)
+            If True, return a deep copy of the figure's properties that may
+            be freely modified.
+
+            If False, return a read-only view of the figure's properties
+            that shares numpy arrays with the figure instead of copying them.
+            In this view dicts are read-only dict instances, lists are
+            copied into tuples (without copying their elements), and numpy
+            arrays are read-only. This is much cheaper than a deep copy for
+            figures with large numpy arrays, and is intended for export
+            operations that only read the result.
+
         Returns
         -------
         dict
         """
         # Handle data
         # -----------
-        data = deepcopy(self._data)
+        data = self._data
 
         # Handle layout
         # -------------
-        layout = deepcopy(self._layout)
+        layout = self._layout
 
         # Handle frames
         # -------------
         # Frame key is only added if there are any frames
         res = {"data": data, "layout": layout}
-        frames = deepcopy([frame._props for frame in self._frame_objs])
+        frames = [frame._props for frame in self._frame_objs]
         if frames:
             res["frames"] = frames
 
-        return res
+        if copy:
+            return deepcopy(res)
+        else:
+            return _to_read_only(res)
 
     def to_plotly_json(self):
         """
@@ -3398,6 +4486,29 @@ class BasePlotlyType(object):
     _path_str = ""
     _valid_props = set()
 
+    # ### Validator table ###
+    # Code-generated subclasses define their own (initially empty) dict from
+    # property names to validator instances, which is populated on the first
+    # use of each property. Classes without a table look up validators in
+    # the ValidatorCache directly
+    _validator_table = None
+
+    # ### Slots ###
+    # Instance attributes are stored in slots rather than in an instance
+    # dict. Subclasses declare slots for any additional attributes they set.
+    __slots__ = (
+        "_skip_invalid",
+        "_validate",
+        "_plotly_name",
+        "_compound_props",
+        "_compound_array_props",
+        "_orphan_props",
+        "_parent",
+        "_change_callbacks",
+        "__validators",
+        "__weakref__",
+    )
+
     def __init__(self, plotly_name, **kwargs):
         """
         Construct a new BasePlotlyType
@@ -3409,51 +4520,80 @@ class BasePlotlyType(object):
         kwargs : dict
             Invalid props/values to raise on
         """
-        # ### _skip_invalid ##
-        # If True, then invalid properties should be skipped, if False then
-        # invalid properties will result in an exception
-        self._skip_invalid = False
-
-        self._validate = True
+        self._init_base_state(plotly_name)
 
         # Validate inputs
         # ---------------
         self._process_kwargs(**kwargs)
 
+    def _init_base_state(self, plotly_name):
+        """
+        Initialize the attributes that all BasePlotlyType objects share
+
+        This is called by __init__, and by _construct_compound_child for
+        objects that are constructed without running their constructor.
+
+        Parameters
+        ----------
+        plotly_name : str
+            The lowercase name of the plotly object
+
+        Returns
+        -------
+        None
+        """
+        # Attributes are set with object.__setattr__, which skips the
+        # property name checks of BasePlotlyType.__setattr__
+        set_attr = object.__setattr__
+
+        # ### _skip_invalid ##
+        # If True, then invalid properties should be skipped, if False then
+        # invalid properties will result in an exception
+        set_attr(self, "_skip_invalid", False)
+
+        # ### _validate ###
+        # If False, property values are stored without validation. Objects
+        # constructed in a trusted() context are not validated
+        set_attr(self, "_validate", not _in_trusted_mode())
+
         # Store params
         # ------------
-        self._plotly_name = plotly_name
+        set_attr(self, "_plotly_name", plotly_name)
 
         # Initialize properties
         # ---------------------
         # ### _compound_props ###
-        # A dict from compound property names to compound objects
-        self._compound_props = {}
+        # A dict from compound property names to compound objects. Compound
+        # objects are lightweight views of this object's properties dict, so
+        # most of them are only weakly referenced (see _set_compound_child)
+        # and are constructed again on access once they have been garbage
+        # collected
+        set_attr(self, "_compound_props", {})
 
         # ### _compound_array_props ###
         # A dict from compound array property names to tuples of compound
         # objects
-        self._compound_array_props = {}
+        set_attr(self, "_compound_array_props", {})
 
         # ### _orphan_props ###
         # A dict of properties for use while object has no parent. When
         # object has a parent, it requests its properties dict from its
         # parent and doesn't use this.
-        self._orphan_props = {}
+        set_attr(self, "_orphan_props", {})
 
         # ### _parent ###
         # The parent of the object. May be another BasePlotlyType or it may
         # be a BaseFigure (as is the case for the Layout and Trace objects)
-        self._parent = None
+        set_attr(self, "_parent", None)
 
         # ### _change_callbacks ###
         # A dict from tuples of child property path tuples to lists
         # of callbacks that should be executed whenever any of these
         # properties is modified
-        self._change_callbacks = {}
+        set_attr(self, "_change_callbacks", {})
 
         # ### Backing property for backward compatible _validator property ##
-        self.__validators = None
+        set_attr(self, "_BasePlotlyType__validators", None)
 
     # @property
     # def _validate(self):
@@ -3464,9 +4604,16 @@ class BasePlotlyType(object):
     #         return fig._validate
 
     def _get_validator(self, prop):
-        from .validator_cache import ValidatorCache
+        validator_table = self._validator_table
+        if validator_table is None:
+            return ValidatorCache.get_validator(self._path_str, prop)
 
-        return ValidatorCache.get_validator(self._path_str, prop)
+        try:
+            return validator_table[prop]
+        except KeyError:
+            validator = ValidatorCache.get_validator(self._path_str, prop)
+            validator_table[prop] = validator
+            return validator
 
     @property
     def _validators(self):
@@ -3725,6 +4872,110 @@ class BasePlotlyType(object):
         else:
             return self.parent._get_child_prop_defaults(self)
 
+    def _get_compound_child(self, prop):
+        """
+        Return the compound object of a compound property, if it has been
+        constructed and hasn't been garbage collected
+
+        Parameters
+        ----------
+        prop : str
+            Name of a compound property
+
+        Returns
+        -------
+        BasePlotlyType|None
+        """
+        child = self._compound_props.get(prop, None)
+        if isinstance(child, weakref.ref):
+            child = child()
+        return child
+
+    def _construct_compound_child(self, validator, prop):
+        """
+        Construct the object of a compound property as a view of this
+        object's properties
+
+        Compound objects are constructed again each time they are accessed
+        after being garbage collected (see _set_compound_child), so they are
+        created with __new__ and only their base state is initialized,
+        rather than running the generated constructor and its argument
+        processing. Layout objects also initialize their subplot properties,
+        so they are constructed as usual.
+
+        Parameters
+        ----------
+        validator : CompoundValidator
+            Validator of the compound property
+        prop : str
+            Name of the compound property
+
+        Returns
+        -------
+        BasePlotlyType
+        """
+        data_class = validator.data_class
+        if issubclass(data_class, BaseLayoutType):
+            child = data_class(_parent=self, plotly_name=prop)
+        else:
+            child = data_class.__new__(data_class)
+            child._init_base_state(prop)
+            object.__setattr__(child, "_parent", self)
+
+        # Update plotly_name value in case the validator applies
+        # non-standard name (e.g. imagedefaults instead of image)
+        object.__setattr__(child, "_plotly_name", prop)
+
+        # Children of unvalidated objects are unvalidated
+        object.__setattr__(child, "_validate", self._validate)
+        return child
+
+    def _set_compound_child(self, prop, child):
+        """
+        Store the compound object of a compound property in _compound_props
+
+        The object is only weakly referenced, so that walking a figure
+        doesn't keep an object alive for every compound property that was
+        ever accessed. Objects with registered change callbacks (see
+        _keep_alive) are strongly referenced. So are layout objects, which
+        keep track of their subplot properties (e.g. xaxis2), and objects
+        with a layout property (i.e. templates).
+
+        Parameters
+        ----------
+        prop : str
+            Name of a compound property
+        child : BasePlotlyType
+
+        Returns
+        -------
+        None
+        """
+        if (
+            child._change_callbacks
+            or isinstance(child, BaseLayoutType)
+            or "layout" in child._valid_props
+        ):
+            self._compound_props[prop] = child
+        else:
+            self._compound_props[prop] = _CompoundChildRef(child, self, prop)
+
+    def _keep_alive(self):
+        """
+        Strongly reference this object, and each of its compound ancestors,
+        from its parent so that it's not garbage collected while it belongs
+        to the parent
+
+        Returns
+        -------
+        None
+        """
+        obj, parent = self, self.parent
+        while isinstance(parent, BasePlotlyType):
+            if parent._get_compound_child(obj.plotly_name) is obj:
+                parent._compound_props[obj.plotly_name] = obj
+            obj, parent = parent, parent.parent
+
     def _get_prop_validator(self, prop):
         """
         Return the validator associated with the specified property
@@ -3818,6 +5069,7 @@ class BasePlotlyType(object):
             CompoundValidator,
             CompoundArrayValidator,
             BaseDataValidator,
+            DataArrayValidator,
         )
 
         # Normalize prop
@@ -3842,16 +5094,13 @@ class BasePlotlyType(object):
             validator = self._get_validator(prop)
 
             if isinstance(validator, CompoundValidator):
-                if self._compound_props.get(prop, None) is None:
+                child = self._get_compound_child(prop)
+                if child is None:
                     # Init compound objects
-                    self._compound_props[prop] = validator.data_class(
-                        _parent=self, plotly_name=prop
-                    )
-                    # Update plotly_name value in case the validator applies
-                    # non-standard name (e.g. imagedefaults instead of image)
-                    self._compound_props[prop]._plotly_name = prop
+                    child = self._construct_compound_child(validator, prop)
+                    self._set_compound_child(prop, child)
 
-                return validator.present(self._compound_props[prop])
+                return validator.present(child)
             elif isinstance(validator, (CompoundArrayValidator, BaseDataValidator)):
                 if self._compound_array_props.get(prop, None) is None:
                     # Init list of compound objects
@@ -3860,12 +5109,25 @@ class BasePlotlyType(object):
                             validator.data_class(_parent=self)
                             for _ in self._props.get(prop, [])
                         ]
+                        for el in self._compound_array_props[prop]:
+                            el._validate = self._validate
                     else:
                         self._compound_array_props[prop] = []
 
                 return validator.present(self._compound_array_props[prop])
             elif self._props is not None and prop in self._props:
-                return validator.present(self._props[prop])
+                val = self._props[prop]
+                if (
+                    not self._validate
+                    and isinstance(val, list)
+                    and isinstance(validator, DataArrayValidator)
+                ):
+                    # Numeric lists of data arrays stored without validation
+                    # are returned as numpy arrays. The stored list is left
+                    # unchanged, so that reading a property doesn't change
+                    # the figure
+                    val = validator.coerce_unvalidated(val)
+                return validator.present(val)
             elif self._prop_defaults is not None:
                 return validator.present(self._prop_defaults.get(prop, None))
             else:
@@ -4007,7 +5269,21 @@ class BasePlotlyType(object):
                         for v in value
                     ]
 
-                self._props[prop] = value
+                # Store the value as-is, and notify the parent of the change in
+                # the same way as _set_prop does for validated values
+                if value is Undefined:
+                    return
+                elif value is None:
+                    if prop in self._props:
+                        if not self._in_batch_mode:
+                            self._props.pop(prop)
+                        self._send_prop_set(prop, value)
+                elif prop not in self._props or not BasePlotlyType._vals_equal(
+                    self._props[prop], value
+                ):
+                    if not self._in_batch_mode:
+                        self._props[prop] = value
+                    self._send_prop_set(prop, value)
 
                 # Remove any already constructed graph object so that it will be
                 # reconstructed on property access
@@ -4368,9 +5644,12 @@ class BasePlotlyType(object):
 
         # Save deep copies of current and new states
         # ------------------------------------------
-        curr_val = self._compound_props.get(prop, None)
+        curr_val = self._get_compound_child(prop)
         if curr_val is not None:
             curr_dict_val = deepcopy(curr_val._props)
+        elif self._props is not None:
+            # The current object was garbage collected (or never constructed)
+            curr_dict_val = deepcopy(self._props.get(prop, None))
         else:
             curr_dict_val = None
 
@@ -4409,7 +5688,7 @@ class BasePlotlyType(object):
 
         # Update _compound_props
         # ----------------------
-        self._compound_props[prop] = val
+        self._set_compound_child(prop, val)
         return val
 
     def _set_array_prop(self, prop, val):
@@ -4684,6 +5963,9 @@ on_change callbacks are not supported in this case.
         # -----------------
         self._change_callbacks[arg_tuples].append(callback)
 
+        # The callbacks are lost if this object is garbage collected
+        self._keep_alive()
+
     def to_plotly_json(self):
         """
         Return plotly JSON representation of object as a Python dict
@@ -4694,6 +5976,20 @@ on_change callbacks are not supported in this case.
         """
         return deepcopy(self._props if self._props is not None else {})
 
+    @staticmethod
+    def _numeric_array_or_none(v, np):
+        """
+        Return list v as a numeric numpy array, or None if v holds other
+        values or is ragged
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                arr = np.asarray(v)
+            except ValueError:
+                return None
+        return arr if arr.dtype.kind in "biuf" else None
+
     @staticmethod
     def _vals_equal(v1, v2):
         """
@@ -4716,12 +6012,22 @@ on_change callbacks are not supported in this case.
         ):
             return np.array_equal(v1, v2)
         elif isinstance(v1, (list, tuple)):
+            if not isinstance(v2, (list, tuple)) or len(v1) != len(v2):
+                return False
+
+            # Compare numeric lists as arrays rather than element by element
+            if np is not None and v1 and _is_array_like_head(v1[0], np):
+                arr1 = BasePlotlyType._numeric_array_or_none(v1, np)
+                arr2 = (
+                    BasePlotlyType._numeric_array_or_none(v2, np)
+                    if arr1 is not None
+                    else None
+                )
+                if arr2 is not None:
+                    return np.array_equal(arr1, arr2)
+
             # Handle recursive equality on lists and tuples
-            return (
-                isinstance(v2, (list, tuple))
-                and len(v1) == len(v2)
-                and all(BasePlotlyType._vals_equal(e1, e2) for e1, e2 in zip(v1, v2))
-            )
+            return all(BasePlotlyType._vals_equal(e1, e2) for e1, e2 in zip(v1, v2))
         elif isinstance(v1, dict):
             # Handle recursive equality on dicts
             return (
@@ -4738,6 +6044,8 @@ class BaseLayoutHierarchyType(BasePlotlyType):
     Base class for all types in the layout hierarchy
     """
 
+    __slots__ = ()
+
     @property
     def _parent_path_str(self):
         pass
@@ -4757,6 +6065,8 @@ class BaseLayoutType(BaseLayoutHierarchyType):
     code-generated subclass.
     """
 
+    __slots__ = ("_subplotid_props",)
+
     # Dynamic properties
     # ------------------
     # Unlike all other plotly types, BaseLayoutType has dynamic properties.
@@ -4870,7 +6180,11 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         # Use the standard _set_compound_prop method to
         # validate/coerce/import subplot value. This must be called AFTER
         # the validator instance is added to self._validators above.
-        self._set_compound_prop(prop, value)
+        if self._validate:
+            self._set_compound_prop(prop, value)
+        else:
+            # Store value as-is, the subplot object is constructed on access
+            super(BaseLayoutHierarchyType, self).__setitem__(prop, value)
         self._subplotid_props.add(prop)
 
     def _strip_subplot_suffix_of_1(self, prop):
@@ -4924,8 +6238,7 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         """
         prop = self._strip_subplot_suffix_of_1(prop)
         if prop != "_subplotid_props" and prop in self._subplotid_props:
-            validator = self._get_validator(prop)
-            return validator.present(self._compound_props[prop])
+            return self[prop]
         else:
             return super(BaseLayoutHierarchyType, self).__getattribute__(prop)
 
@@ -5030,6 +6343,8 @@ class BaseTraceHierarchyType(BasePlotlyType):
     Base class for all types in the trace hierarchy
     """
 
+    __slots__ = ()
+
     def __init__(self, plotly_name, **kwargs):
         super(BaseTraceHierarchyType, self).__init__(plotly_name, **kwargs)
 
@@ -5047,6 +6362,19 @@ class BaseTraceType(BaseTraceHierarchyType):
     subclasses of this class.
     """
 
+    __slots__ = (
+        "_hover_callbacks",
+        "_unhover_callbacks",
+        "_click_callbacks",
+        "_select_callbacks",
+        "_deselect_callbacks",
+        "_trace_ind",
+        "_array_buffers",
+        # Subplot position assigned by plotly.express
+        "_subplot_row",
+        "_subplot_col",
+    )
+
     def __init__(self, plotly_name, **kwargs):
         super(BaseTraceHierarchyType, self).__init__(plotly_name, **kwargs)
 
@@ -5070,6 +6398,155 @@ class BaseTraceType(BaseTraceHierarchyType):
         # ### Trace index in figure ###
         self._trace_ind = None
 
+        # ### Array stores of properties extended by extend_traces ###
+        # Dict from key path tuples to _ArrayBuffer instances
+        self._array_buffers = None
+
+    def _coerce_extend_values(self, key_path, values):
+        """
+        Convert the new values of an array property to the type of the
+        current array before it is extended by _extend_array.
+
+        New values of a datetime64 array (e.g. datetime objects or ISO date
+        strings) are converted to datetime64, in the unit of the current
+        array unless that would lose precision. Values that can't be
+        converted are returned as a list, and _extend_array then stores the
+        current dates as ISO strings.
+
+        Parameters
+        ----------
+        key_path : tuple
+            Key path tuple of the property as returned by
+            BaseFigure._str_to_dict_path
+        values : list or tuple or numpy.ndarray
+            Array of new values
+
+        Returns
+        -------
+        list or tuple or numpy.ndarray
+        """
+        np = get_module("numpy")
+        if np is None:
+            return values
+
+        current = self._props
+        for key in key_path:
+            if not isinstance(current, dict):
+                return values
+            current = current.get(key, None)
+
+        if not isinstance(current, np.ndarray) or current.dtype.kind != "M":
+            return values
+
+        new_arr = np.asarray(values)
+        if new_arr.dtype.kind == "M":
+            return values
+        elif new_arr.dtype.kind not in "OSU":
+            # Numbers are not converted, since plotly.js interprets them as
+            # milliseconds while numpy interprets them in the array's unit
+            return list(values)
+
+        try:
+            new_arr = np.asarray(values, dtype="datetime64")
+        except (ValueError, TypeError):
+            return list(values)
+
+        # Use the unit of the current array if no precision is lost
+        same_unit = new_arr.astype(current.dtype)
+        if np.all((same_unit == new_arr) | np.isnat(new_arr)):
+            new_arr = same_unit
+        return new_arr
+
+    def _extend_array(self, key_path, values, max_points=None):
+        """
+        Append values to an array property of the trace without validation.
+        Used by BaseFigure.extend_traces.
+
+        Parameters
+        ----------
+        key_path : tuple
+            Key path tuple of the property as returned by
+            BaseFigure._str_to_dict_path
+        values : list or tuple or numpy.ndarray
+            Array of new values
+        max_points : int or None
+            If not None, only the most recent max_points values are kept
+
+        Returns
+        -------
+        None
+        """
+        # Get the dict that holds the property
+        # ------------------------------------
+        parent = self._props
+        for key in key_path[:-1]:
+            if isinstance(parent, dict) and parent.get(key, None) is None:
+                parent[key] = {}
+            parent = parent[key]
+
+        prop = key_path[-1]
+        current = parent.get(prop, None)
+
+        # Extend numeric 1D arrays in place
+        # ---------------------------------
+        np = get_module("numpy")
+        buffers = self._array_buffers or {}
+        if np is not None:
+            new_arr = np.asarray(values)
+            buffer = buffers.pop(key_path, None)
+            if _ArrayBuffer.supports(np, new_arr):
+                if buffer is None or current is not buffer.view:
+                    # The property was assigned since it was last extended
+                    try:
+                        current_arr = (
+                            new_arr[:0] if current is None else np.asarray(current)
+                        )
+                    except ValueError:
+                        # Ragged nested lists
+                        current_arr = None
+
+                    buffer = (
+                        _ArrayBuffer(np, current_arr, max_points)
+                        if _ArrayBuffer.supports(np, current_arr)
+                        else None
+                    )
+
+                if buffer is not None:
+                    try:
+                        parent[prop] = buffer.extend(np, new_arr, max_points)
+                    except TypeError:
+                        # Incompatible dtypes (e.g. dates and numbers)
+                        pass
+                    else:
+                        buffers[key_path] = buffer
+                        self._array_buffers = buffers
+                        return
+
+        # Concatenate other arrays
+        # ------------------------
+        if current is None:
+            new_val = values
+        elif (
+            np is not None
+            and isinstance(current, np.ndarray)
+            and current.dtype.kind == "M"
+            and not isinstance(values, np.ndarray)
+        ):
+            # Values that are not dates (see _coerce_extend_values)
+            new_val = list(np.datetime_as_string(current)) + list(values)
+        elif np is not None and (
+            isinstance(current, np.ndarray) or isinstance(values, np.ndarray)
+        ):
+            new_val = np.concatenate([current, values])
+            new_val.flags.writeable = False
+        else:
+            new_val = list(current) + list(values)
+
+        if max_points is not None:
+            new_val = new_val[max(len(new_val) - max_points, 0) :]
+
+        parent[prop] = new_val
+
     # uid
     # ---
     # All trace types must have a top-level UID
@@ -5409,6 +6886,8 @@ class BaseFrameHierarchyType(BasePlotlyType):
     Base class for all types in the trace hierarchy
     """
 
+    __slots__ = ()
+
     def __init__(self, plotly_name, **kwargs):
         super(BaseFrameHierarchyType, self).__init__(plotly_name, **kwargs)
 
@@ -1,4 +1,5 @@
 import uuid
+from collections import OrderedDict
 from importlib import import_module
 import os
 import numbers
@@ -10,8 +11,14 @@ except ImportError:
 
 import ipywidgets as widgets
 from traitlets import List, Unicode, Dict, observe, Integer
-from .basedatatypes import BaseFigure, BasePlotlyType
-from .callbacks import BoxSelector, LassoSelector, InputDeviceState, Points
+from .basedatatypes import BaseFigure, BasePlotlyType, Undefined
+from .callbacks import (
+    BoxSelector,
+    LassoSelector,
+    InputDeviceState,
+    Points,
+    _group_points,
+)
 from .serializers import custom_serializers
 from .version import __frontend_version__
 
@@ -62,6 +69,7 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
     _py2js_relayout = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_update = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_animate = Dict(allow_none=True).tag(sync=True, **custom_serializers)
+    _py2js_extendTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
 
     _py2js_deleteTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_moveTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
@@ -109,6 +117,39 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         self, data=None, layout=None, frames=None, skip_invalid=False, **kwargs
     ):
 
+        # Message coalescing
+        # ------------------
+        # Restyle, relayout and update messages that weren't triggered by a
+        # frontend view are merged into a single pending update message. See
+        # the coalesce_window property.
+        #
+        # Note: This state is initialized before calling the superclass
+        # constructors, because they may send messages (e.g. when the
+        # layout template is initialized). Messages are not merged until the
+        # constructor has finished (see the end of __init__), because the
+        # message states below are reset after the superclass constructors
+        # have run.
+        self._coalesce_window = None
+
+        # _pending_trace_edits is a dict from trace indexes to dicts from
+        # property paths to the pending values of the trace's properties
+        self._pending_trace_edits = OrderedDict()
+
+        # _pending_layout_edits is a dict from property paths to the pending
+        # values of the layout's properties
+        self._pending_layout_edits = OrderedDict()
+
+        # Number of messages merged into the pending update message
+        self._pending_msg_count = 0
+
+        # Event loop handle of the scheduled flush of the pending update
+        # message, or None if no flush is scheduled
+        self._pending_flush_handle = None
+
+        # Number of messages sent to the frontend and number of messages
+        # merged into other messages
+        self._msg_stats = {"sent": 0, "merged": 0}
+
         # Call superclass constructors
         # ----------------------------
         # Note: We rename layout to layout_plotly because to deconflict it
@@ -160,6 +201,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # views of this widget
         self._view_count = 0
 
+        # Enable message coalescing
+        # -------------------------
+        self._coalesce_window = 0
+
     # Python -> JavaScript Messages
     # -----------------------------
     def _send_relayout_msg(self, layout_data, source_view_id=None):
@@ -175,6 +220,11 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             (e.g. By the user clicking 'zoom' in the toolbar). None if the
             operation was not triggered by a frontend view
         """
+        # Merge into pending update message
+        # ---------------------------------
+        if self._queue_update_msg({}, layout_data, [], source_view_id):
+            return
+
         # Increment layout edit messages IDs
         # ----------------------------------
         layout_edit_id = self._last_layout_edit_id + 1
@@ -215,6 +265,11 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # ---------------------------
         trace_indexes = self._normalize_trace_indexes(trace_indexes)
 
+        # Merge into pending update message
+        # ---------------------------------
+        if self._queue_update_msg(restyle_data, {}, trace_indexes, source_view_id):
+            return
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         layout_edit_id = self._last_layout_edit_id + 1
@@ -240,6 +295,50 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         self._py2js_restyle = restyle_msg
         self._py2js_restyle = None
 
+    def _send_extendTraces_msg(self, extend_data, trace_indexes, max_points=None):
+        """
+        Send Plotly.extendTraces message to the frontend
+
+        Parameters
+        ----------
+        extend_data : dict
+            Dict from property key path strings to lists of arrays of new
+            values, with one array per trace index
+        trace_indexes : list[int]
+            List of indexes of the extended traces
+        max_points : int or dict or None
+            Maximum number of points to keep in the extended arrays
+        """
+
+        # Send pending update message first
+        # ---------------------------------
+        self._flush_pending_msgs()
+
+        # Increment layout/trace edit message IDs
+        # ---------------------------------------
+        layout_edit_id = self._last_layout_edit_id + 1
+        self._last_layout_edit_id = layout_edit_id
+        self._layout_edit_in_process = True
+
+        trace_edit_id = self._last_trace_edit_id + 1
+        self._last_trace_edit_id = trace_edit_id
+        self._trace_edit_in_process = True
+
+        # Build message
+        # -------------
+        extend_msg = {
+            "extend_data": extend_data,
+            "extend_traces": trace_indexes,
+            "max_points": max_points,
+            "trace_edit_id": trace_edit_id,
+            "layout_edit_id": layout_edit_id,
+        }
+
+        # Send message
+        # ------------
+        self._py2js_extendTraces = extend_msg
+        self._py2js_extendTraces = None
+
     def _send_addTraces_msg(self, new_traces_data):
         """
         Send Plotly.addTraces message to the frontend
@@ -250,6 +349,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             List of trace data for new traces as accepted by Plotly.addTraces
         """
 
+        # Send pending update message first
+        # ---------------------------------
+        self._flush_pending_msgs()
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         layout_edit_id = self._last_layout_edit_id + 1
@@ -285,6 +388,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             List of new trace indexes
         """
 
+        # Send pending update message first
+        # ---------------------------------
+        self._flush_pending_msgs()
+
         # Build message
         # -------------
         move_msg = {"current_trace_inds": current_inds, "new_trace_inds": new_inds}
@@ -318,6 +425,13 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # ---------------------------
         trace_indexes = self._normalize_trace_indexes(trace_indexes)
 
+        # Merge into pending update message
+        # ---------------------------------
+        if self._queue_update_msg(
+            restyle_data, relayout_data, trace_indexes, source_view_id
+        ):
+            return
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         trace_edit_id = self._last_trace_edit_id + 1
@@ -363,6 +477,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             List of trace indexes that the animate operation applies to
         """
 
+        # Send pending update message first
+        # ---------------------------------
+        self._flush_pending_msgs()
+
         # Validate / normalize inputs
         # ---------------------------
         trace_indexes = self._normalize_trace_indexes(trace_indexes)
@@ -404,6 +522,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             List of trace indexes of traces to delete
         """
 
+        # Send pending update message first
+        # ---------------------------------
+        self._flush_pending_msgs()
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         trace_edit_id = self._last_trace_edit_id + 1
@@ -427,6 +549,259 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         self._py2js_deleteTraces = delete_msg
         self._py2js_deleteTraces = None
 
+    # Message coalescing
+    # ------------------
+    @property
+    def coalesce_window(self):
+        """
+        Time window, in seconds, over which restyle, relayout and update
+        messages to the frontend are merged into a single update message
+
+        Property assignments and calls to methods like `update_traces` and
+        `update_layout` each produce a message that causes the frontend to
+        redraw the figure. These messages are merged into a single pending
+        message, in which later values of a property replace earlier ones.
+
+          - When 0 (the default), the pending message is sent once the
+            kernel's event loop has finished the current callback (e.g. the
+            execution of a notebook cell or a widget event handler).
+          - When positive, the pending message is sent this many seconds
+            after the first message was merged into it, so the figure is
+            redrawn at most once per window.
+          - When None, messages are sent immediately.
+
+        Messages are always sent immediately when no asyncio event loop is
+        running, and other messages (e.g. adding or deleting traces) cause
+        the pending message to be sent first, so messages are applied by the
+        frontend in order.
+
+        Returns
+        -------
+        float or None
+        """
+        return self._coalesce_window
+
+    @coalesce_window.setter
+    def coalesce_window(self, val):
+        if val is not None and (
+            not isinstance(val, numbers.Number) or isinstance(val, bool) or val < 0
+        ):
+            raise ValueError(
+                """
+The coalesce_window property must be a non-negative number or None
+    Received value: {val}""".format(
+                    val=repr(val)
+                )
+            )
+
+        self._flush_pending_msgs()
+        self._coalesce_window = val
+
+    @property
+    def message_stats(self):
+        """
+        Counts of the messages that were sent to the frontend
+
+        Returns
+        -------
+        dict
+            Dict with the keys:
+              - 'sent': Number of messages sent to the frontend
+              - 'merged': Number of restyle, relayout and update messages
+                that were merged into other messages instead of being sent
+        """
+        return dict(self._msg_stats)
+
+    @observe(
+        "_py2js_addTraces",
+        "_py2js_restyle",
+        "_py2js_relayout",
+        "_py2js_update",
+        "_py2js_animate",
+        "_py2js_extendTraces",
+        "_py2js_deleteTraces",
+        "_py2js_moveTraces",
+        "_py2js_removeLayoutProps",
+        "_py2js_removeTraceProps",
+    )
+    def _count_py2js_msg(self, change):
+        # Message properties are reset to None after each message
+        if change["new"] is not None:
+            self._msg_stats["sent"] += 1
+
+    @staticmethod
+    def _get_running_loop():
+        """
+        Return the asyncio event loop that is running in the current
+        thread, or None if there is none
+        """
+        try:
+            import asyncio
+        except ImportError:
+            return None
+
+        get_running_loop = getattr(asyncio, "_get_running_loop", None)
+        return get_running_loop() if get_running_loop is not None else None
+
+    def _queue_update_msg(
+        self, restyle_data, relayout_data, trace_indexes, source_view_id=None
+    ):
+        """
+        Merge a restyle, relayout or update message into the pending update
+        message, and schedule the pending message to be sent
+
+        Messages that were triggered by a frontend view are not merged,
+        because the view that triggered them doesn't apply them again. These
+        messages, and messages that update a property path that contains (or
+        is contained in) a property path with a pending value, cause the
+        pending message to be sent first.
+
+        Parameters
+        ----------
+        restyle_data : dict
+            Plotly.update restyle data
+        relayout_data : dict
+            Plotly.update relayout data
+        trace_indexes : list[int]
+            List of trace indexes that the restyle data applies to
+        source_view_id : str or None
+            UID of view that triggered the message, or None
+
+        Returns
+        -------
+        bool
+            True if the message was merged, False if it must be sent
+            immediately
+        """
+        loop = self._get_running_loop()
+        if self._coalesce_window is None or loop is None or source_view_id is not None:
+            self._flush_pending_msgs()
+            return False
+
+        # Handle overlapping property paths
+        # ---------------------------------
+        # e.g. 'marker' and 'marker.color'. We send the pending message first
+        # so that the frontend applies the updates in order.
+        pending_trace_props = set(
+            prop
+            for trace_edits in self._pending_trace_edits.values()
+            for prop in trace_edits
+        )
+        if BaseFigureWidget._overlapping_prop_paths(
+            restyle_data, pending_trace_props
+        ) or BaseFigureWidget._overlapping_prop_paths(
+            relayout_data, self._pending_layout_edits
+        ):
+            self._flush_pending_msgs()
+
+        # Merge message
+        # -------------
+        new_layout_edit = not self._pending_msg_count
+        new_trace_edit = not self._pending_trace_edits
+
+        for key_path_str, v in restyle_data.items():
+            for i, trace_ind in enumerate(trace_indexes):
+                trace_v = v[i % len(v)] if isinstance(v, list) else v
+                if trace_v is not Undefined:
+                    trace_edits = self._pending_trace_edits.setdefault(
+                        trace_ind, OrderedDict()
+                    )
+                    trace_edits[key_path_str] = trace_v
+
+        self._pending_layout_edits.update(relayout_data)
+        self._pending_msg_count += 1
+
+        # Increment layout/trace edit message IDs
+        # ---------------------------------------
+        # The IDs are incremented once per pending message, which is sent
+        # with the most recent IDs. Deltas that the frontend returns for
+        # earlier edits are ignored until the pending message has been
+        # applied.
+        if new_trace_edit and self._pending_trace_edits:
+            self._last_trace_edit_id += 1
+            self._trace_edit_in_process = True
+
+        if new_layout_edit:
+            self._last_layout_edit_id += 1
+            self._layout_edit_in_process = True
+
+        # Schedule flush
+        # --------------
+        if self._pending_flush_handle is None:
+            if self._coalesce_window:
+                self._pending_flush_handle = loop.call_later(
+                    self._coalesce_window, self._flush_pending_msgs
+                )
+            else:
+                self._pending_flush_handle = loop.call_soon(self._flush_pending_msgs)
+
+        return True
+
+    @staticmethod
+    def _overlapping_prop_paths(key_path_strs, pending_key_path_strs):
+        """
+        Return whether any of the property paths in key_path_strs contains,
+        or is contained in, a different property path in
+        pending_key_path_strs (e.g. 'marker' and 'marker.color')
+        """
+        if not pending_key_path_strs:
+            return False
+
+        pending_key_paths = [
+            BaseFigure._str_to_dict_path(key_path_str)
+            for key_path_str in pending_key_path_strs
+        ]
+        for key_path_str in key_path_strs:
+            key_path = BaseFigure._str_to_dict_path(key_path_str)
+            for pending_key_path in pending_key_paths:
+                n = min(len(key_path), len(pending_key_path))
+                if (
+                    key_path != pending_key_path
+                    and key_path[:n] == pending_key_path[:n]
+                ):
+                    return True
+        return False
+
+    def _flush_pending_msgs(self):
+        """
+        Send the pending update message (if any) to the frontend
+        """
+        if self._pending_flush_handle is not None:
+            self._pending_flush_handle.cancel()
+            self._pending_flush_handle = None
+
+        if not self._pending_msg_count:
+            return
+
+        # Build message
+        # -------------
+        # Traces without a pending value of a property are left unchanged
+        trace_edits = list(self._pending_trace_edits.values())
+        restyle_data = {
+            prop: [edits.get(prop, Undefined) for edits in trace_edits]
+            for edits in trace_edits
+            for prop in edits
+        }
+
+        update_msg = {
+            "style_data": restyle_data,
+            "layout_data": dict(self._pending_layout_edits),
+            "style_traces": list(self._pending_trace_edits),
+            "trace_edit_id": self._last_trace_edit_id,
+            "layout_edit_id": self._last_layout_edit_id,
+            "source_view_id": None,
+        }
+
+        self._msg_stats["merged"] += self._pending_msg_count - 1
+        self._pending_trace_edits.clear()
+        self._pending_layout_edits.clear()
+        self._pending_msg_count = 0
+
+        # Send message
+        # ------------
+        self._py2js_update = update_msg
+        self._py2js_update = None
+
     # JavaScript -> Python Messages
     # -----------------------------
     @observe("_js2py_traceDeltas")
@@ -455,9 +830,7 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             for delta in trace_deltas:
 
                 # #### Find existing trace for uid ###
-                trace_uid = delta["uid"]
-                trace_uids = [trace.uid for trace in self.data]
-                trace_index = trace_uids.index(trace_uid)
+                trace_index = self._get_trace_ind_by_uid(delta["uid"])
                 uid_trace = self.data[trace_index]
 
                 # #### Transform defaults to delta ####
@@ -474,6 +847,7 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
                 # #### Notify frontend model of property removal ####
                 if remove_props:
+                    self._invalidate_content_digests([trace_index])
                     remove_trace_props_msg = {
                         "remove_trace": trace_index,
                         "remove_props": remove_props,
@@ -481,6 +855,11 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
                     self._py2js_removeTraceProps = remove_trace_props_msg
                     self._py2js_removeTraceProps = None
 
+                # #### Reindex trace ####
+                # Default property values like the trace name may be used
+                # to select traces
+                self._invalidate_trace_index([trace_index])
+
                 # #### Dispatch change callbacks ####
                 self._dispatch_trace_change_callbacks(delta_transform, [trace_index])
 
@@ -530,6 +909,7 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
             # ### Notify frontend model of property removal ###
             if removed_props:
+                self._invalidate_content_digests(layout=True)
                 remove_props_msg = {"remove_props": removed_props}
 
                 self._py2js_removeLayoutProps = remove_props_msg
@@ -686,37 +1066,49 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         else:
             state = None
 
-        # Build Trace Points Dictionary
-        # -----------------------------
+        # Group points by trace
+        # ---------------------
         points_data = callback_data["points"]
-        trace_points = {
-            trace_ind: {
-                "point_inds": [],
-                "xs": [],
-                "ys": [],
-                "trace_name": self._data_objs[trace_ind].name,
-                "trace_index": trace_ind,
-            }
-            for trace_ind in range(len(self._data_objs))
-        }
-
-        for x, y, point_ind, trace_ind in zip(
+        trace_points = _group_points(
+            points_data["point_indexes"],
             points_data["xs"],
             points_data["ys"],
-            points_data["point_indexes"],
             points_data["trace_indexes"],
-        ):
+        )
 
-            trace_dict = trace_points[trace_ind]
-            trace_dict["xs"].append(x)
-            trace_dict["ys"].append(y)
-            trace_dict["point_inds"].append(point_ind)
+        # Select traces to dispatch to
+        # ----------------------------
+        if event_type in ("plotly_selected", "plotly_deselect"):
+            # Selection events update the selectedpoints property of every
+            # trace, including traces without selected points
+            dispatch_inds = range(len(self._data_objs))
+        else:
+            callbacks_attr = {
+                "plotly_click": "_click_callbacks",
+                "plotly_hover": "_hover_callbacks",
+                "plotly_unhover": "_unhover_callbacks",
+            }.get(event_type, None)
+
+            dispatch_inds = [
+                trace_ind
+                for trace_ind in sorted(trace_points)
+                if 0 <= trace_ind < len(self._data_objs)
+                and callbacks_attr
+                and getattr(self._data_objs[trace_ind], callbacks_attr)
+            ]
 
         # Dispatch callbacks
         # ------------------
-        for trace_ind, trace_points_data in trace_points.items():
-            points = Points(**trace_points_data)
-            trace = self.data[trace_ind]
+        for trace_ind in dispatch_inds:
+            trace = self._data_objs[trace_ind]
+            point_inds, xs, ys = trace_points.get(trace_ind, ([], [], []))
+            points = Points(
+                point_inds=point_inds,
+                xs=xs,
+                ys=ys,
+                trace_name=trace.name,
+                trace_index=trace_ind,
+            )
 
             if event_type == "plotly_click":
                 trace._dispatch_on_click(points, state)
@@ -1,5 +1,115 @@
-from __future__ import absolute_import
+from __future__ import absolute_import, division
 from plotly.utils import _list_repr_elided
+from plotly.optional_imports import get_module
+
+
+def _as_points_array(v, empty_dtype="float64"):
+    """
+    Return the values of a points callback message as a numpy array, or as a
+    list if numpy is not installed
+
+    Numeric and boolean values are stored in arrays of the corresponding
+    dtype. Other values (e.g. category strings, or numbers mixed with None)
+    are stored in object arrays, so that they are not converted to strings.
+
+    Parameters
+    ----------
+    v : list or numpy.ndarray
+        Values of each point
+    empty_dtype : str
+        dtype of the array if v is empty
+
+    Returns
+    -------
+    numpy.ndarray or list
+    """
+    np = get_module("numpy")
+    if np is None:
+        return list(v)
+    elif isinstance(v, np.ndarray):
+        return v
+    elif not len(v):
+        return np.empty(0, dtype=empty_dtype)
+
+    arr = np.asarray(v)
+    if arr.ndim == 0 or arr.dtype.kind not in "biuf":
+        arr = np.empty(len(v), dtype="object")
+        for i, value in enumerate(v):
+            arr[i] = value
+
+    return arr
+
+
+def _as_points_list(v):
+    """
+    Return the values of a points array as a list of Python objects
+
+    Parameters
+    ----------
+    v : numpy.ndarray or list
+        Array as returned by _as_points_array
+
+    Returns
+    -------
+    list
+    """
+    return v.tolist() if hasattr(v, "tolist") else list(v)
+
+
+def _group_points(point_inds, xs, ys, trace_indexes):
+    """
+    Split the points of a points callback message by trace
+
+    Parameters
+    ----------
+    point_inds : list
+        Index of each point in its trace
+    xs : list
+        x-coordinate of each point
+    ys : list
+        y-coordinate of each point
+    trace_indexes : list of int
+        Index of each point's trace
+
+    Returns
+    -------
+    dict
+        Dict from trace indexes to (point_inds, xs, ys) tuples of the trace's
+        points, in message order. The values are numpy arrays, or lists if
+        numpy is not installed
+    """
+    np = get_module("numpy")
+    if np is None:
+        trace_points = {}
+        for point_ind, x, y, trace_ind in zip(point_inds, xs, ys, trace_indexes):
+            trace_point_inds, trace_xs, trace_ys = trace_points.setdefault(
+                trace_ind, ([], [], [])
+            )
+            trace_point_inds.append(point_ind)
+            trace_xs.append(x)
+            trace_ys.append(y)
+        return trace_points
+    elif not len(trace_indexes):
+        return {}
+
+    # A stable sort keeps the points of each trace in message order
+    trace_indexes = np.asarray(trace_indexes, dtype="int64")
+    order = np.argsort(trace_indexes, kind="mergesort")
+    trace_inds, starts = np.unique(trace_indexes[order], return_index=True)
+    split_inds = starts[1:]
+
+    return {
+        int(trace_ind): trace_points
+        for trace_ind, trace_points in zip(
+            trace_inds,
+            zip(
+                *[
+                    np.split(_as_points_array(v)[order], split_inds)
+                    for v in (point_inds, xs, ys)
+                ]
+            ),
+        )
+    }
 
 
 class InputDeviceState:
@@ -124,12 +234,18 @@ InputDeviceState(
 class Points:
     def __init__(self, point_inds=[], xs=[], ys=[], trace_name=None, trace_index=None):
 
-        self._point_inds = point_inds
-        self._xs = xs
-        self._ys = ys
+        self._point_inds = _as_points_array(point_inds, "int64")
+        self._xs = _as_points_array(xs)
+        self._ys = _as_points_array(ys)
         self._trace_name = trace_name
         self._trace_index = trace_index
 
+        # Lists returned by point_inds, xs and ys, which are only built from
+        # the arrays when they are accessed
+        self._point_inds_list = point_inds if isinstance(point_inds, list) else None
+        self._xs_list = xs if isinstance(xs, list) else None
+        self._ys_list = ys if isinstance(ys, list) else None
+
     def __repr__(self):
         return """\
 Points(point_inds={point_inds},
@@ -155,7 +271,9 @@ Points(point_inds={point_inds},
         -------
         list[int]
         """
-        return self._point_inds
+        if self._point_inds_list is None:
+            self._point_inds_list = _as_points_list(self._point_inds)
+        return self._point_inds_list
 
     @property
     def xs(self):
@@ -166,7 +284,9 @@ Points(point_inds={point_inds},
         -------
         list[float]
         """
-        return self._xs
+        if self._xs_list is None:
+            self._xs_list = _as_points_list(self._xs)
+        return self._xs_list
 
     @property
     def ys(self):
@@ -177,6 +297,46 @@ Points(point_inds={point_inds},
         -------
         list[float]
         """
+        if self._ys_list is None:
+            self._ys_list = _as_points_list(self._ys)
+        return self._ys_list
+
+    @property
+    def point_inds_array(self):
+        """
+        Array of selected indexes into the trace's points
+
+        Returns
+        -------
+        numpy.ndarray or list[int]
+            Array of int64 indexes, or list if numpy is not installed
+        """
+        return self._point_inds
+
+    @property
+    def xs_array(self):
+        """
+        Array of x-coordinates of selected points
+
+        Returns
+        -------
+        numpy.ndarray or list
+            Numeric array, or object array for other coordinates (e.g.
+            category strings), or list if numpy is not installed
+        """
+        return self._xs
+
+    @property
+    def ys_array(self):
+        """
+        Array of y-coordinates of selected points
+
+        Returns
+        -------
+        numpy.ndarray or list
+            Numeric array, or object array for other coordinates (e.g.
+            category strings), or list if numpy is not installed
+        """
         return self._ys
 
     @property
@@ -202,6 +362,54 @@ Points(point_inds={point_inds},
         return self._trace_index
 
 
+def _as_coordinates(np, v):
+    """
+    Return coordinates as a float64 array, for testing whether points are
+    inside a selection
+
+    Dates (datetime64 values, datetime objects or date strings) are
+    converted to milliseconds since the epoch, which is how plotly.js
+    represents the coordinates of date axes.
+
+    Parameters
+    ----------
+    np
+        The numpy module
+    v : array-like
+        Coordinates
+
+    Returns
+    -------
+    numpy.ndarray
+
+    Raises
+    ------
+    ValueError
+        If v holds strings that are neither numbers nor dates, such as the
+        categories of a category axis
+    """
+    arr = np.asarray(v)
+    if arr.dtype.kind != "M":
+        try:
+            return arr.astype("float64", copy=False)
+        except (ValueError, TypeError):
+            if arr.dtype.kind not in "OSU":
+                raise
+
+        try:
+            arr = arr.astype("datetime64")
+        except (ValueError, TypeError):
+            raise ValueError(
+                """
+Coordinates must be numbers or dates. Points on category axes can be tested
+using the positions of their categories (0, 1, 2, ...) instead of the category
+names."""
+            )
+
+    ms = arr.astype("datetime64[us]").astype("int64") / 1000.0
+    return np.where(np.isnat(arr), np.nan, ms)
+
+
 class BoxSelector:
     def __init__(self, xrange=None, yrange=None, **_):
         self._type = "box"
@@ -248,6 +456,48 @@ BoxSelector(xrange={xrange},
         """
         return self._yrange
 
+    def contains(self, xs, ys):
+        """
+        Test which points are inside the box selection
+
+        Parameters
+        ----------
+        xs : array-like
+            x-coordinates of the points to test
+        ys : array-like
+            y-coordinates of the points to test
+
+        Returns
+        -------
+        numpy.ndarray or list[bool]
+            Whether each point is inside or on the boundary of the box. A list
+            is returned if numpy is not installed
+
+        Raises
+        ------
+        ValueError
+            If the coordinates or the ranges are strings that are neither
+            numbers nor dates, such as the categories of a category axis
+
+        Notes
+        -----
+        Dates (datetime64 values, datetime objects or date strings) are
+        compared as milliseconds since the epoch, so the ranges of a box
+        selection on a date axis can be compared with datetime64 arrays.
+        Without numpy, the coordinates are compared with the ranges as is.
+        """
+        np = get_module("numpy")
+        if np is None:
+            x0, x1 = sorted(self.xrange)
+            y0, y1 = sorted(self.yrange)
+            return [x0 <= x <= x1 and y0 <= y <= y1 for x, y in zip(xs, ys)]
+
+        x0, x1 = np.sort(_as_coordinates(np, self.xrange))
+        y0, y1 = np.sort(_as_coordinates(np, self.yrange))
+        xs = _as_coordinates(np, xs)
+        ys = _as_coordinates(np, ys)
+        return (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+
 
 class LassoSelector:
     def __init__(self, xs=None, ys=None, **_):
@@ -297,3 +547,128 @@ LassoSelector(xs={xs},
         list[float]
         """
         return self._ys
+
+    def contains(self, xs, ys):
+        """
+        Test which points are inside the lasso selection
+
+        Points are tested with the even-odd rule, so points in regions that
+        the lasso boundary encloses an even number of times are outside.
+        Points on the lasso boundary, including its vertices, are inside, as
+        points on the boundary of a box are in BoxSelector.contains.
+
+        Parameters
+        ----------
+        xs : array-like
+            x-coordinates of the points to test
+        ys : array-like
+            y-coordinates of the points to test
+
+        Returns
+        -------
+        numpy.ndarray or list[bool]
+            Whether each point is inside or on the boundary of the lasso. A
+            list is returned if numpy is not installed
+
+        Raises
+        ------
+        ValueError
+            If the coordinates of the points or of the lasso are strings
+            that are neither numbers nor dates, such as the categories of a
+            category axis
+
+        Notes
+        -----
+        Dates (datetime64 values, datetime objects or date strings) are
+        converted to milliseconds since the epoch, as in BoxSelector.contains.
+        Without numpy, only numeric coordinates are supported. Points are on
+        the boundary if they are exactly on an edge, up to floating point
+        rounding of the coordinates.
+        """
+        np = get_module("numpy")
+
+        # Polygon edges, including the edge that closes the boundary
+        if np is None:
+            lasso_xs = list(self.xs)
+            lasso_ys = list(self.ys)
+        else:
+            lasso_xs = _as_coordinates(np, self.xs).tolist()
+            lasso_ys = _as_coordinates(np, self.ys).tolist()
+        edges = list(
+            zip(
+                lasso_xs,
+                lasso_ys,
+                lasso_xs[-1:] + lasso_xs[:-1],
+                lasso_ys[-1:] + lasso_ys[:-1],
+            )
+        )
+
+        if np is None:
+            inside = []
+            for x, y in zip(xs, ys):
+                point_inside = False
+                for x0, y0, x1, y1 in edges:
+                    if (
+                        min(x0, x1) <= x <= max(x0, x1)
+                        and min(y0, y1) <= y <= max(y0, y1)
+                        and (x1 - x0) * (y - y0) == (y1 - y0) * (x - x0)
+                    ):
+                        # On the boundary
+                        point_inside = True
+                        break
+                    if (y0 > y) != (y1 > y) and x < (x1 - x0) * (y - y0) / (
+                        y1 - y0
+                    ) + x0:
+                        point_inside = not point_inside
+                inside.append(point_inside)
+            return inside
+
+        xs = _as_coordinates(np, xs)
+        ys = _as_coordinates(np, ys)
+        inside = np.zeros(xs.shape, dtype="bool")
+        if not edges:
+            return inside
+
+        # Only test points inside the lasso's bounding box against each edge
+        candidates = np.flatnonzero(
+            (xs >= min(lasso_xs))
+            & (xs <= max(lasso_xs))
+            & (ys >= min(lasso_ys))
+            & (ys <= max(lasso_ys))
+        )
+        # Sort the candidates by y, so that the points whose y-coordinates are
+        # within the span of an edge are a contiguous slice
+        candidates = candidates[np.argsort(ys[candidates], kind="mergesort")]
+        cand_xs = xs[candidates]
+        cand_ys = ys[candidates]
+        cand_inside = np.zeros(candidates.shape, dtype="bool")
+        cand_on_boundary = np.zeros(candidates.shape, dtype="bool")
+
+        for x0, y0, x1, y1 in edges:
+            # Points with min(y0, y1) <= y <= max(y0, y1) may be on the edge,
+            # and the ray of points with min(y0, y1) <= y < max(y0, y1)
+            # crosses it if it is right of the point
+            y_min, y_max = sorted((y0, y1))
+            start, stop_crossing = np.searchsorted(cand_ys, (y_min, y_max))
+            stop = np.searchsorted(cand_ys, y_max, side="right")
+            if start == stop:
+                continue
+
+            span_xs = cand_xs[start:stop]
+            span_ys = cand_ys[start:stop]
+            cand_on_boundary[start:stop] |= (
+                (span_xs >= min(x0, x1))
+                & (span_xs <= max(x0, x1))
+                & ((x1 - x0) * (span_ys - y0) == (y1 - y0) * (span_xs - x0))
+            )
+
+            # Count the crossings of a ray from each point in the +x direction
+            n_crossing = stop_crossing - start
+            if n_crossing:
+                cand_inside[start:stop_crossing] ^= (
+                    span_xs[:n_crossing]
+                    < (x1 - x0) * (span_ys[:n_crossing] - y0) / (y1 - y0) + x0
+                )
+
+        inside[candidates] = cand_inside | cand_on_boundary
+        return inside
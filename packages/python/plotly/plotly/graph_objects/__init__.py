@@ -76,6 +76,7 @@ if sys.version_info < (3, 7):
     from ..graph_objs import YBins
     from ..graph_objs import Trace
     from ..graph_objs import Histogram2dcontour
+    from ..graph_objs import trusted
     from ..graph_objs import waterfall
     from ..graph_objs import volume
     from ..graph_objs import violin
@@ -255,6 +256,7 @@ else:
             "..graph_objs.YBins",
             "..graph_objs.Trace",
             "..graph_objs.Histogram2dcontour",
+            "..graph_objs.trusted",
         ],
     )
 
@@ -1,6 +1,7 @@
 import sys
 
 if sys.version_info < (3, 7):
+    from ..basedatatypes import trusted
     from ._area import Area
     from ._bar import Bar
     from ._barpolar import Barpolar
@@ -180,6 +181,7 @@ else:
             ".waterfall",
         ],
         [
+            "..basedatatypes.trusted",
             "._area.Area",
             "._bar.Bar",
             "._barpolar.Barpolar",
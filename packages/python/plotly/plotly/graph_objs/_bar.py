@@ -76,6 +76,8 @@ class Bar(_BaseTraceType):
         "ycalendar",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # alignmentgroup
     # --------------
@@ -2649,7 +2651,8 @@ an instance of :class:`plotly.graph_objs.Bar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -54,6 +54,8 @@ class Barpolar(_BaseTraceType):
         "width",
         "widthsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # base
     # ----
@@ -1664,7 +1666,8 @@ an instance of :class:`plotly.graph_objs.Barpolar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -81,6 +81,8 @@ class Box(_BaseTraceType):
         "ycalendar",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # alignmentgroup
     # --------------
@@ -2644,7 +2646,8 @@ an instance of :class:`plotly.graph_objs.Box`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
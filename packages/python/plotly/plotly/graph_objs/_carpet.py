@@ -43,6 +43,8 @@ class Carpet(_BaseTraceType):
         "yaxis",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # a
     # -
@@ -1612,7 +1614,8 @@ an instance of :class:`plotly.graph_objs.Carpet`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
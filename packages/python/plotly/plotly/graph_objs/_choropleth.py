@@ -55,6 +55,8 @@ class Choropleth(_BaseTraceType):
         "zmin",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autocolorscale
     # --------------
@@ -1933,7 +1935,8 @@ an instance of :class:`plotly.graph_objs.Choropleth`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
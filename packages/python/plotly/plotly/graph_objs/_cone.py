@@ -62,6 +62,8 @@ class Cone(_BaseTraceType):
         "z",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # anchor
     # ------
@@ -2160,7 +2162,8 @@ an instance of :class:`plotly.graph_objs.Cone`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -69,6 +69,8 @@ class Contour(_BaseTraceType):
         "zmin",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autocolorscale
     # --------------
@@ -2444,7 +2446,8 @@ an instance of :class:`plotly.graph_objs.Contour`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
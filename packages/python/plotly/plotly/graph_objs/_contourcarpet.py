@@ -60,6 +60,8 @@ class Contourcarpet(_BaseTraceType):
         "zmin",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # a
     # -
@@ -2056,7 +2058,8 @@ an instance of :class:`plotly.graph_objs.Contourcarpet`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
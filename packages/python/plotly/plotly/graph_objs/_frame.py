@@ -9,6 +9,8 @@ class Frame(_BaseFrameHierarchyType):
     _parent_path_str = ""
     _path_str = "frame"
     _valid_props = {"baseframe", "data", "group", "layout", "name", "traces"}
+    _validator_table = {}
+    __slots__ = ()
 
     # baseframe
     # ---------
@@ -229,7 +231,8 @@ an instance of :class:`plotly.graph_objs.Frame`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -64,6 +64,8 @@ class Funnel(_BaseTraceType):
         "yaxis",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # alignmentgroup
     # --------------
@@ -2192,7 +2194,8 @@ an instance of :class:`plotly.graph_objs.Funnel`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -53,6 +53,8 @@ class Funnelarea(_BaseTraceType):
         "valuessrc",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # aspectratio
     # -----------
@@ -1689,7 +1691,8 @@ an instance of :class:`plotly.graph_objs.Funnelarea`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
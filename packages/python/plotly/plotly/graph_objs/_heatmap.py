@@ -67,6 +67,8 @@ class Heatmap(_BaseTraceType):
         "zsmooth",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autocolorscale
     # --------------
@@ -2242,7 +2244,8 @@ an instance of :class:`plotly.graph_objs.Heatmap`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
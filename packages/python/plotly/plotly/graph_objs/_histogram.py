@@ -61,6 +61,8 @@ class Histogram(_BaseTraceType):
         "ycalendar",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # alignmentgroup
     # --------------
@@ -2242,7 +2244,8 @@ an instance of :class:`plotly.graph_objs.Histogram`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -66,6 +66,8 @@ class Histogram2d(_BaseTraceType):
         "zsmooth",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autobinx
     # --------
@@ -2393,7 +2395,8 @@ an instance of :class:`plotly.graph_objs.Histogram2d`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -30,6 +30,8 @@ class Indicator(_BaseTraceType):
         "value",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -837,7 +839,8 @@ an instance of :class:`plotly.graph_objs.Indicator`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -57,92 +57,8 @@ class Layout(_BaseLayoutType):
     # --------------------
     _parent_path_str = ""
     _path_str = "layout"
-    _valid_props = {
-        "activeshape",
-        "angularaxis",
-        "annotationdefaults",
-        "annotations",
-        "autosize",
-        "bargap",
-        "bargroupgap",
-        "barmode",
-        "barnorm",
-        "boxgap",
-        "boxgroupgap",
-        "boxmode",
-        "calendar",
-        "clickmode",
-        "coloraxis",
-        "colorscale",
-        "colorway",
-        "datarevision",
-        "direction",
-        "dragmode",
-        "editrevision",
-        "extendfunnelareacolors",
-        "extendpiecolors",
-        "extendsunburstcolors",
-        "extendtreemapcolors",
-        "font",
-        "funnelareacolorway",
-        "funnelgap",
-        "funnelgroupgap",
-        "funnelmode",
-        "geo",
-        "grid",
-        "height",
-        "hiddenlabels",
-        "hiddenlabelssrc",
-        "hidesources",
-        "hoverdistance",
-        "hoverlabel",
-        "hovermode",
-        "imagedefaults",
-        "images",
-        "legend",
-        "mapbox",
-        "margin",
-        "meta",
-        "metasrc",
-        "modebar",
-        "newshape",
-        "orientation",
-        "paper_bgcolor",
-        "piecolorway",
-        "plot_bgcolor",
-        "polar",
-        "radialaxis",
-        "scene",
-        "selectdirection",
-        "selectionrevision",
-        "separators",
-        "shapedefaults",
-        "shapes",
-        "showlegend",
-        "sliderdefaults",
-        "sliders",
-        "spikedistance",
-        "sunburstcolorway",
-        "template",
-        "ternary",
-        "title",
-        "titlefont",
-        "transition",
-        "treemapcolorway",
-        "uirevision",
-        "uniformtext",
-        "updatemenudefaults",
-        "updatemenus",
-        "violingap",
-        "violingroupgap",
-        "violinmode",
-        "waterfallgap",
-        "waterfallgroupgap",
-        "waterfallmode",
-        "width",
-        "xaxis",
-        "yaxis",
-    }
+    _validator_table = {}
+    __slots__ = ("_valid_props",)
 
     # activeshape
     # -----------
@@ -5622,12 +5538,8 @@ class Layout(_BaseLayoutType):
         """
         super(Layout, self).__init__("layout")
 
-        if "_parent" in kwargs:
-            self._parent = kwargs["_parent"]
-            return
-
-        # Override _valid_props for instance so that instance can mutate set
-        # to support subplot properties (e.g. xaxis2)
+        # Initialize _valid_props for instance so that instance can mutate
+        # set to support subplot properties (e.g. xaxis2)
         self._valid_props = {
             "activeshape",
             "angularaxis",
@@ -5715,6 +5627,10 @@ class Layout(_BaseLayoutType):
             "yaxis",
         }
 
+        if "_parent" in kwargs:
+            self._parent = kwargs["_parent"]
+            return
+
         # Validate arg
         # ------------
         if arg is None:
@@ -5734,7 +5650,8 @@ an instance of :class:`plotly.graph_objs.Layout`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
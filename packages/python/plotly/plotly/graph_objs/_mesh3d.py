@@ -74,6 +74,8 @@ class Mesh3d(_BaseTraceType):
         "zcalendar",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # alphahull
     # ---------
@@ -2658,7 +2660,8 @@ an instance of :class:`plotly.graph_objs.Mesh3d`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -50,6 +50,8 @@ class Ohlc(_BaseTraceType):
         "xsrc",
         "yaxis",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # close
     # -----
@@ -1402,7 +1404,8 @@ an instance of :class:`plotly.graph_objs.Ohlc`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -32,6 +32,8 @@ class Parcats(_BaseTraceType):
         "uirevision",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # arrangement
     # -----------
@@ -1124,7 +1126,8 @@ an instance of :class:`plotly.graph_objs.Parcats`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -31,6 +31,8 @@ class Parcoords(_BaseTraceType):
         "uirevision",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # customdata
     # ----------
@@ -1037,7 +1039,8 @@ an instance of :class:`plotly.graph_objs.Parcoords`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
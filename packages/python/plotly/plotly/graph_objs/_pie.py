@@ -62,6 +62,8 @@ class Pie(_BaseTraceType):
         "valuessrc",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # automargin
     # ----------
@@ -2062,7 +2064,8 @@ an instance of :class:`plotly.graph_objs.Pie`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -45,6 +45,8 @@ class Pointcloud(_BaseTraceType):
         "yboundssrc",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # customdata
     # ----------
@@ -1289,7 +1291,8 @@ an instance of :class:`plotly.graph_objs.Pointcloud`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
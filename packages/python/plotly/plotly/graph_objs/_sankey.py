@@ -33,6 +33,8 @@ class Sankey(_BaseTraceType):
         "valuesuffix",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # arrangement
     # -----------
@@ -1115,7 +1117,8 @@ an instance of :class:`plotly.graph_objs.Sankey`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -72,6 +72,8 @@ class Scatter(_BaseTraceType):
         "ycalendar",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # cliponaxis
     # ----------
@@ -2704,7 +2706,8 @@ an instance of :class:`plotly.graph_objs.Scatter`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
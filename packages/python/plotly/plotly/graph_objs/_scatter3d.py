@@ -59,6 +59,8 @@ class Scatter3d(_BaseTraceType):
         "zcalendar",
         "zsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # connectgaps
     # -----------
@@ -2241,7 +2243,8 @@ an instance of :class:`plotly.graph_objs.Scatter3d`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -56,6 +56,8 @@ class Scattercarpet(_BaseTraceType):
         "xaxis",
         "yaxis",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # a
     # -
@@ -1979,7 +1981,8 @@ an instance of :class:`plotly.graph_objs.Scattercarpet`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -58,6 +58,8 @@ class Scattergeo(_BaseTraceType):
         "unselected",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # connectgaps
     # -----------
@@ -2029,7 +2031,8 @@ an instance of :class:`plotly.graph_objs.Scattergeo`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -62,6 +62,8 @@ class Scattergl(_BaseTraceType):
         "ycalendar",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # connectgaps
     # -----------
@@ -2262,7 +2264,8 @@ an instance of :class:`plotly.graph_objs.Scattergl`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
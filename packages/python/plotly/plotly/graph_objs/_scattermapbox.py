@@ -53,6 +53,8 @@ class Scattermapbox(_BaseTraceType):
         "unselected",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # below
     # -----
@@ -1829,7 +1831,8 @@ an instance of :class:`plotly.graph_objs.Scattermapbox`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -60,6 +60,8 @@ class Scatterpolar(_BaseTraceType):
         "unselected",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # cliponaxis
     # ----------
@@ -2103,7 +2105,8 @@ an instance of :class:`plotly.graph_objs.Scatterpolar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -58,6 +58,8 @@ class Scatterternary(_BaseTraceType):
         "unselected",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # a
     # -
@@ -2077,7 +2079,8 @@ an instance of :class:`plotly.graph_objs.Scatterternary`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
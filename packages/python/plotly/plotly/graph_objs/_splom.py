@@ -45,6 +45,8 @@ class Splom(_BaseTraceType):
         "xaxes",
         "yaxes",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # customdata
     # ----------
@@ -1521,7 +1523,8 @@ an instance of :class:`plotly.graph_objs.Splom`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
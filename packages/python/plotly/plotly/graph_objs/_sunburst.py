@@ -52,6 +52,8 @@ class Sunburst(_BaseTraceType):
         "valuessrc",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # branchvalues
     # ------------
@@ -1817,7 +1819,8 @@ an instance of :class:`plotly.graph_objs.Sunburst`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
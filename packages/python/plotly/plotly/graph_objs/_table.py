@@ -32,6 +32,8 @@ class Table(_BaseTraceType):
         "uirevision",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # cells
     # -----
@@ -956,7 +958,8 @@ an instance of :class:`plotly.graph_objs.Table`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -64,6 +64,8 @@ class Violin(_BaseTraceType):
         "yaxis",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # alignmentgroup
     # --------------
@@ -2111,7 +2113,8 @@ an instance of :class:`plotly.graph_objs.Violin`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Stream(_BaseTraceHierarchyType):
     _parent_path_str = "bar"
     _path_str = "bar.stream"
     _valid_props = {"maxpoints", "token"}
+    _validator_table = {}
+    __slots__ = ()
 
     # maxpoints
     # ---------
@@ -118,7 +120,8 @@ an instance of :class:`plotly.graph_objs.bar.Stream`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
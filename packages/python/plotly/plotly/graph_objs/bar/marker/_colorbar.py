@@ -53,6 +53,8 @@ class ColorBar(_BaseTraceHierarchyType):
         "yanchor",
         "ypad",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # bgcolor
     # -------
@@ -1754,7 +1756,8 @@ an instance of :class:`plotly.graph_objs.bar.marker.ColorBar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Tickformatstop(_BaseTraceHierarchyType):
     _parent_path_str = "bar.marker.colorbar"
     _path_str = "bar.marker.colorbar.tickformatstop"
     _valid_props = {"dtickrange", "enabled", "name", "templateitemname", "value"}
+    _validator_table = {}
+    __slots__ = ()
 
     # dtickrange
     # ----------
@@ -249,7 +251,8 @@ an instance of :class:`plotly.graph_objs.bar.marker.colorbar.Tickformatstop`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "bar.unselected"
     _path_str = "bar.unselected.marker"
     _valid_props = {"color", "opacity"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -150,7 +152,8 @@ an instance of :class:`plotly.graph_objs.bar.unselected.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
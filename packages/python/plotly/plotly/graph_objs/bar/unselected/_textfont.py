@@ -9,6 +9,8 @@ class Textfont(_BaseTraceHierarchyType):
     _parent_path_str = "bar.unselected"
     _path_str = "bar.unselected.textfont"
     _valid_props = {"color"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -123,7 +125,8 @@ an instance of :class:`plotly.graph_objs.bar.unselected.Textfont`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
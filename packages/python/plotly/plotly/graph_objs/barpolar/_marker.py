@@ -25,6 +25,8 @@ class Marker(_BaseTraceHierarchyType):
         "reversescale",
         "showscale",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autocolorscale
     # --------------
@@ -980,7 +982,8 @@ an instance of :class:`plotly.graph_objs.barpolar.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
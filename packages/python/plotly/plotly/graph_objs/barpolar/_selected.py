@@ -9,6 +9,8 @@ class Selected(_BaseTraceHierarchyType):
     _parent_path_str = "barpolar"
     _path_str = "barpolar.selected"
     _valid_props = {"marker", "textfont"}
+    _validator_table = {}
+    __slots__ = ()
 
     # marker
     # ------
@@ -123,7 +125,8 @@ an instance of :class:`plotly.graph_objs.barpolar.Selected`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Font(_BaseTraceHierarchyType):
     _parent_path_str = "barpolar.hoverlabel"
     _path_str = "barpolar.hoverlabel.font"
     _valid_props = {"color", "colorsrc", "family", "familysrc", "size", "sizesrc"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -292,7 +294,8 @@ an instance of :class:`plotly.graph_objs.barpolar.hoverlabel.Font`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -22,6 +22,8 @@ class Line(_BaseTraceHierarchyType):
         "width",
         "widthsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autocolorscale
     # --------------
@@ -597,7 +599,8 @@ an instance of :class:`plotly.graph_objs.barpolar.marker.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
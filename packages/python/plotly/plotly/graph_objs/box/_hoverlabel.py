@@ -19,6 +19,8 @@ class Hoverlabel(_BaseTraceHierarchyType):
         "namelength",
         "namelengthsrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -453,7 +455,8 @@ an instance of :class:`plotly.graph_objs.box.Hoverlabel`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Line(_BaseTraceHierarchyType):
     _parent_path_str = "box.marker"
     _path_str = "box.marker.line"
     _valid_props = {"color", "outliercolor", "outlierwidth", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -258,7 +260,8 @@ an instance of :class:`plotly.graph_objs.box.marker.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
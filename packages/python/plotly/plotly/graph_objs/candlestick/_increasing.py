@@ -9,6 +9,8 @@ class Increasing(_BaseTraceHierarchyType):
     _parent_path_str = "candlestick"
     _path_str = "candlestick.increasing"
     _valid_props = {"fillcolor", "line"}
+    _validator_table = {}
+    __slots__ = ()
 
     # fillcolor
     # ---------
@@ -161,7 +163,8 @@ an instance of :class:`plotly.graph_objs.candlestick.Increasing`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
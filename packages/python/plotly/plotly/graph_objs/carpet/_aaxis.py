@@ -65,6 +65,8 @@ class Aaxis(_BaseTraceHierarchyType):
         "titleoffset",
         "type",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # arraydtick
     # ----------
@@ -2105,7 +2107,8 @@ an instance of :class:`plotly.graph_objs.carpet.Aaxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Font(_BaseTraceHierarchyType):
     _parent_path_str = "carpet"
     _path_str = "carpet.font"
     _valid_props = {"color", "family", "size"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -200,7 +202,8 @@ an instance of :class:`plotly.graph_objs.carpet.Font`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
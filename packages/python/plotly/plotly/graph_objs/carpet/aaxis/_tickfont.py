@@ -9,6 +9,8 @@ class Tickfont(_BaseTraceHierarchyType):
     _parent_path_str = "carpet.aaxis"
     _path_str = "carpet.aaxis.tickfont"
     _valid_props = {"color", "family", "size"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -201,7 +203,8 @@ an instance of :class:`plotly.graph_objs.carpet.aaxis.Tickfont`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Title(_BaseTraceHierarchyType):
     _parent_path_str = "choropleth.colorbar"
     _path_str = "choropleth.colorbar.title"
     _valid_props = {"font", "side", "text"}
+    _validator_table = {}
+    __slots__ = ()
 
     # font
     # ----
@@ -178,7 +180,8 @@ an instance of :class:`plotly.graph_objs.choropleth.colorbar.Title`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
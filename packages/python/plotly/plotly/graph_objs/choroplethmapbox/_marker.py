@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "choroplethmapbox"
     _path_str = "choroplethmapbox.marker"
     _valid_props = {"line", "opacity", "opacitysrc"}
+    _validator_table = {}
+    __slots__ = ()
 
     # line
     # ----
@@ -154,7 +156,8 @@ an instance of :class:`plotly.graph_objs.choroplethmapbox.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -21,6 +21,8 @@ class Contours(_BaseTraceHierarchyType):
         "type",
         "value",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # coloring
     # --------
@@ -473,7 +475,8 @@ an instance of :class:`plotly.graph_objs.contour.Contours`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
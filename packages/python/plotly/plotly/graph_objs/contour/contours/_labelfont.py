@@ -9,6 +9,8 @@ class Labelfont(_BaseTraceHierarchyType):
     _parent_path_str = "contour.contours"
     _path_str = "contour.contours.labelfont"
     _valid_props = {"color", "family", "size"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -203,7 +205,8 @@ an instance of :class:`plotly.graph_objs.contour.contours.Labelfont`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Connector(_BaseTraceHierarchyType):
     _parent_path_str = "funnel"
     _path_str = "funnel.connector"
     _valid_props = {"fillcolor", "line", "visible"}
+    _validator_table = {}
+    __slots__ = ()
 
     # fillcolor
     # ---------
@@ -183,7 +185,8 @@ an instance of :class:`plotly.graph_objs.funnel.Connector`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
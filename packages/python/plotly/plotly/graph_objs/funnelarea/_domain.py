@@ -9,6 +9,8 @@ class Domain(_BaseTraceHierarchyType):
     _parent_path_str = "funnelarea"
     _path_str = "funnelarea.domain"
     _valid_props = {"column", "row", "x", "y"}
+    _validator_table = {}
+    __slots__ = ()
 
     # column
     # ------
@@ -177,7 +179,8 @@ an instance of :class:`plotly.graph_objs.funnelarea.Domain`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
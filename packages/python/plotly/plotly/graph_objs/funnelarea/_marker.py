@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "funnelarea"
     _path_str = "funnelarea.marker"
     _valid_props = {"colors", "colorssrc", "line"}
+    _validator_table = {}
+    __slots__ = ()
 
     # colors
     # ------
@@ -154,7 +156,8 @@ an instance of :class:`plotly.graph_objs.funnelarea.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
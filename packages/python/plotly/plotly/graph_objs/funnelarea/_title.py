@@ -9,6 +9,8 @@ class Title(_BaseTraceHierarchyType):
     _parent_path_str = "funnelarea"
     _path_str = "funnelarea.title"
     _valid_props = {"font", "position", "text"}
+    _validator_table = {}
+    __slots__ = ()
 
     # font
     # ----
@@ -189,7 +191,8 @@ an instance of :class:`plotly.graph_objs.funnelarea.Title`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
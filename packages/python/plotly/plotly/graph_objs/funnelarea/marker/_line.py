@@ -9,6 +9,8 @@ class Line(_BaseTraceHierarchyType):
     _parent_path_str = "funnelarea.marker"
     _path_str = "funnelarea.marker.line"
     _valid_props = {"color", "colorsrc", "width", "widthsrc"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -205,7 +207,8 @@ an instance of :class:`plotly.graph_objs.funnelarea.marker.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
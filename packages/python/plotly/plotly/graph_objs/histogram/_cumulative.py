@@ -9,6 +9,8 @@ class Cumulative(_BaseTraceHierarchyType):
     _parent_path_str = "histogram"
     _path_str = "histogram.cumulative"
     _valid_props = {"currentbin", "direction", "enabled"}
+    _validator_table = {}
+    __slots__ = ()
 
     # currentbin
     # ----------
@@ -179,7 +181,8 @@ an instance of :class:`plotly.graph_objs.histogram.Cumulative`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
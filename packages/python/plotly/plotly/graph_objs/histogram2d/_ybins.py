@@ -9,6 +9,8 @@ class YBins(_BaseTraceHierarchyType):
     _parent_path_str = "histogram2d"
     _path_str = "histogram2d.ybins"
     _valid_props = {"end", "size", "start"}
+    _validator_table = {}
+    __slots__ = ()
 
     # end
     # ---
@@ -193,7 +195,8 @@ an instance of :class:`plotly.graph_objs.histogram2d.YBins`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
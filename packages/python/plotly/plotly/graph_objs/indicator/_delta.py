@@ -17,6 +17,8 @@ class Delta(_BaseTraceHierarchyType):
         "relative",
         "valueformat",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # decreasing
     # ----------
@@ -304,7 +306,8 @@ an instance of :class:`plotly.graph_objs.indicator.Delta`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
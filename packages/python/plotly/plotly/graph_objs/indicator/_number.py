@@ -9,6 +9,8 @@ class Number(_BaseTraceHierarchyType):
     _parent_path_str = "indicator"
     _path_str = "indicator.number"
     _valid_props = {"font", "prefix", "suffix", "valueformat"}
+    _validator_table = {}
+    __slots__ = ()
 
     # font
     # ----
@@ -193,7 +195,8 @@ an instance of :class:`plotly.graph_objs.indicator.Number`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Title(_BaseTraceHierarchyType):
     _parent_path_str = "indicator"
     _path_str = "indicator.title"
     _valid_props = {"align", "font", "text"}
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -163,7 +165,8 @@ an instance of :class:`plotly.graph_objs.indicator.Title`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Increasing(_BaseTraceHierarchyType):
     _parent_path_str = "indicator.delta"
     _path_str = "indicator.delta.increasing"
     _valid_props = {"color", "symbol"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -145,7 +147,8 @@ an instance of :class:`plotly.graph_objs.indicator.delta.Increasing`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
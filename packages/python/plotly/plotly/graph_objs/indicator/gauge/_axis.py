@@ -37,6 +37,8 @@ class Axis(_BaseTraceHierarchyType):
         "tickwidth",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # dtick
     # -----
@@ -1110,7 +1112,8 @@ an instance of :class:`plotly.graph_objs.indicator.gauge.Axis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
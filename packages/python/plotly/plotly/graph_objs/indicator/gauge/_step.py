@@ -9,6 +9,8 @@ class Step(_BaseTraceHierarchyType):
     _parent_path_str = "indicator.gauge"
     _path_str = "indicator.gauge.step"
     _valid_props = {"color", "line", "name", "range", "templateitemname", "thickness"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -315,7 +317,8 @@ an instance of :class:`plotly.graph_objs.indicator.gauge.Step`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
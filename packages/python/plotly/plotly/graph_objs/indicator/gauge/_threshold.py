@@ -9,6 +9,8 @@ class Threshold(_BaseTraceHierarchyType):
     _parent_path_str = "indicator.gauge"
     _path_str = "indicator.gauge.threshold"
     _valid_props = {"line", "thickness", "value"}
+    _validator_table = {}
+    __slots__ = ()
 
     # line
     # ----
@@ -142,7 +144,8 @@ an instance of :class:`plotly.graph_objs.indicator.gauge.Threshold`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
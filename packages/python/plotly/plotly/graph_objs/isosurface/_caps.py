@@ -9,6 +9,8 @@ class Caps(_BaseTraceHierarchyType):
     _parent_path_str = "isosurface"
     _path_str = "isosurface.caps"
     _valid_props = {"x", "y", "z"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -186,7 +188,8 @@ an instance of :class:`plotly.graph_objs.isosurface.Caps`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
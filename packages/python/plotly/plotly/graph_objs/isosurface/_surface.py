@@ -9,6 +9,8 @@ class Surface(_BaseTraceHierarchyType):
     _parent_path_str = "isosurface"
     _path_str = "isosurface.surface"
     _valid_props = {"count", "fill", "pattern", "show"}
+    _validator_table = {}
+    __slots__ = ()
 
     # count
     # -----
@@ -200,7 +202,8 @@ an instance of :class:`plotly.graph_objs.isosurface.Surface`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Y(_BaseTraceHierarchyType):
     _parent_path_str = "isosurface.slices"
     _path_str = "isosurface.slices.y"
     _valid_props = {"fill", "locations", "locationssrc", "show"}
+    _validator_table = {}
+    __slots__ = ()
 
     # fill
     # ----
@@ -184,7 +186,8 @@ an instance of :class:`plotly.graph_objs.isosurface.slices.Y`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
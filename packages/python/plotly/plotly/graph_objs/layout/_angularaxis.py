@@ -20,6 +20,8 @@ class AngularAxis(_BaseLayoutHierarchyType):
         "ticksuffix",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # domain
     # ------
@@ -425,7 +427,8 @@ an instance of :class:`plotly.graph_objs.layout.AngularAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
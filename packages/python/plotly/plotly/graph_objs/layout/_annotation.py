@@ -53,6 +53,8 @@ class Annotation(_BaseLayoutHierarchyType):
         "yref",
         "yshift",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -1761,7 +1763,8 @@ an instance of :class:`plotly.graph_objs.layout.Annotation`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
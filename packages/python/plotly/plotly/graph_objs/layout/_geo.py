@@ -42,6 +42,8 @@ class Geo(_BaseLayoutHierarchyType):
         "uirevision",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # bgcolor
     # -------
@@ -1416,7 +1418,8 @@ an instance of :class:`plotly.graph_objs.layout.Geo`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
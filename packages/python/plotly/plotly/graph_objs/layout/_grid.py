@@ -22,6 +22,8 @@ class Grid(_BaseLayoutHierarchyType):
         "ygap",
         "yside",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # columns
     # -------
@@ -539,7 +541,8 @@ an instance of :class:`plotly.graph_objs.layout.Grid`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
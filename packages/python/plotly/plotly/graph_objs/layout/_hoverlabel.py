@@ -9,6 +9,8 @@ class Hoverlabel(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.hoverlabel"
     _valid_props = {"align", "bgcolor", "bordercolor", "font", "namelength"}
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -318,7 +320,8 @@ an instance of :class:`plotly.graph_objs.layout.Hoverlabel`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
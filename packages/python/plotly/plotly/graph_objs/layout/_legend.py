@@ -27,6 +27,8 @@ class Legend(_BaseLayoutHierarchyType):
         "y",
         "yanchor",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # bgcolor
     # -------
@@ -749,7 +751,8 @@ an instance of :class:`plotly.graph_objs.layout.Legend`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
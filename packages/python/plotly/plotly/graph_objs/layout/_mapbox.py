@@ -20,6 +20,8 @@ class Mapbox(_BaseLayoutHierarchyType):
         "uirevision",
         "zoom",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # accesstoken
     # -----------
@@ -578,7 +580,8 @@ an instance of :class:`plotly.graph_objs.layout.Mapbox`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Margin(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.margin"
     _valid_props = {"autoexpand", "b", "l", "pad", "r", "t"}
+    _validator_table = {}
+    __slots__ = ()
 
     # autoexpand
     # ----------
@@ -221,7 +223,8 @@ an instance of :class:`plotly.graph_objs.layout.Margin`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Modebar(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.modebar"
     _valid_props = {"activecolor", "bgcolor", "color", "orientation", "uirevision"}
+    _validator_table = {}
+    __slots__ = ()
 
     # activecolor
     # -----------
@@ -315,7 +317,8 @@ an instance of :class:`plotly.graph_objs.layout.Modebar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
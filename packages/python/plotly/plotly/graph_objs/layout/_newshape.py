@@ -16,6 +16,8 @@ class Newshape(_BaseLayoutHierarchyType):
         "line",
         "opacity",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # drawdirection
     # -------------
@@ -313,7 +315,8 @@ an instance of :class:`plotly.graph_objs.layout.Newshape`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -20,6 +20,8 @@ class Polar(_BaseLayoutHierarchyType):
         "sector",
         "uirevision",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # angularaxis
     # -----------
@@ -979,7 +981,8 @@ an instance of :class:`plotly.graph_objs.layout.Polar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -21,6 +21,8 @@ class RadialAxis(_BaseLayoutHierarchyType):
         "ticksuffix",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # domain
     # ------
@@ -456,7 +458,8 @@ an instance of :class:`plotly.graph_objs.layout.RadialAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -23,6 +23,8 @@ class Scene(_BaseLayoutHierarchyType):
         "yaxis",
         "zaxis",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # annotations
     # -----------
@@ -1609,7 +1611,8 @@ an instance of :class:`plotly.graph_objs.layout.Scene`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -31,6 +31,8 @@ class Shape(_BaseLayoutHierarchyType):
         "yref",
         "ysizemode",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # editable
     # --------
@@ -947,7 +949,8 @@ an instance of :class:`plotly.graph_objs.layout.Shape`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -34,6 +34,8 @@ class Slider(_BaseLayoutHierarchyType):
         "y",
         "yanchor",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # active
     # ------
@@ -1075,7 +1077,8 @@ an instance of :class:`plotly.graph_objs.layout.Slider`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Template(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.template"
     _valid_props = {"data", "layout"}
+    _validator_table = {}
+    __slots__ = ()
 
     # data
     # ----
@@ -309,7 +311,8 @@ an instance of :class:`plotly.graph_objs.layout.Template`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
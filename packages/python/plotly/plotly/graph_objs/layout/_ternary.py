@@ -9,6 +9,8 @@ class Ternary(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.ternary"
     _valid_props = {"aaxis", "baxis", "bgcolor", "caxis", "domain", "sum", "uirevision"}
+    _validator_table = {}
+    __slots__ = ()
 
     # aaxis
     # -----
@@ -938,7 +940,8 @@ an instance of :class:`plotly.graph_objs.layout.Ternary`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -19,6 +19,8 @@ class Title(_BaseLayoutHierarchyType):
         "yanchor",
         "yref",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # font
     # ----
@@ -428,7 +430,8 @@ an instance of :class:`plotly.graph_objs.layout.Title`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Transition(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.transition"
     _valid_props = {"duration", "easing", "ordering"}
+    _validator_table = {}
+    __slots__ = ()
 
     # duration
     # --------
@@ -150,7 +152,8 @@ an instance of :class:`plotly.graph_objs.layout.Transition`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Uniformtext(_BaseLayoutHierarchyType):
     _parent_path_str = "layout"
     _path_str = "layout.uniformtext"
     _valid_props = {"minsize", "mode"}
+    _validator_table = {}
+    __slots__ = ()
 
     # minsize
     # -------
@@ -129,7 +131,8 @@ an instance of :class:`plotly.graph_objs.layout.Uniformtext`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
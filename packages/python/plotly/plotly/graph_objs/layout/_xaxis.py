@@ -86,6 +86,8 @@ class XAxis(_BaseLayoutHierarchyType):
         "zerolinecolor",
         "zerolinewidth",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # anchor
     # ------
@@ -3296,7 +3298,8 @@ an instance of :class:`plotly.graph_objs.layout.XAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -84,6 +84,8 @@ class YAxis(_BaseLayoutHierarchyType):
         "zerolinecolor",
         "zerolinewidth",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # anchor
     # ------
@@ -3153,7 +3155,8 @@ an instance of :class:`plotly.graph_objs.layout.YAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Center(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.geo"
     _path_str = "layout.geo.center"
     _valid_props = {"lat", "lon"}
+    _validator_table = {}
+    __slots__ = ()
 
     # lat
     # ---
@@ -120,7 +122,8 @@ an instance of :class:`plotly.graph_objs.layout.geo.Center`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Lonaxis(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.geo"
     _path_str = "layout.geo.lonaxis"
     _valid_props = {"dtick", "gridcolor", "gridwidth", "range", "showgrid", "tick0"}
+    _validator_table = {}
+    __slots__ = ()
 
     # dtick
     # -----
@@ -258,7 +260,8 @@ an instance of :class:`plotly.graph_objs.layout.geo.Lonaxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Projection(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.geo"
     _path_str = "layout.geo.projection"
     _valid_props = {"parallels", "rotation", "scale", "type"}
+    _validator_table = {}
+    __slots__ = ()
 
     # parallels
     # ---------
@@ -191,7 +193,8 @@ an instance of :class:`plotly.graph_objs.layout.geo.Projection`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
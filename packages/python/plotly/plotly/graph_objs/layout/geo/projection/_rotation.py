@@ -9,6 +9,8 @@ class Rotation(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.geo.projection"
     _path_str = "layout.geo.projection.rotation"
     _valid_props = {"lat", "lon", "roll"}
+    _validator_table = {}
+    __slots__ = ()
 
     # lat
     # ---
@@ -135,7 +137,8 @@ an instance of :class:`plotly.graph_objs.layout.geo.projection.Rotation`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
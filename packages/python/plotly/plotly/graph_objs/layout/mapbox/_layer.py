@@ -28,6 +28,8 @@ class Layer(_BaseLayoutHierarchyType):
         "type",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # below
     # -----
@@ -810,7 +812,8 @@ an instance of :class:`plotly.graph_objs.layout.mapbox.Layer`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Circle(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.mapbox.layer"
     _path_str = "layout.mapbox.layer.circle"
     _valid_props = {"radius"}
+    _validator_table = {}
+    __slots__ = ()
 
     # radius
     # ------
@@ -86,7 +88,8 @@ an instance of :class:`plotly.graph_objs.layout.mapbox.layer.Circle`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
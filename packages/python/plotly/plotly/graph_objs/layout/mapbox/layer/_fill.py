@@ -9,6 +9,8 @@ class Fill(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.mapbox.layer"
     _path_str = "layout.mapbox.layer.fill"
     _valid_props = {"outlinecolor"}
+    _validator_table = {}
+    __slots__ = ()
 
     # outlinecolor
     # ------------
@@ -125,7 +127,8 @@ an instance of :class:`plotly.graph_objs.layout.mapbox.layer.Fill`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Symbol(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.mapbox.layer"
     _path_str = "layout.mapbox.layer.symbol"
     _valid_props = {"icon", "iconsize", "placement", "text", "textfont", "textposition"}
+    _validator_table = {}
+    __slots__ = ()
 
     # icon
     # ----
@@ -277,7 +279,8 @@ an instance of :class:`plotly.graph_objs.layout.mapbox.layer.Symbol`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
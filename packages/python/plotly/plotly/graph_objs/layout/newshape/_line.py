@@ -9,6 +9,8 @@ class Line(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.newshape"
     _path_str = "layout.newshape.line"
     _valid_props = {"color", "dash", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -183,7 +185,8 @@ an instance of :class:`plotly.graph_objs.layout.newshape.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -54,6 +54,8 @@ class AngularAxis(_BaseLayoutHierarchyType):
         "uirevision",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # categoryarray
     # -------------
@@ -1822,7 +1824,8 @@ an instance of :class:`plotly.graph_objs.layout.polar.AngularAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Title(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.polar.radialaxis"
     _path_str = "layout.polar.radialaxis.title"
     _valid_props = {"font", "text"}
+    _validator_table = {}
+    __slots__ = ()
 
     # font
     # ----
@@ -145,7 +147,8 @@ an instance of :class:`plotly.graph_objs.layout.polar.radialaxis.Title`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -47,6 +47,8 @@ class Annotation(_BaseLayoutHierarchyType):
         "yshift",
         "z",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -1426,7 +1428,8 @@ an instance of :class:`plotly.graph_objs.layout.scene.Annotation`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
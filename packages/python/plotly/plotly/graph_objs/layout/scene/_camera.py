@@ -9,6 +9,8 @@ class Camera(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.scene"
     _path_str = "layout.scene.camera"
     _valid_props = {"center", "eye", "projection", "up"}
+    _validator_table = {}
+    __slots__ = ()
 
     # center
     # ------
@@ -221,7 +223,8 @@ an instance of :class:`plotly.graph_objs.layout.scene.Camera`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -65,6 +65,8 @@ class XAxis(_BaseLayoutHierarchyType):
         "zerolinecolor",
         "zerolinewidth",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autorange
     # ---------
@@ -2325,7 +2327,8 @@ an instance of :class:`plotly.graph_objs.layout.scene.XAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Eye(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.scene.camera"
     _path_str = "layout.scene.camera.eye"
     _valid_props = {"x", "y", "z"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -127,7 +129,8 @@ an instance of :class:`plotly.graph_objs.layout.scene.camera.Eye`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
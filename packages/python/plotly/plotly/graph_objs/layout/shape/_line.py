@@ -9,6 +9,8 @@ class Line(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.shape"
     _path_str = "layout.shape.line"
     _valid_props = {"color", "dash", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -180,7 +182,8 @@ an instance of :class:`plotly.graph_objs.layout.shape.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Currentvalue(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.slider"
     _path_str = "layout.slider.currentvalue"
     _valid_props = {"font", "offset", "prefix", "suffix", "visible", "xanchor"}
+    _validator_table = {}
+    __slots__ = ()
 
     # font
     # ----
@@ -252,7 +254,8 @@ an instance of :class:`plotly.graph_objs.layout.slider.Currentvalue`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
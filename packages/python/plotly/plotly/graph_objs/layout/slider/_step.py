@@ -18,6 +18,8 @@ class Step(_BaseLayoutHierarchyType):
         "value",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # args
     # ----
@@ -365,7 +367,8 @@ an instance of :class:`plotly.graph_objs.layout.slider.Step`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
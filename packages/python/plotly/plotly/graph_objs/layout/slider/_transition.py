@@ -9,6 +9,8 @@ class Transition(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.slider"
     _path_str = "layout.slider.transition"
     _valid_props = {"duration", "easing"}
+    _validator_table = {}
+    __slots__ = ()
 
     # duration
     # --------
@@ -114,7 +116,8 @@ an instance of :class:`plotly.graph_objs.layout.slider.Transition`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -57,6 +57,8 @@ class Data(_BaseLayoutHierarchyType):
         "volume",
         "waterfall",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # area
     # ----
@@ -1523,7 +1525,8 @@ an instance of :class:`plotly.graph_objs.layout.template.Data`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
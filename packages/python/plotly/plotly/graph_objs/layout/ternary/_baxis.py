@@ -48,6 +48,8 @@ class Baxis(_BaseLayoutHierarchyType):
         "titlefont",
         "uirevision",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -1628,7 +1630,8 @@ an instance of :class:`plotly.graph_objs.layout.ternary.Baxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
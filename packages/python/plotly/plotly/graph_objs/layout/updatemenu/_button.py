@@ -18,6 +18,8 @@ class Button(_BaseLayoutHierarchyType):
         "templateitemname",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # args
     # ----
@@ -370,7 +372,8 @@ an instance of :class:`plotly.graph_objs.layout.updatemenu.Button`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
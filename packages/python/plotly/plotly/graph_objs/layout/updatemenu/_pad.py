@@ -9,6 +9,8 @@ class Pad(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.updatemenu"
     _path_str = "layout.updatemenu.pad"
     _valid_props = {"b", "l", "r", "t"}
+    _validator_table = {}
+    __slots__ = ()
 
     # b
     # -
@@ -166,7 +168,8 @@ an instance of :class:`plotly.graph_objs.layout.updatemenu.Pad`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
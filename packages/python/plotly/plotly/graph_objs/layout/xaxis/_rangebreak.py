@@ -17,6 +17,8 @@ class Rangebreak(_BaseLayoutHierarchyType):
         "templateitemname",
         "values",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # bounds
     # ------
@@ -340,7 +342,8 @@ an instance of :class:`plotly.graph_objs.layout.xaxis.Rangebreak`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
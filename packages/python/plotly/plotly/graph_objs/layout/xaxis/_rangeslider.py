@@ -18,6 +18,8 @@ class Rangeslider(_BaseLayoutHierarchyType):
         "visible",
         "yaxis",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # autorange
     # ---------
@@ -406,7 +408,8 @@ an instance of :class:`plotly.graph_objs.layout.xaxis.Rangeslider`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
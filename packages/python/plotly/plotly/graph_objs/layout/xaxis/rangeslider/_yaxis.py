@@ -9,6 +9,8 @@ class YAxis(_BaseLayoutHierarchyType):
     _parent_path_str = "layout.xaxis.rangeslider"
     _path_str = "layout.xaxis.rangeslider.yaxis"
     _valid_props = {"range", "rangemode"}
+    _validator_table = {}
+    __slots__ = ()
 
     # range
     # -----
@@ -123,7 +125,8 @@ an instance of :class:`plotly.graph_objs.layout.xaxis.rangeslider.YAxis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
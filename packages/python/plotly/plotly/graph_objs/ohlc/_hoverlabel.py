@@ -20,6 +20,8 @@ class Hoverlabel(_BaseTraceHierarchyType):
         "namelengthsrc",
         "split",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -482,7 +484,8 @@ an instance of :class:`plotly.graph_objs.ohlc.Hoverlabel`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Line(_BaseTraceHierarchyType):
     _parent_path_str = "ohlc"
     _path_str = "ohlc.line"
     _valid_props = {"dash", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # dash
     # ----
@@ -128,7 +130,8 @@ an instance of :class:`plotly.graph_objs.ohlc.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
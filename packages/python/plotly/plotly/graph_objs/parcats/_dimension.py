@@ -20,6 +20,8 @@ class Dimension(_BaseTraceHierarchyType):
         "valuessrc",
         "visible",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # categoryarray
     # -------------
@@ -396,7 +398,8 @@ an instance of :class:`plotly.graph_objs.parcats.Dimension`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "pie"
     _path_str = "pie.marker"
     _valid_props = {"colors", "colorssrc", "line"}
+    _validator_table = {}
+    __slots__ = ()
 
     # colors
     # ------
@@ -153,7 +155,8 @@ an instance of :class:`plotly.graph_objs.pie.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
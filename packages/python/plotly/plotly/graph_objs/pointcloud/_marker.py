@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "pointcloud"
     _path_str = "pointcloud.marker"
     _valid_props = {"blend", "border", "color", "opacity", "sizemax", "sizemin"}
+    _validator_table = {}
+    __slots__ = ()
 
     # blend
     # -----
@@ -305,7 +307,8 @@ an instance of :class:`plotly.graph_objs.pointcloud.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
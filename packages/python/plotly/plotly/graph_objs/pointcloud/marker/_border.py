@@ -9,6 +9,8 @@ class Border(_BaseTraceHierarchyType):
     _parent_path_str = "pointcloud.marker"
     _path_str = "pointcloud.marker.border"
     _valid_props = {"arearatio", "color"}
+    _validator_table = {}
+    __slots__ = ()
 
     # arearatio
     # ---------
@@ -155,7 +157,8 @@ an instance of :class:`plotly.graph_objs.pointcloud.marker.Border`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
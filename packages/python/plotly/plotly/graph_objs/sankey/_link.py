@@ -29,6 +29,8 @@ class Link(_BaseTraceHierarchyType):
         "value",
         "valuesrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -825,7 +827,8 @@ an instance of :class:`plotly.graph_objs.sankey.Link`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -28,6 +28,8 @@ class Node(_BaseTraceHierarchyType):
         "y",
         "ysrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -742,7 +744,8 @@ an instance of :class:`plotly.graph_objs.sankey.Node`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Colorscale(_BaseTraceHierarchyType):
     _parent_path_str = "sankey.link"
     _path_str = "sankey.link.colorscale"
     _valid_props = {"cmax", "cmin", "colorscale", "label", "name", "templateitemname"}
+    _validator_table = {}
+    __slots__ = ()
 
     # cmax
     # ----
@@ -312,7 +314,8 @@ an instance of :class:`plotly.graph_objs.sankey.link.Colorscale`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
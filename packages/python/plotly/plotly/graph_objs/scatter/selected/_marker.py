@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "scatter.selected"
     _path_str = "scatter.selected.marker"
     _valid_props = {"color", "opacity", "size"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -168,7 +170,8 @@ an instance of :class:`plotly.graph_objs.scatter.selected.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Projection(_BaseTraceHierarchyType):
     _parent_path_str = "scatter3d"
     _path_str = "scatter3d.projection"
     _valid_props = {"x", "y", "z"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -171,7 +173,8 @@ an instance of :class:`plotly.graph_objs.scatter3d.Projection`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Y(_BaseTraceHierarchyType):
     _parent_path_str = "scatter3d.projection"
     _path_str = "scatter3d.projection.y"
     _valid_props = {"opacity", "scale", "show"}
+    _validator_table = {}
+    __slots__ = ()
 
     # opacity
     # -------
@@ -134,7 +136,8 @@ an instance of :class:`plotly.graph_objs.scatter3d.projection.Y`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
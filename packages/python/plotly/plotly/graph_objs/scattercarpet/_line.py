@@ -9,6 +9,8 @@ class Line(_BaseTraceHierarchyType):
     _parent_path_str = "scattercarpet"
     _path_str = "scattercarpet.line"
     _valid_props = {"color", "dash", "shape", "smoothing", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -250,7 +252,8 @@ an instance of :class:`plotly.graph_objs.scattercarpet.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Gradient(_BaseTraceHierarchyType):
     _parent_path_str = "scattercarpet.marker"
     _path_str = "scattercarpet.marker.gradient"
     _valid_props = {"color", "colorsrc", "type", "typesrc"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -206,7 +208,8 @@ an instance of :class:`plotly.graph_objs.scattercarpet.marker.Gradient`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
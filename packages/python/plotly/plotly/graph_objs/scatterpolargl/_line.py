@@ -9,6 +9,8 @@ class Line(_BaseTraceHierarchyType):
     _parent_path_str = "scatterpolargl"
     _path_str = "scatterpolargl.line"
     _valid_props = {"color", "dash", "shape", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -200,7 +202,8 @@ an instance of :class:`plotly.graph_objs.scatterpolargl.Line`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Diagonal(_BaseTraceHierarchyType):
     _parent_path_str = "splom"
     _path_str = "splom.diagonal"
     _valid_props = {"visible"}
+    _validator_table = {}
+    __slots__ = ()
 
     # visible
     # -------
@@ -84,7 +86,8 @@ an instance of :class:`plotly.graph_objs.splom.Diagonal`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
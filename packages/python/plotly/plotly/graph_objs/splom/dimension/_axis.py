@@ -9,6 +9,8 @@ class Axis(_BaseTraceHierarchyType):
     _parent_path_str = "splom.dimension"
     _path_str = "splom.dimension.axis"
     _valid_props = {"matches", "type"}
+    _validator_table = {}
+    __slots__ = ()
 
     # matches
     # -------
@@ -120,7 +122,8 @@ an instance of :class:`plotly.graph_objs.splom.dimension.Axis`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
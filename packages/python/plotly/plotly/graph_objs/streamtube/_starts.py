@@ -9,6 +9,8 @@ class Starts(_BaseTraceHierarchyType):
     _parent_path_str = "streamtube"
     _path_str = "streamtube.starts"
     _valid_props = {"x", "xsrc", "y", "ysrc", "z", "zsrc"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -226,7 +228,8 @@ an instance of :class:`plotly.graph_objs.streamtube.Starts`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
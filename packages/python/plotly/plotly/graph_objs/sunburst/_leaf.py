@@ -9,6 +9,8 @@ class Leaf(_BaseTraceHierarchyType):
     _parent_path_str = "sunburst"
     _path_str = "sunburst.leaf"
     _valid_props = {"opacity"}
+    _validator_table = {}
+    __slots__ = ()
 
     # opacity
     # -------
@@ -83,7 +85,8 @@ an instance of :class:`plotly.graph_objs.sunburst.Leaf`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Contours(_BaseTraceHierarchyType):
     _parent_path_str = "surface"
     _path_str = "surface.contours"
     _valid_props = {"x", "y", "z"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -246,7 +248,8 @@ an instance of :class:`plotly.graph_objs.surface.Contours`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
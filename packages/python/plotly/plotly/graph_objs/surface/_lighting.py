@@ -9,6 +9,8 @@ class Lighting(_BaseTraceHierarchyType):
     _parent_path_str = "surface"
     _path_str = "surface.lighting"
     _valid_props = {"ambient", "diffuse", "fresnel", "roughness", "specular"}
+    _validator_table = {}
+    __slots__ = ()
 
     # ambient
     # -------
@@ -206,7 +208,8 @@ an instance of :class:`plotly.graph_objs.surface.Lighting`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Lightposition(_BaseTraceHierarchyType):
     _parent_path_str = "surface"
     _path_str = "surface.lightposition"
     _valid_props = {"x", "y", "z"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -135,7 +137,8 @@ an instance of :class:`plotly.graph_objs.surface.Lightposition`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -21,6 +21,8 @@ class Y(_BaseTraceHierarchyType):
         "usecolormap",
         "width",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -467,7 +469,8 @@ an instance of :class:`plotly.graph_objs.surface.contours.Y`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
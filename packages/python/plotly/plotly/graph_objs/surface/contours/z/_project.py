@@ -9,6 +9,8 @@ class Project(_BaseTraceHierarchyType):
     _parent_path_str = "surface.contours.z"
     _path_str = "surface.contours.z.project"
     _valid_props = {"x", "y", "z"}
+    _validator_table = {}
+    __slots__ = ()
 
     # x
     # -
@@ -162,7 +164,8 @@ an instance of :class:`plotly.graph_objs.surface.contours.z.Project`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
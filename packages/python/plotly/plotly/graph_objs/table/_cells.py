@@ -24,6 +24,8 @@ class Cells(_BaseTraceHierarchyType):
         "values",
         "valuessrc",
     }
+    _validator_table = {}
+    __slots__ = ()
 
     # align
     # -----
@@ -537,7 +539,8 @@ an instance of :class:`plotly.graph_objs.table.Cells`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
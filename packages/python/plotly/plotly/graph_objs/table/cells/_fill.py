@@ -9,6 +9,8 @@ class Fill(_BaseTraceHierarchyType):
     _parent_path_str = "table.cells"
     _path_str = "table.cells.fill"
     _valid_props = {"color", "colorsrc"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -150,7 +152,8 @@ an instance of :class:`plotly.graph_objs.table.cells.Fill`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Pathbar(_BaseTraceHierarchyType):
     _parent_path_str = "treemap"
     _path_str = "treemap.pathbar"
     _valid_props = {"edgeshape", "side", "textfont", "thickness", "visible"}
+    _validator_table = {}
+    __slots__ = ()
 
     # edgeshape
     # ---------
@@ -241,7 +243,8 @@ an instance of :class:`plotly.graph_objs.treemap.Pathbar`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
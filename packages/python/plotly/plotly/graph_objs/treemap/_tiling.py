@@ -9,6 +9,8 @@ class Tiling(_BaseTraceHierarchyType):
     _parent_path_str = "treemap"
     _path_str = "treemap.tiling"
     _valid_props = {"flip", "packing", "pad", "squarifyratio"}
+    _validator_table = {}
+    __slots__ = ()
 
     # flip
     # ----
@@ -199,7 +201,8 @@ an instance of :class:`plotly.graph_objs.treemap.Tiling`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Pad(_BaseTraceHierarchyType):
     _parent_path_str = "treemap.marker"
     _path_str = "treemap.marker.pad"
     _valid_props = {"b", "l", "r", "t"}
+    _validator_table = {}
+    __slots__ = ()
 
     # b
     # -
@@ -153,7 +155,8 @@ an instance of :class:`plotly.graph_objs.treemap.marker.Pad`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Box(_BaseTraceHierarchyType):
     _parent_path_str = "violin"
     _path_str = "violin.box"
     _valid_props = {"fillcolor", "line", "visible", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # fillcolor
     # ---------
@@ -212,7 +214,8 @@ an instance of :class:`plotly.graph_objs.violin.Box`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class Meanline(_BaseTraceHierarchyType):
     _parent_path_str = "violin"
     _path_str = "violin.meanline"
     _valid_props = {"color", "visible", "width"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -179,7 +181,8 @@ an instance of :class:`plotly.graph_objs.violin.Meanline`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
@@ -9,6 +9,8 @@ class X(_BaseTraceHierarchyType):
     _parent_path_str = "volume.caps"
     _path_str = "volume.caps.x"
     _valid_props = {"fill", "show"}
+    _validator_table = {}
+    __slots__ = ()
 
     # fill
     # ----
@@ -126,7 +128,8 @@ an instance of :class:`plotly.graph_objs.volume.caps.X`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
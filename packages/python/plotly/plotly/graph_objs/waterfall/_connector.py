@@ -9,6 +9,8 @@ class Connector(_BaseTraceHierarchyType):
     _parent_path_str = "waterfall"
     _path_str = "waterfall.connector"
     _valid_props = {"line", "mode", "visible"}
+    _validator_table = {}
+    __slots__ = ()
 
     # line
     # ----
@@ -145,7 +147,8 @@ an instance of :class:`plotly.graph_objs.waterfall.Connector`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
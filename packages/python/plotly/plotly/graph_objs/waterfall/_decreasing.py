@@ -9,6 +9,8 @@ class Decreasing(_BaseTraceHierarchyType):
     _parent_path_str = "waterfall"
     _path_str = "waterfall.decreasing"
     _valid_props = {"marker"}
+    _validator_table = {}
+    __slots__ = ()
 
     # marker
     # ------
@@ -93,7 +95,8 @@ an instance of :class:`plotly.graph_objs.waterfall.Decreasing`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
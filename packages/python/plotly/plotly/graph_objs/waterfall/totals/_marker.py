@@ -9,6 +9,8 @@ class Marker(_BaseTraceHierarchyType):
     _parent_path_str = "waterfall.totals"
     _path_str = "waterfall.totals.marker"
     _valid_props = {"color", "line"}
+    _validator_table = {}
+    __slots__ = ()
 
     # color
     # -----
@@ -159,7 +161,8 @@ an instance of :class:`plotly.graph_objs.waterfall.totals.Marker`"""
         # Handle skip_invalid
         # -------------------
         self._skip_invalid = kwargs.pop("skip_invalid", False)
-        self._validate = kwargs.pop("_validate", True)
+        # Objects constructed in a trusted() context are never validated
+        self._validate = kwargs.pop("_validate", True) and self._validate
 
         # Populate data dict with properties
         # ----------------------------------
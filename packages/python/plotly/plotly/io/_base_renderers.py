@@ -89,7 +89,8 @@ class PlotlyRenderer(MimetypeRenderer):
     def to_mimebundle(self, fig_dict):
         config = _get_jconfig(self.config)
         if config:
-            fig_dict["config"] = config
+            # fig_dict may be read-only, so add config to a shallow copy
+            fig_dict = dict(fig_dict, config=config)
 
         json_compatible_fig_dict = json.loads(
             to_json(fig_dict, validate=False, remove_uids=False)
@@ -5,7 +5,7 @@ import webbrowser
 
 import six
 
-from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._utils import validate_coerce_fig_to_dict, encode_binary_arrays
 from plotly.offline.offline import _get_jconfig, get_plotlyjs
 from plotly import utils
 
@@ -22,6 +22,54 @@ _mathjax_config = """\
 if (window.MathJax) {MathJax.Hub.Config({SVG: {font: "STIX-Web"}});}\
 </script>"""
 
+# Function that converts the binary array specs produced by
+# to_html(..., binary_arrays=True) into JavaScript typed arrays. Arrays with
+# more than one dimension are converted to nested arrays of typed arrays.
+_decode_binary_arrays_js = """
+                function plotlyDecodeBinaryArrays(obj) {
+                    var typedArrays = {
+                        i1: Int8Array, u1: Uint8Array, i2: Int16Array,
+                        u2: Uint16Array, i4: Int32Array, u4: Uint32Array,
+                        f4: Float32Array, f8: Float64Array
+                    };
+                    if (Array.isArray(obj)) {
+                        return obj.map(plotlyDecodeBinaryArrays);
+                    } else if (obj === null || typeof obj !== 'object') {
+                        return obj;
+                    } else if (typeof obj.bdata === 'string' && typedArrays[obj.dtype]) {
+                        var bytes = atob(obj.bdata);
+                        var buffer = new Uint8Array(bytes.length);
+                        for (var i = 0; i < bytes.length; i++) {
+                            buffer[i] = bytes.charCodeAt(i);
+                        }
+                        var values = new typedArrays[obj.dtype](buffer.buffer);
+                        var shape = obj.shape || [values.length];
+                        var nest = function(offset, dim) {
+                            if (dim >= shape.length - 1) {
+                                return values.subarray(offset, offset + (shape[dim] || 1));
+                            }
+                            var stride = 1;
+                            for (var d = dim + 1; d < shape.length; d++) {
+                                stride *= shape[d];
+                            }
+                            var rows = [];
+                            for (var j = 0; j < shape[dim]; j++) {
+                                rows.push(nest(offset + j * stride, dim + 1));
+                            }
+                            return rows;
+                        };
+                        return nest(0, 0);
+                    } else {
+                        var res = {};
+                        for (var key in obj) {
+                            if (obj.hasOwnProperty(key)) {
+                                res[key] = plotlyDecodeBinaryArrays(obj[key]);
+                            }
+                        }
+                        return res;
+                    }
+                }"""
+
 
 def to_html(
     fig,
@@ -35,6 +83,7 @@ def to_html(
     default_width="100%",
     default_height="100%",
     validate=True,
+    binary_arrays=False,
 ):
     """
     Convert a figure to an HTML string representation.
@@ -121,6 +170,11 @@ def to_html(
     validate: bool (default True)
         True if the figure should be validated before being converted to
         JSON, False otherwise.
+    binary_arrays: bool (default False)
+        True if numeric numpy arrays should be embedded as base64 encoded
+        binary data, which is decoded into JavaScript typed arrays in the
+        browser. This reduces the size of HTML files containing large numeric
+        arrays. False if they should be embedded as JSON arrays of numbers.
     Returns
     -------
     str
@@ -130,6 +184,10 @@ def to_html(
     # ## Validate figure ##
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
 
+    # ## Encode numeric arrays as binary array specs ##
+    if binary_arrays:
+        fig_dict = encode_binary_arrays(fig_dict)
+
     # ## Generate div id ##
     plotdivid = str(uuid.uuid4())
 
@@ -146,6 +204,16 @@ def to_html(
     else:
         jframes = None
 
+    # Decode binary array specs into typed arrays in the browser
+    if binary_arrays:
+        decode_script = _decode_binary_arrays_js
+        jdata = "plotlyDecodeBinaryArrays({data})".format(data=jdata)
+        jlayout = "plotlyDecodeBinaryArrays({layout})".format(layout=jlayout)
+        if jframes:
+            jframes = "plotlyDecodeBinaryArrays({frames})".format(frames=jframes)
+    else:
+        decode_script = ""
+
     # ## Serialize figure config ##
     config = _get_jconfig(config)
 
@@ -230,7 +298,7 @@ def to_html(
     # Serialize config dict to JSON
     jconfig = json.dumps(config)
 
-    script = """
+    script = """{decode_script}
                 if (document.getElementById("{id}")) {{
                     Plotly.newPlot(
                         '{id}',
@@ -239,6 +307,7 @@ def to_html(
                         {config}
                     ){then_addframes}{then_animate}{then_post_script}
                 }}""".format(
+        decode_script=decode_script,
         id=plotdivid,
         data=jdata,
         layout=jlayout,
@@ -391,6 +460,7 @@ def write_html(
     default_width="100%",
     default_height="100%",
     auto_open=False,
+    binary_arrays=False,
 ):
     """
     Write a figure to an HTML file representation
@@ -498,6 +568,10 @@ def write_html(
     auto_open: bool (default True
         If True, open the saved file in a web browser after saving.
         This argument only applies if `full_html` is True.
+    binary_arrays: bool (default False)
+        True if numeric numpy arrays should be embedded as base64 encoded
+        binary data, which is decoded into JavaScript typed arrays in the
+        browser. False if they should be embedded as JSON arrays of numbers.
     Returns
     -------
     str
@@ -517,6 +591,7 @@ def write_html(
         default_width=default_width,
         default_height=default_height,
         validate=validate,
+        binary_arrays=binary_arrays,
     )
 
     # Check if file is a string
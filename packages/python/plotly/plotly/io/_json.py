@@ -1,13 +1,211 @@
 from __future__ import absolute_import
 
 from six import string_types
+import gzip
 import json
 
 
-from plotly.io._utils import validate_coerce_fig_to_dict, validate_coerce_output_type
+from plotly.io._utils import (
+    validate_coerce_fig_to_dict,
+    validate_coerce_output_type,
+    encode_binary_arrays,
+    decode_binary_arrays,
+)
+from _plotly_utils.optional_imports import get_module
+from _plotly_utils.utils import datetime64_array_to_list
 
 
-def to_json(fig, validate=True, pretty=False, remove_uids=True):
+class JsonConfig(object):
+    """
+    Singleton object containing the current user defined configuration
+    properties for JSON serialization
+    """
+
+    _valid_engines = ("json", "orjson", "auto")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all JSON configuration properties to their default values
+        """
+        self._default_engine = "json"
+
+    @property
+    def default_engine(self):
+        """
+        The JSON encoding engine used when the `engine` argument to
+        `plotly.io.to_json` and related functions is not specified.
+        One of:
+          - "json": Use the json module from the Python standard library
+          - "orjson": Use the orjson package
+          - "auto": Use orjson if it is installed, otherwise use json
+
+        Returns
+        -------
+        str
+        """
+        return self._default_engine
+
+    @default_engine.setter
+    def default_engine(self, val):
+        if val not in JsonConfig._valid_engines:
+            raise ValueError(
+                "Supported JSON engines include {valid}\n"
+                "    Received {val}".format(valid=JsonConfig._valid_engines, val=val)
+            )
+
+        if val == "orjson":
+            validate_orjson()
+
+        self._default_engine = val
+
+
+config = JsonConfig()
+
+
+def validate_orjson():
+    orjson = get_module("orjson")
+    if orjson is None:
+        raise ValueError(
+            """
+The "orjson" JSON engine requires the orjson package,
+which can be installed using pip:
+    $ pip install orjson
+"""
+        )
+    return orjson
+
+
+def validate_coerce_engine(engine):
+    """
+    Resolve an engine argument to either "json" or "orjson"
+
+    Parameters
+    ----------
+    engine: str or None
+        One of "json", "orjson", "auto" or None. If None, the value of
+        `plotly.io.json.config.default_engine` is used
+
+    Returns
+    -------
+    str
+    """
+    if engine is None:
+        engine = config.default_engine
+
+    if engine == "auto":
+        engine = "orjson" if get_module("orjson") is not None else "json"
+    elif engine not in JsonConfig._valid_engines:
+        raise ValueError(
+            "Invalid JSON engine specified: {engine}".format(engine=repr(engine))
+        )
+
+    return engine
+
+
+def _orjson_compatible(obj):
+    """
+    Return a version of obj in which numpy datetime64 and timedelta64 arrays
+    are replaced by lists, so that orjson serializes them the same way as
+    PlotlyJSONEncoder (orjson encodes NaT as the Unix epoch). datetime64
+    arrays are replaced by lists of date strings.
+
+    Only dicts and lists/tuples of dicts are traversed, and obj is returned
+    as-is if nothing needs to be replaced.
+    """
+    np = get_module("numpy", should_load=False)
+    if not np:
+        return obj
+
+    if isinstance(obj, dict):
+        res = None
+        for k, v in obj.items():
+            new_v = _orjson_compatible(v)
+            if new_v is not v:
+                if res is None:
+                    res = dict(obj)
+                res[k] = new_v
+        return obj if res is None else res
+    elif isinstance(obj, (list, tuple)) and obj and isinstance(obj[0], dict):
+        new_obj = [_orjson_compatible(v) for v in obj]
+        if any(new_v is not v for new_v, v in zip(new_obj, obj)):
+            return new_obj
+        return obj
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind == "M":
+        return datetime64_array_to_list(obj)
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind == "m":
+        return obj.tolist()
+    else:
+        return obj
+
+
+def to_json_plotly(plotly_object, pretty=False, engine=None, sort_keys=True):
+    """
+    Convert a plotly/Dash object to a JSON string representation
+
+    Parameters
+    ----------
+    plotly_object:
+        A plotly/Dash object represented as a dict, graph_object, or Dash component
+
+    pretty: bool (default False)
+        True if JSON representation should be pretty-printed, False if
+        representation should be as compact as possible.
+
+    engine: str (default None)
+        The JSON encoding engine to use. One of:
+          - "json" for an encoder based on the built-in Python json module
+          - "orjson" for a fast encoder that requires the orjson package
+          - "auto" for the "orjson" encoder if available, otherwise "json"
+        If not specified, the default engine is set to the current value of
+        plotly.io.json.config.default_engine.
+
+    sort_keys: bool (default True)
+        True if the keys of dictionaries should be sorted
+
+    Returns
+    -------
+    str
+        Representation of input object as a JSON string
+    """
+    from _plotly_utils.utils import PlotlyJSONEncoder
+
+    engine = validate_coerce_engine(engine)
+
+    if engine == "json":
+        opts = {"sort_keys": sort_keys}
+        if pretty:
+            opts["indent"] = 2
+        else:
+            # Remove all whitespace
+            opts["separators"] = (",", ":")
+
+        return json.dumps(plotly_object, cls=PlotlyJSONEncoder, **opts)
+    else:
+        orjson = validate_orjson()
+
+        # orjson serializes numpy arrays, numpy scalars, datetimes and dates
+        # natively and writes non-finite floats as null. All other objects
+        # (Timestamp, NaT, graph objects, non-contiguous arrays, ...) are
+        # passed to PlotlyJSONEncoder.default
+        opts = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        if pretty:
+            opts |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(
+            _orjson_compatible(plotly_object),
+            default=PlotlyJSONEncoder().default,
+            option=opts,
+        ).decode("utf8")
+
+
+def to_json(
+    fig, validate=True, pretty=False, remove_uids=True, engine=None, binary_arrays=False
+):
     """
     Convert a figure to a JSON string representation
 
@@ -27,36 +225,151 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True):
     remove_uids: bool (default True)
         True if trace UIDs should be omitted from the JSON representation
 
+    engine: str (default None)
+        The JSON encoding engine to use. One of:
+          - "json" for an encoder based on the built-in Python json module
+          - "orjson" for a fast encoder that requires the orjson package
+          - "auto" for the "orjson" encoder if available, otherwise "json"
+        If not specified, the default engine is set to the current value of
+        plotly.io.json.config.default_engine.
+
+    binary_arrays: bool (default False)
+        True if numeric numpy arrays should be encoded as base64 binary
+        array specs of the form {"dtype": str, "shape": list, "bdata": str},
+        False if they should be encoded as JSON arrays of numbers.
+        Binary array specs are decoded by `plotly.io.from_json`.
+
     Returns
     -------
     str
         Representation of figure as a JSON string
     """
-    from _plotly_utils.utils import PlotlyJSONEncoder
+    fig_dict = _to_json_fig_dict(fig, validate, remove_uids, binary_arrays)
+
+    # Dump to a JSON string and return
+    # --------------------------------
+    return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+
 
+def _to_json_fig_dict(fig, validate, remove_uids, binary_arrays):
+    """
+    Build the figure dict that is serialized by to_json and write_json
+    """
     # Validate figure
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
 
     # Remove trace uid
     # ----------------
-    if remove_uids:
-        for trace in fig_dict.get("data", []):
-            trace.pop("uid", None)
+    # fig_dict must not be modified, so build new trace dicts without the uid
+    if remove_uids and "data" in fig_dict:
+        fig_dict = dict(
+            fig_dict,
+            data=[
+                {k: v for k, v in trace.items() if k != "uid"}
+                for trace in fig_dict["data"]
+            ],
+        )
+
+    # Encode numeric arrays as binary array specs
+    # ------------------------------------------
+    if binary_arrays:
+        fig_dict = encode_binary_arrays(fig_dict)
+
+    return fig_dict
+
+
+# Maximum number of array elements that are encoded at once when streaming
+_json_chunk_size = 10000
+
+# Minimum number of characters buffered before each write when streaming
+_json_write_size = 1 << 16
 
-    # Dump to a JSON string and return
-    # --------------------------------
-    opts = {"sort_keys": True}
-    if pretty:
-        opts["indent"] = 2
-    else:
-        # Remove all whitespace
-        opts["separators"] = (",", ":")
 
-    return json.dumps(fig_dict, cls=PlotlyJSONEncoder, **opts)
+def _iter_json_chunks(obj, encode, pretty, level=0):
+    """
+    Encode obj as JSON incrementally, yielding strings whose concatenation
+    is equal to encode(obj)
 
+    Dicts, and lists that contain dicts, are traversed. Other lists and
+    arrays are encoded in slices of at most _json_chunk_size elements, and
+    all other values are passed to encode.
 
-def write_json(fig, file, validate=True, pretty=False, remove_uids=True):
+    Parameters
+    ----------
+    obj
+        Object to encode
+    encode: callable
+        Function that encodes an object to a JSON string
+    pretty: bool
+        True if encode pretty-prints with an indent of 2, False if encode
+        produces compact JSON
+    level: int
+        Nesting level of obj
+    """
+    np = get_module("numpy", should_load=False)
+    is_array = np is not None and isinstance(obj, np.ndarray) and obj.ndim > 0
+
+    if pretty:
+        indent = "\n" + "  " * (level + 1)
+        item_separator = "," + indent
+        key_separator = ": "
+        close = "\n" + "  " * level
+    else:
+        indent = ""
+        item_separator = ","
+        key_separator = ":"
+        close = ""
+
+    if isinstance(obj, dict) and obj and all(isinstance(k, string_types) for k in obj):
+        keys = sorted(obj)
+        yield "{" + indent
+        for i, k in enumerate(keys):
+            if i:
+                yield item_separator
+            yield encode(k) + key_separator
+            for chunk in _iter_json_chunks(obj[k], encode, pretty, level + 1):
+                yield chunk
+        yield close + "}"
+    elif isinstance(obj, (list, tuple)) and any(isinstance(v, dict) for v in obj):
+        yield "[" + indent
+        for i, v in enumerate(obj):
+            if i:
+                yield item_separator
+            for chunk in _iter_json_chunks(v, encode, pretty, level + 1):
+                yield chunk
+        yield close + "]"
+    elif (is_array or isinstance(obj, (list, tuple))) and len(obj) > _json_chunk_size:
+        yield "[" + indent
+        for start in range(0, len(obj), _json_chunk_size):
+            if start:
+                yield item_separator
+            # Strip the enclosing brackets from the encoded slice
+            encoded = encode(obj[start : start + _json_chunk_size])
+            if pretty:
+                # Also strip the leading '\n  ' and trailing '\n', and indent
+                # the remaining lines to the current level
+                encoded = encoded[4:-2].replace("\n", "\n" + "  " * level)
+            else:
+                encoded = encoded[1:-1]
+            yield encoded
+        yield close + "]"
+    else:
+        encoded = encode(obj)
+        if pretty and level:
+            encoded = encoded.replace("\n", "\n" + "  " * level)
+        yield encoded
+
+
+def write_json(
+    fig,
+    file,
+    validate=True,
+    pretty=False,
+    remove_uids=True,
+    engine=None,
+    binary_arrays=False,
+):
     """
     Convert a figure to JSON and write it to a file or writeable
     object
@@ -68,7 +381,8 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True):
 
     file: str or writeable
         A string representing a local file path or a writeable object
-        (e.g. an open file descriptor)
+        (e.g. an open file descriptor). If file is a path that ends in
+        '.gz', the file is written with gzip compression.
 
     pretty: bool (default False)
         True if JSON representation should be pretty-printed, False if
@@ -77,37 +391,84 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True):
     remove_uids: bool (default True)
         True if trace UIDs should be omitted from the JSON representation
 
+    engine: str (default None)
+        The JSON encoding engine to use. One of:
+          - "json" for an encoder based on the built-in Python json module
+          - "orjson" for a fast encoder that requires the orjson package
+          - "auto" for the "orjson" encoder if available, otherwise "json"
+        If not specified, the default engine is set to the current value of
+        plotly.io.json.config.default_engine.
+
+    binary_arrays: bool (default False)
+        True if numeric numpy arrays should be encoded as base64 binary
+        array specs of the form {"dtype": str, "shape": list, "bdata": str},
+        False if they should be encoded as JSON arrays of numbers.
+
     Returns
     -------
     None
     """
 
-    # Get JSON string
-    # ---------------
-    # Pass through validate argument and let to_json handle validation logic
-    json_str = to_json(fig, validate=validate, pretty=pretty, remove_uids=remove_uids)
+    # Build figure dict
+    # -----------------
+    fig_dict = _to_json_fig_dict(fig, validate, remove_uids, binary_arrays)
+
+    # Encode incrementally
+    # --------------------
+    # The figure dict is encoded in chunks that are written as they are
+    # produced, so the full JSON string is never held in memory
+    engine = validate_coerce_engine(engine)
+
+    def encode(obj):
+        return to_json_plotly(obj, pretty=pretty, engine=engine)
+
+    chunks = _iter_json_chunks(fig_dict, encode, pretty)
 
     # Check if file is a string
     # -------------------------
     file_is_str = isinstance(file, string_types)
 
-    # Open file
-    # ---------
-    if file_is_str:
+    # Open file and write chunks
+    # --------------------------
+    if file_is_str and file.endswith(".gz"):
+        with gzip.open(file, "wb") as f:
+            _write_chunks(f, (chunk.encode("utf8") for chunk in chunks), b"")
+    elif file_is_str:
         with open(file, "w") as f:
-            f.write(json_str)
+            _write_chunks(f, chunks, "")
     else:
-        file.write(json_str)
+        _write_chunks(file, chunks, "")
+
+
+def _write_chunks(f, chunks, empty):
+    """
+    Write chunks to the writeable f, combining small chunks into writes of
+    at least _json_write_size characters
+    """
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= _json_write_size:
+            f.write(empty.join(buffer))
+            buffer = []
+            size = 0
+
+    if buffer:
+        f.write(empty.join(buffer))
 
 
-def from_json(value, output_type="Figure", skip_invalid=False):
+def from_json(value, output_type="Figure", skip_invalid=False, validate=True):
     """
     Construct a figure from a JSON string
 
     Parameters
     ----------
     value: str
-        String containing the JSON representation of a figure
+        String containing the JSON representation of a figure. Binary array
+        specs, as produced by `to_json(..., binary_arrays=True)`, are decoded
+        into numpy arrays.
 
     output_type: type or str (default 'Figure')
         The output figure type or type name.
@@ -117,6 +478,13 @@ def from_json(value, output_type="Figure", skip_invalid=False):
         False if invalid figure properties should result in an exception.
         True if invalid figure properties should be silently ignored.
 
+    validate: bool (default True)
+        True if the figure properties should be validated. False if the
+        figure should be constructed without validation, which is much
+        faster but should only be used with trusted input, such as JSON
+        produced by `plotly.io.to_json`. Numeric lists in data array
+        properties are returned as numpy arrays when they are accessed.
+
     Raises
     ------
     ValueError
@@ -143,17 +511,22 @@ from_json requires a string argument but received value of type {typ}
     # -----------
     fig_dict = json.loads(value)
 
+    # Decode binary array specs
+    # -------------------------
+    # Produced by to_json(..., binary_arrays=True)
+    fig_dict = decode_binary_arrays(fig_dict)
+
     # Validate coerce output type
     # ---------------------------
     cls = validate_coerce_output_type(output_type)
 
     # Create and return figure
     # ------------------------
-    fig = cls(fig_dict, skip_invalid=skip_invalid)
+    fig = cls(fig_dict, skip_invalid=skip_invalid, _validate=validate)
     return fig
 
 
-def read_json(file, output_type="Figure", skip_invalid=False):
+def read_json(file, output_type="Figure", skip_invalid=False, validate=True):
     """
     Construct a figure from the JSON contents of a local file or readable
     Python object
@@ -162,7 +535,8 @@ def read_json(file, output_type="Figure", skip_invalid=False):
     ----------
     file: str or readable
        A string containing the path to a local file or a read-able Python
-       object (e.g. an open file descriptor)
+       object (e.g. an open file descriptor). If file is a path that ends in
+       '.gz', the file is decompressed with gzip.
 
     output_type: type or str (default 'Figure')
         The output figure type or type name.
@@ -172,6 +546,11 @@ def read_json(file, output_type="Figure", skip_invalid=False):
         False if invalid figure properties should result in an exception.
         True if invalid figure properties should be silently ignored.
 
+    validate: bool (default True)
+        True if the figure properties should be validated. False if the
+        figure should be constructed without validation, which should only
+        be used with trusted input. See `plotly.io.from_json`.
+
     Returns
     -------
     Figure or FigureWidget
@@ -185,7 +564,10 @@ def read_json(file, output_type="Figure", skip_invalid=False):
 
     # Read file contents into JSON string
     # -----------------------------------
-    if file_is_str:
+    if file_is_str and file.endswith(".gz"):
+        with gzip.open(file, "rb") as f:
+            json_str = f.read().decode("utf8")
+    elif file_is_str:
         with open(file, "r") as f:
             json_str = f.read()
     else:
@@ -193,4 +575,6 @@ def read_json(file, output_type="Figure", skip_invalid=False):
 
     # Construct and return figure
     # ---------------------------
-    return from_json(json_str, skip_invalid=skip_invalid, output_type=output_type)
+    return from_json(
+        json_str, skip_invalid=skip_invalid, output_type=output_type, validate=validate,
+    )
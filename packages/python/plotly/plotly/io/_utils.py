@@ -1,18 +1,46 @@
 from __future__ import absolute_import
 
+import base64
+import struct
+
 import plotly
 import plotly.graph_objs as go
+from _plotly_utils.optional_imports import get_module
+
+# Numpy dtypes that map directly to JavaScript typed arrays, by the short
+# dtype code used in binary array specs
+_binary_array_dtypes = ("i1", "u1", "i2", "u2", "i4", "u4", "f4", "f8")
+
+# struct format characters of the binary array dtypes, used to decode binary
+# array specs when numpy is not installed
+_struct_typecodes = {
+    "i1": "b",
+    "u1": "B",
+    "i2": "h",
+    "u2": "H",
+    "i4": "i",
+    "u4": "I",
+    "f4": "f",
+    "f8": "d",
+}
 
 
 def validate_coerce_fig_to_dict(fig, validate):
+    """
+    Convert a figure or figure dict into a figure dict for export.
+
+    Note: The result may be a read-only view of the figure's properties (see
+    `BaseFigure.to_dict`), or the input dict itself, so it must not be
+    modified.
+    """
     from plotly.basedatatypes import BaseFigure
 
     if isinstance(fig, BaseFigure):
-        fig_dict = fig.to_dict()
+        fig_dict = fig.to_dict(copy=False)
     elif isinstance(fig, dict):
         if validate:
             # This will raise an exception if fig is not a valid plotly figure
-            fig_dict = plotly.graph_objs.Figure(fig).to_plotly_json()
+            fig_dict = plotly.graph_objs.Figure(fig).to_dict(copy=False)
         else:
             fig_dict = fig
     else:
@@ -40,3 +68,169 @@ Invalid output type: {output_type}
     Must be one of: 'Figure', 'FigureWidget'"""
         )
     return cls
+
+
+def to_binary_array_spec(v):
+    """
+    Convert a numeric numpy array to a binary array spec dict of the form
+    {"dtype": str, "shape": list of int, "bdata": str}, where bdata is the
+    base64 encoding of the array's little-endian, C-ordered data buffer.
+
+    int64 and uint64 arrays are converted to 32-bit integers if their values
+    fit, since JavaScript has no 64-bit integer typed arrays.
+
+    Parameters
+    ----------
+    v: numpy.ndarray
+
+    Returns
+    -------
+    dict or None
+        Binary array spec, or None if v can't be represented as a
+        JavaScript typed array
+    """
+    np = get_module("numpy", should_load=False)
+    if (
+        not np
+        or not isinstance(v, np.ndarray)
+        or isinstance(v, np.ma.MaskedArray)
+        or v.dtype.kind not in ("i", "u", "f")
+    ):
+        return None
+
+    if v.dtype.kind in ("i", "u") and v.dtype.itemsize == 8:
+        if v.size == 0:
+            v = v.astype(v.dtype.kind + "4")
+        else:
+            # Downcast to the smallest of int32 and uint32 that fits
+            vmin, vmax = v.min(), v.max()
+            for dtype in ("i4", "u4"):
+                info = np.iinfo(dtype)
+                if info.min <= vmin and vmax <= info.max:
+                    v = v.astype(dtype)
+                    break
+            else:
+                return None
+
+    dtype_code = v.dtype.kind + str(v.dtype.itemsize)
+    if dtype_code not in _binary_array_dtypes:
+        return None
+
+    v = np.ascontiguousarray(v, dtype="<" + dtype_code)
+    return {
+        "dtype": dtype_code,
+        "shape": list(v.shape),
+        "bdata": base64.b64encode(v.data).decode("ascii"),
+    }
+
+
+def is_binary_array_spec(v):
+    """
+    Return whether v is a binary array spec dict as produced by
+    to_binary_array_spec
+    """
+    return (
+        isinstance(v, dict)
+        and "bdata" in v
+        and "dtype" in v
+        and set(v).issubset(("dtype", "shape", "bdata"))
+        and v["dtype"] in _binary_array_dtypes
+    )
+
+
+def from_binary_array_spec(spec):
+    """
+    Convert a binary array spec dict back into a numpy array, or into a
+    (nested) list if numpy is not installed
+
+    Parameters
+    ----------
+    spec: dict
+        Dict as produced by to_binary_array_spec
+
+    Returns
+    -------
+    numpy.ndarray or list
+    """
+    data = base64.b64decode(spec["bdata"])
+    shape = spec.get("shape", None)
+
+    np = get_module("numpy")
+    if np:
+        v = np.frombuffer(data, dtype="<" + spec["dtype"])
+        if shape is not None:
+            v = v.reshape(shape)
+        return v
+    else:
+        # Unpack into a list of values and nest according to shape
+        typecode = _struct_typecodes[spec["dtype"]]
+        values = list(
+            struct.unpack(
+                "<%d%s" % (len(data) // struct.calcsize("<" + typecode), typecode), data
+            )
+        )
+        for n in reversed((shape or [len(values)])[1:]):
+            values = [values[i : i + n] for i in range(0, len(values), n)]
+        return values
+
+
+def encode_binary_arrays(obj):
+    """
+    Return a copy of a figure dict (or part of one) in which numeric numpy
+    arrays are replaced by binary array specs. obj is not modified, and
+    containers that hold no arrays are returned as-is.
+    """
+    np = get_module("numpy", should_load=False)
+    if not np:
+        return obj
+
+    return _encode_binary_arrays(obj, np)
+
+
+def _encode_binary_arrays(obj, np):
+    if isinstance(obj, dict):
+        res = None
+        for k, v in obj.items():
+            new_v = _encode_binary_arrays(v, np)
+            if new_v is not v:
+                if res is None:
+                    res = dict(obj)
+                res[k] = new_v
+        return obj if res is None else res
+    elif isinstance(obj, (list, tuple)):
+        res = None
+        for i, v in enumerate(obj):
+            if isinstance(v, (dict, list, tuple, np.ndarray)):
+                new_v = _encode_binary_arrays(v, np)
+                if new_v is not v:
+                    if res is None:
+                        res = list(obj)
+                    res[i] = new_v
+        return obj if res is None else res
+    elif isinstance(obj, np.ndarray):
+        spec = to_binary_array_spec(obj)
+        return obj if spec is None else spec
+    else:
+        return obj
+
+
+def decode_binary_arrays(obj):
+    """
+    Replace binary array specs in a decoded JSON figure dict with numpy
+    arrays, in place
+
+    Returns
+    -------
+    obj, or the decoded array if obj is itself a binary array spec
+    """
+    if is_binary_array_spec(obj):
+        return from_binary_array_spec(obj)
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            if isinstance(v, (dict, list)):
+                obj[k] = decode_binary_arrays(v)
+    elif isinstance(obj, list):
+        for i, v in enumerate(obj):
+            if isinstance(v, (dict, list)):
+                obj[i] = decode_binary_arrays(v)
+    return obj
@@ -0,0 +1 @@
+from ._json import to_json, from_json, read_json, write_json, to_json_plotly, config
@@ -1,8 +1,106 @@
 from .basedatatypes import Undefined
 from .optional_imports import get_module
+from _plotly_utils.utils import datetime64_array_to_list
 
 np = get_module("numpy")
 
+# Largest magnitude up to which every integer is exactly representable as a
+# double precision float (and therefore as a JavaScript number)
+_max_exact_float_int = 2 ** 53
+
+
+def _downcast_int64_array(v):
+    """
+    Convert an int64 or uint64 array into an array with a dtype that has a
+    JavaScript typed array equivalent, without loss of precision
+
+    Parameters
+    ----------
+    v : np.ndarray
+        Array with an int64 or uint64 dtype
+
+    Returns
+    -------
+    np.ndarray or None
+        An int32, uint32 or float64 array, or None if the values of v can't
+        be represented exactly by any of these types
+    """
+    if v.size == 0:
+        return v.astype("int32")
+
+    vmin, vmax = int(v.min()), int(v.max())
+    for dtype in ("int32", "uint32"):
+        info = np.iinfo(dtype)
+        if vmin >= info.min and vmax <= info.max:
+            return v.astype(dtype)
+
+    if vmin >= -_max_exact_float_int and vmax <= _max_exact_float_int:
+        return v.astype("float64")
+
+    return None
+
+
+def _array_to_buffer_spec(v):
+    """
+    Convert a numpy array into a buffer/dtype/shape dict that the JavaScript
+    deserializer converts into a typed array, or into nested arrays of typed
+    arrays for arrays with more than one dimension
+
+    - int64 and uint64 arrays are downcast to int32, uint32 or float64 when
+      their values allow it
+    - bool arrays are sent as uint8 buffers with a dtype of 'bool'
+    - datetime64 arrays are sent as float64 buffers of the number of days
+      (dtype 'datetime64[D]') or microseconds (dtype 'datetime64[us]') since
+      the epoch, with NaT values converted to NaN
+
+    Parameters
+    ----------
+    v : np.ndarray
+
+    Returns
+    -------
+    dict or None
+        None if the array can't be represented as a typed array
+    """
+    if v.ndim == 0:
+        return None
+
+    kind = v.dtype.kind
+    dtype = None
+    if kind == "b":
+        dtype = "bool"
+        v = v.astype("uint8")
+    elif kind == "M":
+        unit = np.datetime_data(v.dtype)[0]
+        dtype = (
+            "datetime64[D]"
+            if unit in ("Y", "M", "W", "D", "generic")
+            else "datetime64[us]"
+        )
+        is_nat = np.isnat(v)
+        ints = v.astype(dtype).astype("int64")
+        ints[is_nat] = 0
+        if ints.size and np.abs(ints).max() > _max_exact_float_int:
+            return None
+        v = ints.astype("float64")
+        v[is_nat] = np.nan
+    elif kind in ("i", "u") and v.dtype.itemsize == 8:
+        v = _downcast_int64_array(v)
+        if v is None:
+            return None
+    elif kind == "f" and v.dtype.itemsize == 2:
+        v = v.astype("float32")
+    elif kind not in ("i", "u", "f") or v.dtype.itemsize > 8:
+        return None
+
+    # Typed arrays are little-endian and contiguous
+    v = np.ascontiguousarray(v, dtype=v.dtype.newbyteorder("<"))
+    return {
+        "buffer": memoryview(v.reshape(-1)),
+        "dtype": dtype or str(v.dtype),
+        "shape": v.shape,
+    }
+
 
 def _py_to_js(v, widget_manager):
     """
@@ -38,18 +136,15 @@ def _py_to_js(v, widget_manager):
     # Handle numpy array
     # ------------------
     elif np is not None and isinstance(v, np.ndarray):
-        # Convert 1D numpy arrays with numeric types to memoryviews with
-        # datatype and shape metadata.
-        if (
-            v.ndim == 1
-            and v.dtype.kind in ["u", "i", "f"]
-            and v.dtype != "int64"
-            and v.dtype != "uint64"
-        ):
-
-            # We have a numpy array the we can directly map to a JavaScript
-            # Typed array
-            return {"buffer": memoryview(v), "dtype": str(v.dtype), "shape": v.shape}
+        # Convert numpy arrays that can be represented as JavaScript typed
+        # arrays to memoryviews with datatype and shape metadata
+        buffer_spec = _array_to_buffer_spec(v)
+        if buffer_spec is not None:
+            return buffer_spec
+        elif v.dtype.kind == "M":
+            # Convert datetime64 arrays to lists of date strings in a single
+            # vectorized step
+            return datetime64_array_to_list(v)
         else:
             # Convert all other numpy arrays to lists
             return v.tolist()
@@ -1,3 +1,4 @@
+import gc
 import sys
 from unittest import TestCase
 import pytest
@@ -223,3 +224,12 @@ class TestOnChangeCallbacks(TestCase):
         )
 
         fn_range.assert_called_once_with(self.figure.layout, (-10, 10), (11, 22), 1000)
+
+    def test_nested_callback_after_gc(self):
+        # Objects with callbacks must survive when no other reference is held
+        fn_line = MagicMock()
+        self.figure.data[0].marker.line.on_change(fn_line, "width")
+        gc.collect()
+
+        self.figure.plotly_restyle({"marker.line.width": 3}, trace_indexes=0)
+        fn_line.assert_called_once_with(self.figure.data[0].marker.line, 3)
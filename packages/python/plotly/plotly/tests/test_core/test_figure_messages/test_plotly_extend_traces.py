@@ -0,0 +1,248 @@
+import datetime
+import sys
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+
+if sys.version_info >= (3, 3):
+    from unittest.mock import MagicMock
+else:
+    from mock import MagicMock
+
+
+class TestExtendTracesMessage(TestCase):
+    def setUp(self):
+        # Construct with mocked _send_extendTraces_msg method
+        self.figure = go.Figure(
+            data=[
+                go.Scatter(x=[0, 1], y=[2, 3]),
+                go.Scatter(y=["a", "b"]),
+                go.Scatter(),
+            ]
+        )
+
+        # Mock out the message method
+        self.figure._send_extendTraces_msg = MagicMock()
+
+    def test_extend_traces(self):
+        self.figure.extend_traces(dict(x=[[2, 3]], y=[[4, 5]]), [0])
+
+        np.testing.assert_array_equal(self.figure.data[0].x, [0, 1, 2, 3])
+        np.testing.assert_array_equal(self.figure.data[0].y, [2, 3, 4, 5])
+
+        # Only the new values are sent
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"x": [[2, 3]], "y": [[4, 5]]}, [0], None
+        )
+
+    def test_extend_traces_single_index(self):
+        self.figure.extend_traces(dict(y=[4]), 0)
+        self.figure.extend_traces(dict(y=np.array([5, 6])), 0)
+
+        np.testing.assert_array_equal(self.figure.data[0].y, [2, 3, 4, 5, 6])
+        self.assertEqual(self.figure._send_extendTraces_msg.call_count, 2)
+
+    def test_extend_traces_max_points(self):
+        self.figure.extend_traces(
+            dict(x=[[2, 3], [4]], y=[[4, 5], [6]]),
+            [0, 2],
+            max_points=dict(x=3, y=[2, 1]),
+        )
+
+        np.testing.assert_array_equal(self.figure.data[0].x, [1, 2, 3])
+        np.testing.assert_array_equal(self.figure.data[0].y, [4, 5])
+        np.testing.assert_array_equal(self.figure.data[2].x, [4])
+        np.testing.assert_array_equal(self.figure.data[2].y, [6])
+
+        # max_points is sent in the form accepted by Plotly.extendTraces
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"x": [[2, 3], [4]], "y": [[4, 5], [6]]},
+            [0, 2],
+            {"x": [3, 3], "y": [2, 1]},
+        )
+
+    def test_extend_traces_max_points_normalized(self):
+        self.figure.extend_traces(
+            dict(x=[[2, 3], [4]], y=[[4, 5], [6]]), [0, 2], max_points=dict(y=1)
+        )
+        self.figure.extend_traces(dict(y=[[7], [8]]), [0, 2], max_points=[None, 1])
+        self.figure.extend_traces(dict(y=[[9], [10]]), [0, 2], max_points=2)
+
+        np.testing.assert_array_equal(self.figure.data[0].x, [0, 1, 2, 3])
+        np.testing.assert_array_equal(self.figure.data[0].y, [7, 9])
+        np.testing.assert_array_equal(self.figure.data[2].y, [8, 10])
+
+        sent_max_points = [
+            args[2] for args, _ in self.figure._send_extendTraces_msg.call_args_list
+        ]
+        self.assertEqual(
+            sent_max_points, [{"x": [-1, -1], "y": [1, 1]}, {"y": [-1, 1]}, 2]
+        )
+
+    def test_extend_traces_rolling_window(self):
+        for i in range(100):
+            self.figure.extend_traces(dict(y=[[i]]), [2], max_points=10)
+
+        np.testing.assert_array_equal(self.figure.data[2].y, np.arange(90, 100))
+
+    def test_extend_traces_keeps_previous_values(self):
+        self.figure.extend_traces(dict(y=[[4]]), [0])
+        y = self.figure.data[0].y
+        to_dict_y = self.figure.to_dict()["data"][0]["y"]
+
+        self.figure.extend_traces(dict(y=[[5, 6]]), [0], max_points=3)
+
+        # Arrays returned before the operation are not modified
+        np.testing.assert_array_equal(y, [2, 3, 4])
+        np.testing.assert_array_equal(to_dict_y, [2, 3, 4])
+        np.testing.assert_array_equal(self.figure.data[0].y, [4, 5, 6])
+
+        # The stored array is read-only
+        with pytest.raises(ValueError):
+            self.figure.data[0].y[0] = 10
+
+    def test_extend_traces_after_assignment(self):
+        self.figure.extend_traces(dict(y=[[4]]), [0])
+        self.figure.data[0].y = [10, 11]
+        self.figure.extend_traces(dict(y=[[12]]), [0])
+
+        np.testing.assert_array_equal(self.figure.data[0].y, [10, 11, 12])
+
+    def test_extend_traces_dtype_promotion(self):
+        self.figure.extend_traces(dict(y=[[4.5]]), [0])
+
+        np.testing.assert_array_equal(self.figure.data[0].y, [2, 3, 4.5])
+
+    def test_extend_traces_non_numeric(self):
+        self.figure.extend_traces(dict(y=[["c"]]), [1])
+
+        self.assertEqual(self.figure.data[1].y, ("a", "b", "c"))
+
+    def test_extend_traces_nested(self):
+        self.figure.extend_traces({"marker.color": [[1, 2]]}, [2])
+        self.figure.extend_traces({"marker.color": [[3]]}, [2])
+
+        np.testing.assert_array_equal(self.figure.data[2].marker.color, [1, 2, 3])
+
+    def test_extend_traces_content_hash(self):
+        digest = self.figure.content_hash()
+        self.figure.extend_traces(dict(y=[[4]]), [0])
+
+        self.assertNotEqual(self.figure.content_hash(), digest)
+        self.assertEqual(
+            self.figure.content_hash(), go.Figure(self.figure.to_dict()).content_hash(),
+        )
+
+    def test_extend_traces_change_callbacks(self):
+        callback = MagicMock()
+        self.figure.data[0].on_change(callback, "y")
+
+        self.figure.extend_traces(dict(y=[[4]]), [0])
+        self.assertEqual(callback.call_count, 1)
+
+    def test_extend_traces_invalid_value(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(dict(y=[4]), [0])
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(dict(name=[["a"]]), [0])
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(dict(bogus=[[1]]), [0])
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(dict(y=[[1]]), [5])
+
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+    def test_extend_traces_empty(self):
+        self.figure.extend_traces(dict(y=[[]]), [0])
+
+        # An empty extension doesn't change the dtype of the array
+        self.assertEqual(self.figure.data[0].y, (2, 3))
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+        self.figure.extend_traces(dict(y=[[], [4]]), [0, 2])
+        self.assertEqual(self.figure.data[0].y, (2, 3))
+        np.testing.assert_array_equal(self.figure.data[2].y, [4])
+
+    def test_extend_traces_failure_leaves_figure_unchanged(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(dict(y=[[4]], name=[["a"]]), [0])
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(
+                dict(y=[[4]], x=[[1]]), [0], max_points=dict(y=[])
+            )
+
+        self.assertEqual(self.figure.data[0].x, (0, 1))
+        self.assertEqual(self.figure.data[0].y, (2, 3))
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+    def test_extend_traces_batch_update(self):
+        with pytest.raises(ValueError):
+            with self.figure.batch_update():
+                self.figure.data[0].y = [5]
+                self.figure.extend_traces(dict(y=[[6]]), [0])
+
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+
+class TestExtendTracesDates(TestCase):
+    def setUp(self):
+        self.dates = np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]")
+        self.figure = go.Figure(
+            data=[
+                go.Scatter(x=self.dates, y=[0, 1]),
+                go.Scatter(x=self.dates.astype("datetime64[ns]"), y=[0, 1]),
+            ]
+        )
+
+    def test_extend_dates_with_datetimes(self):
+        self.figure.extend_traces(
+            dict(x=[[datetime.date(2020, 1, 3)], [datetime.datetime(2020, 1, 3, 5)]]),
+            [0, 1],
+        )
+
+        x0, x1 = self.figure.data[0].x, self.figure.data[1].x
+        self.assertEqual(x0.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(x1.dtype, np.dtype("datetime64[ns]"))
+        np.testing.assert_array_equal(
+            x0, np.array(["2020-01-01", "2020-01-02", "2020-01-03"], "datetime64[D]")
+        )
+        np.testing.assert_array_equal(
+            x1,
+            np.array(["2020-01-01", "2020-01-02", "2020-01-03T05"], "datetime64[ns]"),
+        )
+
+    def test_extend_dates_with_strings(self):
+        self.figure.extend_traces(
+            dict(x=[["2020-01-03"], ["2020-01-03T05:30"]]), [0, 1]
+        )
+        self.figure.extend_traces(dict(x=[["2020-01-04T12:00"]]), [0])
+
+        x0, x1 = self.figure.data[0].x, self.figure.data[1].x
+        self.assertEqual(x1.dtype, np.dtype("datetime64[ns]"))
+        np.testing.assert_array_equal(
+            x1,
+            np.array(
+                ["2020-01-01", "2020-01-02", "2020-01-03T05:30"], "datetime64[ns]"
+            ),
+        )
+
+        # Dates with a time of day are not truncated to the unit of the array
+        np.testing.assert_array_equal(
+            x0,
+            np.array(
+                ["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04T12:00"],
+                "datetime64[m]",
+            ),
+        )
+
+    def test_extend_dates_with_other_values(self):
+        self.figure.extend_traces(dict(x=[["a"]]), [0])
+
+        self.assertEqual(self.figure.data[0].x, ("2020-01-01", "2020-01-02", "a"))
@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from plotly.callbacks import BoxSelector, LassoSelector, Points, _group_points
+
+
+def test_points_arrays():
+    points = Points(
+        point_inds=np.array([0, 2]),
+        xs=np.array([1.5, 2.5]),
+        ys=["a", None],
+        trace_name="t",
+        trace_index=1,
+    )
+
+    assert points.point_inds_array.dtype.kind == "i"
+    np.testing.assert_array_equal(points.xs_array, [1.5, 2.5])
+
+    # Non-numeric values are stored in object arrays
+    assert points.ys_array.dtype == object
+    assert list(points.ys_array) == ["a", None]
+
+    # The point_inds, xs and ys properties are lists
+    assert points.point_inds == [0, 2]
+    assert points.xs == [1.5, 2.5]
+    assert points.ys == ["a", None]
+    assert type(points.point_inds[0]) is int
+
+    assert "point_inds=[0, 2]" in repr(points)
+
+
+def test_empty_points():
+    points = Points()
+
+    assert points.point_inds_array.dtype.kind == "i"
+    assert len(points.xs_array) == 0
+    assert points.point_inds == []
+    assert not points.xs
+
+
+def test_group_points():
+    trace_points = _group_points(
+        [5, 6, 7, 8], [1, 2, 3, 4], ["a", "b", "c", "d"], [1, 0, 1, 3]
+    )
+
+    assert sorted(trace_points) == [0, 1, 3]
+    point_inds, xs, ys = trace_points[1]
+    np.testing.assert_array_equal(point_inds, [5, 7])
+    np.testing.assert_array_equal(xs, [1, 3])
+    assert list(ys) == ["a", "c"]
+
+    assert _group_points([], [], [], []) == {}
+
+
+def test_box_selector_contains():
+    selector = BoxSelector(xrange=[2, 0], yrange=[0, 1])
+
+    np.testing.assert_array_equal(
+        selector.contains([0, 1, 2, 3, 1], [0, 0.5, 1, 0.5, -1]),
+        [True, True, True, False, False],
+    )
+
+
+def test_lasso_selector_contains():
+    # Square with a triangular notch cut out of its right side
+    selector = LassoSelector(xs=[0, 4, 4, 2, 4, 4, 0], ys=[0, 0, 1, 2, 3, 4, 4])
+
+    np.testing.assert_array_equal(
+        selector.contains([1, 3.5, 3.5, 3, 5, -1], [2, 0.5, 2, 3.5, 2, 2]),
+        [True, True, False, True, False, False],
+    )
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_lasso_selector_contains_boundary(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr("plotly.callbacks.get_module", lambda name: None)
+
+    # Points on the boundary, including the vertices, are inside
+    selector = LassoSelector(xs=[0, 2, 2, 0], ys=[0, 0, 2, 2])
+    vertices = ([0, 2, 2, 0], [0, 0, 2, 2])
+    edges = ([1, 2, 1, 0], [0, 1, 2, 1])
+    outside = ([-1, 3, 1, 1, 2.5, 3], [0, 2, -0.5, 2.5, 2, 2])
+    for xs, ys, expected in [
+        (vertices[0], vertices[1], [True] * 4),
+        (edges[0], edges[1], [True] * 4),
+        (outside[0], outside[1], [False] * 6),
+    ]:
+        assert list(selector.contains(xs, ys)) == expected
+
+    # Including diagonal edges and the vertices of a notch
+    selector = LassoSelector(xs=[0, 4, 4, 2, 4, 4, 0], ys=[0, 0, 1, 2, 3, 4, 4])
+    assert list(selector.contains([2, 3, 3, 4, 4], [2, 1.5, 2.5, 1, 3])) == [True] * 5
+    assert list(selector.contains([3.5, 4.5], [2, 1])) == [False, False]
+
+
+def test_lasso_selector_contains_matches_box():
+    selector = LassoSelector(xs=[0, 2, 2, 0], ys=[0, 0, 1, 1])
+    rng = np.random.RandomState(0)
+    xs = rng.uniform(-1, 3, 1000)
+    ys = rng.uniform(-1, 2, 1000)
+
+    # Including points on the boundary
+    grid_xs, grid_ys = np.meshgrid(np.arange(-1, 3.5, 0.5), np.arange(-1, 2.5, 0.5))
+    xs = np.concatenate([xs, grid_xs.ravel()])
+    ys = np.concatenate([ys, grid_ys.ravel()])
+
+    np.testing.assert_array_equal(
+        selector.contains(xs, ys),
+        BoxSelector(xrange=[0, 2], yrange=[0, 1]).contains(xs, ys),
+    )
+
+
+def test_box_selector_contains_dates():
+    # plotly.js sends the ranges of date axes as date strings
+    selector = BoxSelector(
+        xrange=["2020-01-01 12:00", "2020-01-02 12:00"], yrange=[0, 1]
+    )
+    xs = np.array(["2020-01-01", "2020-01-02", "2020-01-03"], dtype="datetime64[ns]")
+
+    np.testing.assert_array_equal(
+        selector.contains(xs, [0, 0, 0]), [False, True, False]
+    )
+    np.testing.assert_array_equal(
+        selector.contains(["2020-01-02", "2020-01-03"], [0, 0]), [True, False]
+    )
+
+
+def test_lasso_selector_contains_dates():
+    selector = LassoSelector(
+        xs=["2020-01-01", "2020-01-03", "2020-01-03", "2020-01-01"], ys=[0, 0, 1, 1]
+    )
+    xs = np.array(["2020-01-02", "2020-01-04", "NaT"], dtype="datetime64[D]")
+
+    np.testing.assert_array_equal(
+        selector.contains(xs, [0.5, 0.5, 0.5]), [True, False, False]
+    )
+
+
+def test_selector_contains_categories():
+    selector = BoxSelector(xrange=[-0.5, 1.5], yrange=[0, 1])
+
+    with pytest.raises(ValueError, match="category"):
+        selector.contains(["a", "b"], [0, 0])
+
+    # Category positions are supported
+    np.testing.assert_array_equal(selector.contains([0, 2], [0, 0]), [True, False])
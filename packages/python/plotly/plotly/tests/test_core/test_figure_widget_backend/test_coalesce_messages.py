@@ -0,0 +1,182 @@
+from unittest import TestCase
+import plotly.graph_objs as go
+from plotly.basedatatypes import Undefined
+import pytest
+
+try:
+    import asyncio
+
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+def run_in_event_loop(fn, duration=0.01, checks=()):
+    """
+    Call fn from a running asyncio event loop, and keep the loop running for
+    duration seconds. checks is a list of (delay, function) tuples of
+    functions to call delay seconds after fn.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        loop.call_soon(fn)
+        for delay, check in checks:
+            loop.call_later(delay, check)
+        loop.run_until_complete(asyncio.sleep(duration))
+    finally:
+        loop.close()
+
+
+class TestCoalesceMessages(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.figure = go.FigureWidget(data=[go.Scatter(), go.Bar()])
+            self.msgs = []
+            self.figure.observe(
+                self.record_msg,
+                names=[
+                    "_py2js_restyle",
+                    "_py2js_relayout",
+                    "_py2js_update",
+                    "_py2js_addTraces",
+                ],
+            )
+
+        def record_msg(self, change):
+            if change["new"] is not None:
+                self.msgs.append((change["name"], change["new"]))
+
+        def edit(self):
+            for i in range(3):
+                self.figure.data[0].marker.size = i
+                self.figure.data[1].marker.color = "green"
+                self.figure.layout.title.text = "Title %d" % i
+
+        def test_no_event_loop(self):
+            self.edit()
+
+            # Assigning an unchanged value doesn't produce a message
+            self.assertEqual(len(self.msgs), 7)
+            self.assertEqual(self.msgs[0][0], "_py2js_restyle")
+            self.assertEqual(self.figure.message_stats["merged"], 0)
+
+        def test_coalesce_in_event_loop(self):
+            stats = self.figure.message_stats
+            run_in_event_loop(self.edit)
+
+            self.assertEqual(len(self.msgs), 1)
+            name, msg = self.msgs[0]
+            self.assertEqual(name, "_py2js_update")
+            self.assertEqual(
+                msg["style_data"],
+                {"marker.size": [2, Undefined], "marker.color": [Undefined, "green"]},
+            )
+            self.assertEqual(msg["layout_data"], {"title.text": "Title 2"})
+            self.assertEqual(msg["style_traces"], [0, 1])
+            self.assertEqual(msg["trace_edit_id"], self.figure._last_trace_edit_id)
+            self.assertEqual(msg["layout_edit_id"], self.figure._last_layout_edit_id)
+
+            self.assertEqual(
+                self.figure.message_stats,
+                {"sent": stats["sent"] + 1, "merged": stats["merged"] + 6},
+            )
+
+        def test_overlapping_prop_paths(self):
+            def edit():
+                self.figure.data[0].marker.color = "red"
+                self.figure.data[0].marker = {"size": 3}
+                self.figure.data[0].marker.color = "blue"
+
+            run_in_event_loop(edit)
+
+            self.assertEqual(
+                [list(msg["style_data"]) for _, msg in self.msgs],
+                [["marker.color"], ["marker"], ["marker.color"]],
+            )
+            self.assertEqual(self.msgs[-1][1]["style_data"], {"marker.color": ["blue"]})
+
+        def test_other_message_sends_pending_message_first(self):
+            def edit():
+                self.figure.layout.title.text = "Title"
+                self.figure.add_scatter(y=[1, 2])
+                self.figure.layout.xaxis.range = [0, 1]
+
+            run_in_event_loop(edit)
+
+            self.assertEqual(
+                [name for name, _ in self.msgs],
+                ["_py2js_update", "_py2js_addTraces", "_py2js_update"],
+            )
+
+        def test_coalescing_disabled(self):
+            self.figure.coalesce_window = None
+            run_in_event_loop(self.edit)
+
+            self.assertEqual(len(self.msgs), 7)
+
+        def test_coalesce_window(self):
+            self.figure.coalesce_window = 0.05
+            counts = []
+
+            run_in_event_loop(
+                self.edit,
+                duration=0.2,
+                checks=[(0.01, lambda: counts.append(len(self.msgs)))],
+            )
+
+            self.assertEqual(counts, [0])
+            self.assertEqual(len(self.msgs), 1)
+
+        def test_edits_completed_waits_for_pending_message(self):
+            self.figure._layout_edit_in_process = False
+            self.figure._trace_edit_in_process = False
+            callback_counts = []
+
+            def edit():
+                self.figure.layout.title.text = "Title"
+                self.figure.on_edits_completed(
+                    lambda: callback_counts.append(len(self.msgs))
+                )
+
+            run_in_event_loop(edit)
+
+            self.assertEqual(len(self.msgs), 1)
+            self.assertEqual(callback_counts, [])
+
+        def test_construct_in_event_loop(self):
+            figures = []
+
+            def edit():
+                figure = go.FigureWidget(data=[go.Scatter()])
+                figure.observe(self.record_msg, names=["_py2js_update"])
+                figures.append(figure)
+
+                figure.data[0].x = [1, 2]
+                figure.data[0].marker.color = "green"
+                figure.layout.title.text = "Title"
+
+            run_in_event_loop(edit)
+
+            # The edits are not merged into messages that were sent by the
+            # constructor
+            figure = figures[0]
+            self.assertEqual(len(self.msgs), 1)
+            name, msg = self.msgs[0]
+            self.assertEqual(msg["layout_data"], {"title.text": "Title"})
+            self.assertEqual(
+                msg["style_data"], {"x": [[1, 2]], "marker.color": ["green"]}
+            )
+            self.assertEqual(msg["trace_edit_id"], 1)
+            self.assertEqual(msg["layout_edit_id"], 1)
+            self.assertEqual(figure._last_layout_edit_id, 1)
+            self.assertTrue(figure._layout_edit_in_process)
+            self.assertTrue(figure._trace_edit_in_process)
+
+        def test_invalid_coalesce_window(self):
+            with pytest.raises(ValueError):
+                self.figure.coalesce_window = -1
+
+            with pytest.raises(ValueError):
+                self.figure.coalesce_window = "1"
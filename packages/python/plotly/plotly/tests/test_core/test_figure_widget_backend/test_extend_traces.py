@@ -0,0 +1,49 @@
+from unittest import TestCase
+import plotly.graph_objs as go
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+class TestExtendTracesMsg(TestCase):
+    if figure_widget_available:
+
+        def test_extend_traces_sends_new_values(self):
+            fig = go.FigureWidget(data=[go.Scatter(y=list(range(1000)))])
+            msgs = []
+            fig.observe(
+                lambda change: msgs.append(change["new"]), names="_py2js_extendTraces"
+            )
+
+            fig.extend_traces(dict(y=[[1000, 1001]]), [0], max_points=500)
+
+            msg = msgs[0]
+            self.assertEqual(msg["extend_data"], {"y": [[1000, 1001]]})
+            self.assertEqual(msg["extend_traces"], [0])
+            self.assertEqual(msg["max_points"], 500)
+            self.assertEqual(msg["trace_edit_id"], fig._last_trace_edit_id)
+            self.assertEqual(msg["layout_edit_id"], fig._last_layout_edit_id)
+
+            # Message property is reset after the message is sent
+            self.assertIsNone(msgs[-1])
+            self.assertEqual(len(fig.data[0].y), 500)
+
+        def test_extend_traces_sends_normalized_max_points(self):
+            fig = go.FigureWidget(data=[go.Scatter(y=[0]), go.Scatter(y=[0])])
+            msgs = []
+            fig.observe(
+                lambda change: msgs.append(change["new"]), names="_py2js_extendTraces"
+            )
+
+            # Plotly.extendTraces requires an array of numbers for every
+            # extended property
+            fig.extend_traces(
+                dict(x=[[1], [2]], y=[[1], [2]]), [0, 1], max_points=dict(y=[None, 1])
+            )
+            self.assertEqual(msgs[0]["max_points"], {"x": [-1, -1], "y": [-1, 1]})
+
+            fig.extend_traces(dict(y=[[3], [4]]), [0, 1], max_points=[2])
+            self.assertEqual(msgs[2]["max_points"], {"y": [2, 2]})
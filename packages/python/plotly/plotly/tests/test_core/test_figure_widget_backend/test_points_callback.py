@@ -0,0 +1,111 @@
+from unittest import TestCase
+import plotly.graph_objs as go
+import pytest
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+class TestPointsCallback(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.figure = go.FigureWidget(
+                data=[go.Scatter(name="a"), go.Scatter(name="b"), go.Scatter(name="c")]
+            )
+            self.calls = []
+
+        def record(self, trace, points, state):
+            self.calls.append((trace.name, points))
+
+        def send_points(self, event_type, trace_indexes):
+            self.figure._js2py_pointsCallback = {
+                "event_type": event_type,
+                "points": {
+                    "trace_indexes": trace_indexes,
+                    "point_indexes": list(range(len(trace_indexes))),
+                    "xs": [10 + i for i in range(len(trace_indexes))],
+                    "ys": [20 + i for i in range(len(trace_indexes))],
+                },
+            }
+
+        def test_click_dispatched_to_traces_with_points(self):
+            for trace in self.figure.data:
+                trace.on_click(self.record)
+
+            self.send_points("plotly_click", [2, 0, 2])
+
+            self.assertEqual([name for name, _ in self.calls], ["a", "c"])
+            points = self.calls[1][1]
+            self.assertEqual(points.trace_index, 2)
+            self.assertEqual(points.point_inds, [0, 2])
+            self.assertEqual(points.xs, [10, 12])
+            self.assertEqual(points.ys, [20, 22])
+
+        def test_hover_dispatched_to_traces_with_callbacks(self):
+            self.figure.data[1].on_hover(self.record)
+
+            self.send_points("plotly_hover", [0, 1, 2])
+
+            self.assertEqual([name for name, _ in self.calls], ["b"])
+            self.assertEqual(self.calls[0][1].point_inds, [1])
+
+        def test_selection_updates_all_traces(self):
+            self.send_points("plotly_selected", [1, 1])
+
+            self.assertEqual(
+                [trace.selectedpoints for trace in self.figure.data], [(), (0, 1), ()],
+            )
+
+
+class TestTraceUidIndex(TestCase):
+    if figure_widget_available:
+
+        def setUp(self):
+            self.figure = go.FigureWidget(
+                data=[go.Scatter(), go.Scatter(), go.Scatter()]
+            )
+            self.uids = [trace.uid for trace in self.figure.data]
+
+        def assert_uid_indexes(self):
+            for i, trace in enumerate(self.figure.data):
+                self.assertEqual(self.figure._get_trace_ind_by_uid(trace.uid), i)
+
+        def test_uid_index(self):
+            self.assert_uid_indexes()
+
+        def test_uid_index_after_add_traces(self):
+            self.assert_uid_indexes()
+            self.figure.add_scatter()
+            self.assertEqual(
+                self.figure._get_trace_ind_by_uid(self.figure.data[3].uid), 3
+            )
+            self.assert_uid_indexes()
+
+        def test_uid_index_after_delete_and_move(self):
+            self.assert_uid_indexes()
+            self.figure.data = [self.figure.data[2], self.figure.data[0]]
+            self.assert_uid_indexes()
+
+            with pytest.raises(ValueError):
+                self.figure._get_trace_ind_by_uid(self.uids[1])
+
+        def test_uid_index_after_uid_change(self):
+            self.assert_uid_indexes()
+            self.figure.data[0].uid = "e"
+            self.assert_uid_indexes()
+
+            with pytest.raises(ValueError):
+                self.figure._get_trace_ind_by_uid(self.uids[0])
+
+        def test_trace_deltas(self):
+            self.figure.data = [self.figure.data[2], self.figure.data[1]]
+            self.figure._js2py_traceDeltas = {
+                "trace_deltas": [{"uid": self.uids[1], "name": "trace b"}],
+                "trace_edit_id": self.figure._last_trace_edit_id,
+            }
+
+            self.assertEqual(self.figure.data[1]._prop_defaults["name"], "trace b")
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from plotly.basedatatypes import Undefined
+from plotly.serializers import _py_to_js
+
+
+def buffer_values(spec, dtype):
+    return np.frombuffer(spec["buffer"], dtype=dtype).reshape(spec["shape"])
+
+
+@pytest.mark.parametrize("dtype", ["int8", "uint16", "int32", "float32", "float64"])
+def test_numeric_array(dtype):
+    v = np.arange(4, dtype=dtype)
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == dtype
+    assert spec["shape"] == (4,)
+    np.testing.assert_array_equal(buffer_values(spec, dtype), v)
+
+
+def test_nd_array():
+    v = np.arange(6, dtype="float64").reshape(2, 3)
+    spec = _py_to_js({"z": v}, None)["z"]
+
+    assert spec["dtype"] == "float64"
+    assert spec["shape"] == (2, 3)
+    np.testing.assert_array_equal(buffer_values(spec, "float64"), v)
+
+
+def test_non_contiguous_big_endian_array():
+    v = np.arange(6, dtype=">i4").reshape(2, 3).T
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == "int32"
+    assert spec["shape"] == (3, 2)
+    np.testing.assert_array_equal(buffer_values(spec, "<i4"), v)
+
+
+@pytest.mark.parametrize(
+    "values,dtype",
+    [
+        ([-1, 2 ** 31 - 1], "int32"),
+        ([0, 2 ** 32 - 1], "uint32"),
+        ([-(2 ** 53), 2 ** 53], "float64"),
+        ([], "int32"),
+    ],
+)
+def test_int64_array_downcast(values, dtype):
+    v = np.array(values, dtype="int64")
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == dtype
+    np.testing.assert_array_equal(buffer_values(spec, dtype), v)
+
+
+def test_uint64_array_downcast():
+    v = np.array([0, 2 ** 40], dtype="uint64")
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == "float64"
+    np.testing.assert_array_equal(buffer_values(spec, "float64"), v)
+
+
+def test_int64_array_out_of_range():
+    v = np.array([0, 2 ** 60], dtype="int64")
+    assert _py_to_js(v, None) == [0, 2 ** 60]
+
+
+def test_bool_array():
+    v = np.array([[True, False], [False, True]])
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == "bool"
+    assert spec["shape"] == (2, 2)
+    np.testing.assert_array_equal(buffer_values(spec, "uint8"), v)
+
+
+def test_datetime64_array():
+    v = np.array(
+        ["2020-01-31T12:30:00", "NaT", "1969-12-31T23:59:59.000001"],
+        dtype="datetime64[ns]",
+    )
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == "datetime64[us]"
+    np.testing.assert_array_equal(
+        buffer_values(spec, "float64"), [1580473800000000, np.nan, -999999],
+    )
+
+
+def test_datetime64_date_array():
+    v = np.array(["2020-01-31", "NaT"], dtype="datetime64[D]")
+    spec = _py_to_js(v, None)
+
+    assert spec["dtype"] == "datetime64[D]"
+    np.testing.assert_array_equal(buffer_values(spec, "float64"), [18292, np.nan])
+
+
+def test_datetime64_array_out_of_range():
+    v = np.array(["2020-01-31T12:30:00", "9999-01-01"], dtype="datetime64[us]")
+    assert _py_to_js(v, None) == ["2020-01-31T12:30:00", "9999-01-01T00:00:00"]
+
+
+def test_other_values():
+    assert _py_to_js(np.array(["a", "b"]), None) == ["a", "b"]
+    assert _py_to_js(np.array(1.5), None) == 1.5
+    assert _py_to_js([1, (2, Undefined)], None) == [1, [2, "_undefined_"]]
@@ -1,8 +1,18 @@
 from __future__ import absolute_import
 
+from copy import deepcopy
+import sys
+import threading
+
 import plotly.graph_objects as go
+from plotly.basedatatypes import BaseFigure, BasePlotlyType
 from plotly.tests.utils import TestCaseNoTemplate
 
+if sys.version_info >= (3, 3):
+    from unittest.mock import patch
+else:
+    from mock import patch
+
 
 class FigureTest(TestCaseNoTemplate):
     def setUp(self):
@@ -199,3 +209,213 @@ class FigureTest(TestCaseNoTemplate):
             fig.to_plotly_json()["data"],
             [{"type": "scatter", "y": [1, 3, 2], "line": {"color": "yellow"}}],
         )
+
+    def test_to_dict_copy_false(self):
+        fig = go.Figure(
+            data=[go.Bar(y=[1, 3, 2], marker_color="blue")],
+            layout={"title": {"text": "Fig Title"}},
+            frames=[{"data": [{"y": [3, 2, 1]}]}],
+        )
+
+        fig_dict = fig.to_dict(copy=False)
+
+        # Same content as a copy, with lists presented as tuples
+        self.assertEqual(
+            fig_dict["data"],
+            ({"type": "bar", "y": (1, 3, 2), "marker": {"color": "blue"}},),
+        )
+        self.assertEqual(fig_dict["layout"], fig.to_dict()["layout"])
+        self.assertEqual(len(fig_dict["frames"]), 1)
+
+        # View is read-only
+        with self.assertRaises(TypeError):
+            fig_dict["layout"]["width"] = 100
+
+        with self.assertRaises(TypeError):
+            fig_dict["data"][0].pop("marker")
+
+        # Copies of the view are regular dicts
+        fig_dict_copy = deepcopy(fig_dict)
+        fig_dict_copy["layout"]["width"] = 100
+        self.assertEqual(fig_dict_copy["layout"]["width"], 100)
+        self.assertNotIn("width", fig.layout.to_plotly_json())
+
+        # Round trip through the figure constructor
+        self.assertEqual(go.Figure(fig_dict).to_dict(), fig.to_dict())
+
+    def test_str_to_dict_path(self):
+        str_to_dict_path = go.Figure._str_to_dict_path
+        self.assertEqual(str_to_dict_path("title"), ("title",))
+        self.assertEqual(str_to_dict_path(("foo", 1)), ("foo", 1))
+        self.assertEqual(
+            str_to_dict_path("xaxis_title_font_size"),
+            ("xaxis", "title", "font", "size"),
+        )
+        self.assertEqual(
+            str_to_dict_path("updatemenus[0].buttons[1].args"),
+            ("updatemenus", 0, "buttons", 1, "args"),
+        )
+        self.assertEqual(
+            str_to_dict_path("error_x_color"), ("error_x", "color"),
+        )
+        self.assertEqual(
+            str_to_dict_path("layout.paper_bgcolor"), ("layout", "paper_bgcolor")
+        )
+
+    def test_str_to_dict_path_cache(self):
+        cache = BaseFigure._key_path_cache
+        cache_size = BaseFigure._key_path_cache_size
+        try:
+            BaseFigure._key_path_cache_size = 2
+            cache.clear()
+
+            # Parsed key paths are cached
+            path1 = go.Figure._str_to_dict_path("marker_line_color")
+            self.assertIs(go.Figure._str_to_dict_path("marker_line_color"), path1)
+
+            # The least recently used key path is evicted
+            go.Figure._str_to_dict_path("xaxis.range[0]")
+            go.Figure._str_to_dict_path("marker_line_color")
+            go.Figure._str_to_dict_path("yaxis.range[1]")
+            self.assertEqual(
+                list(cache), ["marker_line_color", "yaxis.range[1]"],
+            )
+        finally:
+            BaseFigure._key_path_cache_size = cache_size
+            cache.clear()
+
+    def test_str_to_dict_path_cache_threads(self):
+        cache = BaseFigure._key_path_cache
+        cache_size = BaseFigure._key_path_cache_size
+        errors = []
+
+        def parse_paths(offset):
+            try:
+                for i in range(2000):
+                    n = (i + offset) % 10
+                    self.assertEqual(
+                        go.Figure._str_to_dict_path("xaxis.range[%d]" % n),
+                        ("xaxis", "range", n),
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            # Concurrent lookups with constant evictions
+            BaseFigure._key_path_cache_size = 3
+            cache.clear()
+            threads = [
+                threading.Thread(target=parse_paths, args=(offset,))
+                for offset in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            self.assertLessEqual(len(cache), 3)
+        finally:
+            BaseFigure._key_path_cache_size = cache_size
+            cache.clear()
+
+    def test_content_hash(self):
+        fig1 = go.Figure(
+            data=[go.Scatter(x=[1, 2, 3], y=[3, 1, 2], name="a")],
+            layout={"title": "Title"},
+        )
+        fig2 = go.Figure(
+            data=[go.Scatter(x=(1.0, 2.0, 3.0), y=[3, 1, 2], name="a")],
+            layout={"title": "Title"},
+        )
+
+        # Equal contents have equal hashes, regardless of sequence and
+        # number types
+        self.assertEqual(fig1.content_hash(), fig2.content_hash())
+        self.assertEqual(fig1, fig2)
+
+        # Modifying a trace changes the hash
+        fig2.data[0].name = "b"
+        self.assertNotEqual(fig1.content_hash(), fig2.content_hash())
+        self.assertNotEqual(fig1, fig2)
+
+        fig2.plotly_restyle({"name": "a"})
+        self.assertEqual(fig1, fig2)
+
+        # Modifying the layout changes the hash
+        fig2.layout.title.text = "Other title"
+        self.assertNotEqual(fig1, fig2)
+
+        fig2.plotly_relayout({"title.text": "Title"})
+        self.assertEqual(fig1, fig2)
+
+    def test_content_hash_add_delete_move_traces(self):
+        fig1 = go.Figure(data=[go.Scatter(y=[1]), go.Bar(y=[2])])
+        fig2 = go.Figure(data=[go.Bar(y=[2]), go.Scatter(y=[1])])
+        self.assertNotEqual(fig1, fig2)
+
+        fig2.data = fig2.data[::-1]
+        self.assertEqual(fig1, fig2)
+
+        fig2.add_scatter(y=[3])
+        self.assertNotEqual(fig1, fig2)
+
+        fig2.data = fig2.data[:2]
+        self.assertEqual(fig1, fig2)
+
+    def test_content_hash_frames(self):
+        fig1 = go.Figure(frames=[go.Frame(data=[go.Scatter(y=[1])])])
+        fig2 = go.Figure(frames=[go.Frame(data=[go.Scatter(y=[2])])])
+        self.assertNotEqual(fig1, fig2)
+
+        fig2.frames[0].data[0].y = [1]
+        self.assertEqual(fig1, fig2)
+
+    def test_content_hash_unvalidated(self):
+        import plotly.io as pio
+
+        s = go.Figure(data=[go.Scatter(y=[1, 2], name="a")]).to_json()
+        fig1 = pio.from_json(s, validate=False)
+        fig2 = pio.from_json(s, validate=False)
+        digest = fig2.content_hash()
+        self.assertEqual(fig1, fig2)
+        self.assertEqual(fig1.content_hash(), digest)
+
+        fig1.data[0].name = "b"
+        self.assertNotEqual(fig1, fig2)
+        self.assertNotEqual(fig1.content_hash(), digest)
+
+        fig1.data[0].name = "a"
+        fig1.update_layout(title_text="Title")
+        self.assertNotEqual(fig1, fig2)
+        self.assertNotEqual(fig1.content_hash(), digest)
+
+    def test_eq_short_circuits_on_cached_digests(self):
+        fig1 = go.Figure(data=[go.Scatter(y=[1, 2])], layout_title_text="A")
+        fig2 = go.Figure(data=[go.Scatter(y=[1, 3])], layout_title_text="A")
+        fig1.content_hash()
+        fig2.content_hash()
+
+        with patch.object(BasePlotlyType, "_vals_equal") as vals_equal:
+            self.assertNotEqual(fig1, fig2)
+            self.assertFalse(vals_equal.called)
+
+        # Figures with matching digests are compared in full
+        fig2.data[0].y = [1, 2]
+        self.assertEqual(fig1, fig2)
+
+    def test_vals_equal_numeric_lists(self):
+        self.assertTrue(BasePlotlyType._vals_equal([1, 2, 3], (1.0, 2, 3)))
+        self.assertFalse(BasePlotlyType._vals_equal([1, 2, 3], [1, 2, 4]))
+        self.assertTrue(BasePlotlyType._vals_equal([[1, 2], [3]], [[1, 2], [3]]))
+        self.assertFalse(BasePlotlyType._vals_equal([1, 2], ["1", 2]))
+        self.assertTrue(BasePlotlyType._vals_equal([1, None], [1, None]))
+
+    def test_eq_ignores_stale_content_hash(self):
+        fig1 = go.Figure(data=[go.Scatter(y=[1, 2], name="a")])
+        fig2 = go.Figure(data=[go.Scatter(y=[1, 2], name="a")])
+        self.assertEqual(fig1.content_hash(), fig2.content_hash())
+
+        # Equality doesn't depend on cached digests
+        fig1._data[0]["name"] = "b"
+        self.assertNotEqual(fig1, fig2)
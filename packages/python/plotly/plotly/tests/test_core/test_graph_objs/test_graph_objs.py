@@ -1,6 +1,9 @@
+import gc
+import weakref
 from unittest import TestCase
 
 import plotly.graph_objs as go
+from plotly.validator_cache import ValidatorCache
 
 
 OLD_CLASS_NAMES = [
@@ -180,3 +183,153 @@ class TestPop(TestCase):
 
     def test_pop_invalid_prop_with_default(self):
         self.assertEqual(self.layout.pop("bogus", 42), 42)
+
+
+class TestValidatorTable(TestCase):
+    def test_validator_bound_on_first_use(self):
+        go.scatter.Marker._validator_table.pop("size", None)
+        marker = go.scatter.Marker(size=3)
+
+        validator = go.scatter.Marker._validator_table["size"]
+        self.assertIs(marker._get_validator("size"), validator)
+        self.assertIs(validator, ValidatorCache.get_validator("scatter.marker", "size"))
+
+    def test_validator_tables_not_shared(self):
+        scatter_validator = go.scatter.Marker()._get_validator("size")
+        bar_validator = go.bar.Marker()._get_validator("line")
+
+        self.assertIsNot(
+            go.scatter.Marker._validator_table, go.bar.Marker._validator_table
+        )
+        self.assertEqual(scatter_validator.parent_name, "scatter.marker")
+        self.assertEqual(bar_validator.parent_name, "bar.marker")
+
+    def test_subplot_validators(self):
+        layout = go.Layout(xaxis2=dict(title_text="x2"))
+        validator = go.Layout._validator_table["xaxis2"]
+        self.assertEqual(validator.plotly_name, "xaxis2")
+        self.assertEqual(layout.xaxis2.title.text, "x2")
+
+    def test_private_attributes(self):
+        # Instance attributes are stored in slots, there is no instance dict
+        trace = go.Scatter()
+        self.assertFalse(hasattr(trace, "__dict__"))
+        self.assertFalse(hasattr(go.Layout(), "__dict__"))
+
+        trace._subplot_row = 1
+        self.assertEqual(trace._subplot_row, 1)
+
+        with self.assertRaises(AttributeError):
+            trace._bogus = 1
+
+        with self.assertRaises(ValueError):
+            trace.bogus = 1
+
+    def test_layout_valid_props_per_instance(self):
+        layout1 = go.Layout(xaxis2={})
+        layout2 = go.Layout()
+        self.assertIn("xaxis2", layout1._valid_props)
+        self.assertNotIn("xaxis2", layout2._valid_props)
+
+
+class TestValidatorSpecs(TestCase):
+    def test_validator_from_specs(self):
+        from plotly.validators.scatter.marker import SizeValidator
+
+        validator = ValidatorCache._get_validator_from_specs(
+            "scatter.marker", "size", "size"
+        )
+        module_validator = SizeValidator()
+
+        self.assertIsInstance(module_validator, type(validator))
+        self.assertEqual(validator.__dict__, module_validator.__dict__)
+
+    def test_subplot_validator_from_specs(self):
+        validator = ValidatorCache._get_validator_from_specs(
+            "layout", "xaxis", "xaxis2"
+        )
+        self.assertEqual(validator.plotly_name, "xaxis2")
+        self.assertEqual(validator.data_class_str, "XAxis")
+
+    def test_unknown_property(self):
+        self.assertIsNone(
+            ValidatorCache._get_validator_from_specs("scatter.marker", "bogus", "bogus")
+        )
+
+    def test_missing_specs(self):
+        specs = ValidatorCache._specs
+        ValidatorCache._specs = {}
+        try:
+            self.assertIsNone(
+                ValidatorCache._get_validator_from_specs(
+                    "scatter.marker", "size", "size"
+                )
+            )
+        finally:
+            ValidatorCache._specs = specs
+
+    def test_specs_from_blob(self):
+        from plotly.validators._schema_hash import __schema_hash__
+
+        specs = {"scatter": b""}
+        blob = {
+            "version": ValidatorCache._specs_version,
+            "schema_hash": __schema_hash__,
+            "specs": specs,
+        }
+        self.assertIs(ValidatorCache._specs_from_blob(blob), specs)
+
+        # Specs built from a different plot schema are not used
+        blob["schema_hash"] = "0" * len(__schema_hash__)
+        self.assertEqual(ValidatorCache._specs_from_blob(blob), {})
+
+        # Nor are specs in a different format
+        blob["schema_hash"] = __schema_hash__
+        blob["version"] = ValidatorCache._specs_version + 1
+        self.assertEqual(ValidatorCache._specs_from_blob(blob), {})
+
+    def test_specs_match_validators(self):
+        # The validator specs in package data were built from the same plot
+        # schema as the plotly.validators package
+        self.assertNotEqual(ValidatorCache._load_specs(), {})
+
+
+class TestCompoundChildCache(TestCase):
+    def setUp(self):
+        self.scatter = go.Figure(go.Scatter(marker_color="red")).data[0]
+
+    def test_identity(self):
+        marker = self.scatter.marker
+        self.assertIs(self.scatter.marker, marker)
+        self.assertIs(self.scatter.marker.line, self.scatter.marker.line)
+
+        # Children keep their ancestors alive
+        line = self.scatter.marker.line
+        del marker
+        gc.collect()
+        self.assertIs(self.scatter.marker.line, line)
+        self.assertIs(line.parent, self.scatter.marker)
+
+    def test_children_released(self):
+        marker_ref = weakref.ref(self.scatter.marker)
+        self.scatter.hoverlabel.font.size
+        gc.collect()
+
+        self.assertIsNone(marker_ref())
+        self.assertEqual(self.scatter._compound_props, {})
+
+        # Properties are kept by the parent
+        self.assertEqual(self.scatter.marker.color, "red")
+
+    def test_assignment(self):
+        marker = self.scatter.marker
+        self.scatter.marker = dict(size=3)
+        self.assertIsNone(marker.parent)
+        self.assertEqual(marker.color, "red")
+        self.assertEqual(self.scatter.marker.to_plotly_json(), {"size": 3})
+
+    def test_template_layout_subplots(self):
+        template = go.layout.Template(layout=dict(xaxis2=dict(range=[0, 1])))
+        fig = go.Figure(layout_template=template)
+        gc.collect()
+        self.assertEqual(fig.layout.template.layout.xaxis2.range, (0, 1))
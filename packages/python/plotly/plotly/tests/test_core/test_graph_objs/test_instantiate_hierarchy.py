@@ -39,3 +39,17 @@ class HierarchyTest(TestCase):
                     self.assertIsInstance(v, BaseFigure)
                 else:
                     self.assertIsInstance(v, BasePlotlyType)
+
+    def test_validator_tables_and_slots(self):
+        for datatypes_module in datatype_modules:
+            module = importlib.import_module(datatypes_module)
+            for name in getattr(module, "__all__", []):
+                obj = getattr(module, name)
+                if (
+                    inspect.isclass(obj)
+                    and issubclass(obj, BasePlotlyType)
+                    and obj.__module__.startswith(datatypes_module)
+                ):
+                    # Each generated class has its own validator table
+                    self.assertIsInstance(obj.__dict__["_validator_table"], dict)
+                    self.assertIn("__slots__", obj.__dict__)
@@ -2,6 +2,12 @@ import plotly.graph_objs as go
 import json
 import pytest
 import plotly.io as pio
+import sys
+
+if sys.version_info >= (3, 3):
+    from unittest.mock import MagicMock
+else:
+    from mock import MagicMock
 
 
 def build_invalid_fig():
@@ -34,3 +40,156 @@ def test_validate_false():
 
     finally:
         pio.templates.default = template
+
+
+def test_trusted():
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        with go.trusted():
+            fig = go.Figure(**build_invalid_fig())
+        assert json.loads(fig.to_json()) == expected_invalid_dict
+
+        # Validation is restored when the context exits
+        with pytest.raises(ValueError):
+            go.Figure(**build_invalid_fig())
+
+        with pytest.raises(ValueError):
+            with go.trusted():
+                raise ValueError()
+        with pytest.raises(ValueError):
+            go.Figure(**build_invalid_fig())
+
+    finally:
+        pio.templates.default = template
+
+
+def test_trusted_nested_and_updates():
+    def build():
+        fig = go.Figure(
+            data=[go.Scatter(y=[2, 1, 3], marker=dict(size=3), marker_color="red")],
+            layout=dict(xaxis3=dict(range=[1, 2])),
+        )
+        fig.update_layout(
+            xaxis2=dict(range=[0, 1]), yaxis_title_text="y", legend=dict(x=0.1)
+        )
+        fig.update_traces(line_width=3)
+        fig.add_bar(x=[1, 2])
+        fig.layout.xaxis2.title.text = "x2"
+        return fig
+
+    with go.trusted():
+        with go.trusted():
+            fig = build()
+
+        # Still trusted in outer context
+        assert not go.Scatter()._validate
+
+    expected = build()
+    assert fig.to_plotly_json() == expected.to_plotly_json()
+
+    # Objects built in the context remain unvalidated
+    assert not fig._validate
+    assert not fig.layout._validate
+    assert not fig.layout.xaxis2._validate
+    assert not fig.data[0]._validate
+    assert not fig.data[0].marker._validate
+    assert expected.data[0].marker._validate
+
+    fig.update_traces(marker_size="not a number", selector=dict(type="scatter"))
+    assert fig.data[0].marker.size == "not a number"
+    with pytest.raises(ValueError):
+        expected.update_traces(
+            marker_size="not a number", selector=dict(type="scatter")
+        )
+
+
+def test_trusted_updates_notify_figure():
+    with go.trusted():
+        fig = go.Figure(
+            [go.Scatter(name="a", y=[1, 2]), go.Scatter(name="b", y=[3, 4])]
+        )
+        fig2 = go.Figure(
+            [go.Scatter(name="a", y=[1, 2]), go.Scatter(name="b", y=[3, 4])]
+        )
+
+    # Build the trace index and the content digests
+    assert len(list(fig.select_traces(selector=dict(name="a")))) == 1
+    assert fig == fig2
+    digest = fig.content_hash()
+
+    fig.update_traces(name="c", selector=dict(name="a"))
+    assert [t.name for t in fig.select_traces(selector=dict(name="c"))] == ["c"]
+    assert list(fig.select_traces(selector=dict(name="a"))) == []
+    assert fig != fig2
+    assert fig.content_hash() != digest
+
+    fig.data[0].name = "a"
+    assert fig == fig2
+    assert fig.content_hash() == digest
+
+    fig.data[1].y = [5, 6]
+    assert fig != fig2
+    fig.data[1].y = [3, 4]
+    assert fig == fig2
+
+    fig.data[0].marker.color = "red"
+    assert fig != fig2
+    assert fig.data[0].marker.color == "red"
+    fig.data[0].marker = None
+    assert fig == fig2
+
+    fig.update_layout(title_text="title")
+    assert fig != fig2
+    assert fig.content_hash() != digest
+
+
+def test_trusted_updates_change_callbacks():
+    with go.trusted():
+        fig = go.Figure([go.Scatter(name="a")])
+
+    changes = []
+    fig.data[0].on_change(lambda trace, name: changes.append(name), "name")
+
+    fig.data[0].name = "b"
+    assert changes == ["b"]
+
+    # Unchanged values don't trigger callbacks
+    fig.data[0].name = "b"
+    assert changes == ["b"]
+
+
+def test_trusted_updates_in_batch_mode():
+    with go.trusted():
+        fig = go.Figure([go.Scatter(name="a")])
+
+    with fig.batch_update():
+        fig.data[0].name = "b"
+        fig.layout.title.text = "title"
+
+    assert fig.data[0].name == "b"
+    assert fig.layout.title.text == "title"
+    assert [t.name for t in fig.select_traces(selector=dict(name="b"))] == ["b"]
+
+
+def test_trusted_updates_send_messages():
+    with go.trusted():
+        fig = go.Figure([go.Scatter(), go.Parcoords(dimensions=[{}, {}])])
+
+    fig._send_restyle_msg = MagicMock()
+    fig._send_relayout_msg = MagicMock()
+
+    fig.data[0].marker.color = "green"
+    fig._send_restyle_msg.assert_called_once_with(
+        {"marker.color": ["green"]}, trace_indexes=0
+    )
+
+    fig._send_restyle_msg.reset_mock()
+    fig.data[1].dimensions[0].label = "dim 1"
+    fig._send_restyle_msg.assert_called_once_with(
+        {"dimensions.0.label": ["dim 1"]}, trace_indexes=1
+    )
+
+    fig.layout.xaxis.range = [0, 1]
+    fig._send_relayout_msg.assert_called_once_with({"xaxis.range": [0, 1]})
@@ -4,6 +4,7 @@ import inspect
 import copy
 
 import plotly.graph_objs as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
 
@@ -377,3 +378,70 @@ class TestSelectForEachUpdateTraces(TestCase):
                 {"type": "bar", "marker": {"line": {"width": 10}}},
             ],
         )
+
+    # trace indexes
+    # -------------
+    def test_select_after_property_change(self):
+        self.assert_select_traces([0, 2, 9], selector={"type": "scatter"})
+
+        # Change indexed properties after the indexes were built
+        self.fig.data[0].name = "Z"
+        self.fig.data[1].update(legendgroup="group")
+        self.fig.plotly_restyle({"name": "Y"}, trace_indexes=[2])
+
+        self.assert_select_traces([0], selector={"name": "Z"})
+        self.assert_select_traces([1], selector={"legendgroup": "group"})
+        self.assert_select_traces([2], selector={"name": "Y"})
+        self.assert_select_traces([], selector={"name": "A"})
+
+    def test_select_after_axis_change(self):
+        self.assert_select_traces([0, 1], row=1, col=1)
+        self.fig.data[1].update(xaxis="x2", yaxis="y2")
+        self.assert_select_traces([0], row=1, col=1)
+        self.assert_select_traces([1, 2, 3], row=2, col=1, secondary_y=False)
+
+    def test_select_after_add_delete_move(self):
+        self.assert_select_traces([0, 1], row=1, col=1)
+        self.assert_select_traces([0, 2, 9], selector={"type": "scatter"})
+
+        # Add
+        self.fig.add_scatter(y=[1, 2], name="J", row=1, col=1)
+        self.assert_select_traces([0, 1, 10], row=1, col=1)
+        self.assert_select_traces([10], selector={"name": "J"})
+
+        # Delete
+        self.fig.data = self.fig.data[1:]
+        self.assert_select_traces([0, 9], row=1, col=1)
+        self.assert_select_traces([1, 8, 9], selector={"type": "scatter"})
+
+        # Move
+        self.fig.data = self.fig.data[::-1]
+        self.assert_select_traces([0, 9], row=1, col=1)
+        self.assert_select_traces([0, 1, 8], selector={"type": "scatter"})
+        self.assert_select_traces([0], selector={"type": "scatter", "name": "J"})
+
+    def test_select_unhashable_selector_value(self):
+        self.assert_select_traces([], selector={"name": ["A"]})
+
+    def test_select_unvalidated_after_property_change(self):
+        fig = pio.from_json(self.fig.to_json(), validate=False)
+
+        def select_inds(**selector):
+            selected = list(fig.select_traces(selector=selector))
+            return [i for i, trace in enumerate(fig.data) if trace in selected]
+
+        self.assertEqual(select_inds(type="scatter"), [0, 2, 9])
+
+        # Change indexed properties after the indexes were built
+        fig.data[0].name = "Z"
+        fig.data[1].update(legendgroup="group")
+        fig.update_traces(name="Y", selector=dict(type="scatter3d"))
+
+        self.assertEqual(select_inds(name="Z"), [0])
+        self.assertEqual(select_inds(legendgroup="group"), [1])
+        self.assertEqual(select_inds(name="Y"), [4, 5])
+        self.assertEqual(select_inds(name="A"), [])
+
+        names = []
+        fig.for_each_trace(lambda t: names.append(t.name), selector=dict(name="Z"))
+        self.assertEqual(names, ["Z"])
@@ -0,0 +1,162 @@
+import base64
+import json
+
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+import plotly.io as pio
+from plotly.io._utils import (
+    to_binary_array_spec,
+    from_binary_array_spec,
+    encode_binary_arrays,
+)
+
+
+# fixtures
+# --------
+@pytest.fixture
+def fig1():
+    return go.Figure(
+        data=[
+            go.Heatmap(z=np.arange(6, dtype="float64").reshape(2, 3)),
+            go.Scatter(
+                x=np.arange(4, dtype="int32"),
+                y=np.array([0.5, np.nan, 1.5, 2.5], dtype="float32"),
+                text=["a", "b", "c", "d"],
+            ),
+        ],
+        layout={"title": "Figure title"},
+    )
+
+
+# binary array specs
+# ------------------
+@pytest.mark.parametrize(
+    "dtype", ["int8", "uint8", "int16", "uint16", "int32", "uint32", "float32"]
+)
+def test_binary_array_spec_round_trip(dtype):
+    v = np.arange(12, dtype=dtype).reshape(3, 4)
+    spec = to_binary_array_spec(v)
+    assert spec["dtype"] == np.dtype(dtype).str[1:]
+    assert spec["shape"] == [3, 4]
+
+    res = from_binary_array_spec(spec)
+    assert res.dtype == v.dtype
+    np.testing.assert_array_equal(res, v)
+
+
+def test_binary_array_spec_float64():
+    v = np.array([1.5, np.nan, -np.inf])
+    spec = to_binary_array_spec(v)
+    assert spec == {
+        "dtype": "f8",
+        "shape": [3],
+        "bdata": base64.b64encode(v.astype("<f8").tobytes()).decode("ascii"),
+    }
+    np.testing.assert_array_equal(from_binary_array_spec(spec), v)
+
+
+def test_binary_array_spec_non_contiguous():
+    v = np.arange(12, dtype="float64").reshape(3, 4)[:, 1]
+    np.testing.assert_array_equal(from_binary_array_spec(to_binary_array_spec(v)), v)
+
+
+def test_binary_array_spec_big_endian():
+    v = np.array([1, 2, 3], dtype=">i4")
+    spec = to_binary_array_spec(v)
+    assert spec["dtype"] == "i4"
+    np.testing.assert_array_equal(from_binary_array_spec(spec), v)
+
+
+def test_binary_array_spec_int64():
+    # int64 arrays are downcast when their values fit in 32 bits
+    spec = to_binary_array_spec(np.array([-1, 2], dtype="int64"))
+    assert spec["dtype"] == "i4"
+
+    spec = to_binary_array_spec(np.array([1, 2 ** 32 - 1], dtype="int64"))
+    assert spec["dtype"] == "u4"
+
+    assert to_binary_array_spec(np.array([-1, 2 ** 40], dtype="int64")) is None
+
+
+@pytest.mark.parametrize(
+    "v",
+    [
+        np.array(["a", "b"]),
+        np.array([True, False]),
+        np.array([1, "a"], dtype="object"),
+        np.array([1, 2], dtype="float16"),
+        np.ma.masked_array([1, 2], mask=[0, 1]),
+        [1, 2, 3],
+    ],
+)
+def test_binary_array_spec_unsupported(v):
+    assert to_binary_array_spec(v) is None
+
+
+def test_encode_binary_arrays_does_not_modify_input():
+    x = np.arange(3.0)
+    fig_dict = {"data": [{"type": "scatter", "x": x, "text": ["a", "b", "c"]}]}
+    res = encode_binary_arrays(fig_dict)
+
+    assert fig_dict["data"][0]["x"] is x
+    assert res["data"][0]["x"]["dtype"] == "f8"
+    assert res["data"][0]["text"] is fig_dict["data"][0]["text"]
+
+
+def test_encode_binary_arrays_without_arrays():
+    fig_dict = {"data": [{"type": "scatter", "x": [1, 2]}], "layout": {}}
+    assert encode_binary_arrays(fig_dict) is fig_dict
+
+
+# to_json / from_json
+# -------------------
+def assert_figs_equal(fig1, fig2):
+    # Compare arrays with assert_array_equal, which considers NaN values equal
+    np.testing.assert_array_equal(fig2.data[0].z, fig1.data[0].z)
+    np.testing.assert_array_equal(fig2.data[1].x, fig1.data[1].x)
+    np.testing.assert_array_equal(fig2.data[1].y, fig1.data[1].y)
+    assert fig2.data[1].text == fig1.data[1].text
+    assert fig2.layout == fig1.layout
+
+
+def test_to_json_binary_arrays(fig1):
+    res = json.loads(pio.to_json(fig1, binary_arrays=True))
+    assert res["data"][0]["z"]["dtype"] == "f8"
+    assert res["data"][0]["z"]["shape"] == [2, 3]
+    assert res["data"][1]["x"]["dtype"] == "i4"
+    assert res["data"][1]["y"]["dtype"] == "f4"
+    assert res["data"][1]["text"] == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_from_json_binary_arrays(fig1, engine):
+    if engine == "orjson":
+        pytest.importorskip("orjson")
+
+    fig2 = pio.from_json(pio.to_json(fig1, binary_arrays=True, engine=engine))
+    assert_figs_equal(fig1, fig2)
+    assert fig2.data[1].x.dtype == np.dtype("int32")
+
+
+def test_write_read_json_binary_arrays(fig1, tmp_path):
+    path = str(tmp_path / "fig.json")
+    pio.write_json(fig1, path, binary_arrays=True)
+    assert_figs_equal(fig1, pio.read_json(path))
+
+
+# to_html
+# -------
+def test_to_html_binary_arrays(fig1):
+    html = pio.to_html(
+        fig1, include_plotlyjs=False, full_html=False, binary_arrays=True
+    )
+    spec = to_binary_array_spec(fig1.data[0].z)
+    assert "function plotlyDecodeBinaryArrays" in html
+    assert spec["bdata"] in html
+
+
+def test_to_html_no_binary_arrays(fig1):
+    html = pio.to_html(fig1, include_plotlyjs=False, full_html=False)
+    assert "plotlyDecodeBinaryArrays" not in html
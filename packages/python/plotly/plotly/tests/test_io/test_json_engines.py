@@ -0,0 +1,152 @@
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import plotly.graph_objs as go
+import plotly.io as pio
+from plotly.io.json import config
+
+orjson = pytest.importorskip("orjson")
+
+
+# fixtures
+# --------
+@pytest.fixture(autouse=True)
+def reset_config():
+    yield
+    config.reset()
+
+
+@pytest.fixture
+def fig1():
+    return go.Figure(
+        data=[
+            go.Scatter(
+                x=pd.date_range("2020-01-01", periods=4, freq="H"),
+                y=np.array([1.5, np.nan, np.inf, -2.0]),
+                text=["a", "b", u"é", "d"],
+            ),
+            go.Bar(
+                x=[datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)],
+                y=np.array([1, 2], dtype="int64"),
+                marker={"color": np.array([0.5, 1.5], dtype="float32")},
+            ),
+        ],
+        layout={"title": "Figure title", "xaxis": {"range": [pd.NaT, None]}},
+    )
+
+
+# engines
+# -------
+def test_default_engine():
+    assert config.default_engine == "json"
+
+
+def test_set_default_engine():
+    for engine in ["json", "orjson", "auto"]:
+        config.default_engine = engine
+        assert config.default_engine == engine
+
+
+def test_invalid_default_engine():
+    with pytest.raises(ValueError):
+        config.default_engine = "bogus"
+
+
+def test_invalid_engine_argument(fig1):
+    with pytest.raises(ValueError):
+        pio.to_json(fig1, engine="bogus")
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_engines_equivalent(fig1, pretty):
+    json_str = pio.to_json(fig1, pretty=pretty, engine="json")
+    orjson_str = pio.to_json(fig1, pretty=pretty, engine="orjson")
+    assert json.loads(orjson_str) == json.loads(json_str)
+
+
+def test_default_engine_used(fig1):
+    config.default_engine = "orjson"
+    assert pio.to_json(fig1) == pio.to_json(fig1, engine="orjson")
+
+    config.default_engine = "auto"
+    assert pio.to_json(fig1) == pio.to_json(fig1, engine="orjson")
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_non_finite_to_null(engine):
+    fig_dict = {"data": [{"type": "scatter", "y": np.array([np.nan, -np.inf, 1.0])}]}
+    res = json.loads(pio.to_json(fig_dict, validate=False, engine=engine))
+    assert res["data"][0]["y"] == [None, None, 1.0]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_datetime64_arrays(engine):
+    fig_dict = {
+        "data": [
+            {
+                "type": "scatter",
+                "x": np.array(["2020-01-01", "NaT"], dtype="datetime64[D]"),
+                "y": [pd.Timestamp("2020-01-01 12:00"), pd.NaT],
+            }
+        ]
+    }
+    res = json.loads(pio.to_json(fig_dict, validate=False, engine=engine))
+    assert res["data"][0]["x"] == ["2020-01-01", None]
+    assert res["data"][0]["y"] == ["2020-01-01T12:00:00", None]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+@pytest.mark.parametrize("pandas_type", [pd.Series, pd.DatetimeIndex])
+def test_tz_aware_dates(engine, pandas_type):
+    x = pandas_type(pd.date_range("2020-01-01", periods=2, freq="12H", tz="US/Eastern"))
+    fig = go.Figure(go.Scatter(x=x, y=[1, 2]))
+
+    # The UTC offset is kept
+    res = json.loads(pio.to_json(fig, engine=engine))
+    assert res["data"][0]["x"] == [
+        "2020-01-01T00:00:00-05:00",
+        "2020-01-01T12:00:00-05:00",
+    ]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_datetime64_ns_arrays(engine):
+    x = pd.Series(pd.to_datetime(["2020-01-01", "2020-01-01 12:00:00.25", None]))
+    fig = go.Figure(go.Scatter(x=x, y=[1, 2, 3]))
+
+    # Dates are kept as a datetime64 array
+    assert fig.data[0].x.dtype == "datetime64[ns]"
+
+    res = json.loads(pio.to_json(fig, engine=engine))
+    assert res["data"][0]["x"] == [
+        "2020-01-01T00:00:00",
+        "2020-01-01T12:00:00.250000",
+        None,
+    ]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_non_contiguous_and_masked_arrays(engine):
+    fig_dict = {
+        "data": [
+            {
+                "type": "scatter",
+                "x": np.arange(6.0).reshape(2, 3)[:, 0],
+                "y": np.ma.masked_array([1, 2, 3], mask=[0, 1, 0]),
+            }
+        ]
+    }
+    res = json.loads(pio.to_json(fig_dict, validate=False, engine=engine))
+    assert res["data"][0]["x"] == [0.0, 3.0]
+    assert res["data"][0]["y"] == [1, None, 3]
+
+
+def test_orjson_input_not_modified():
+    x = np.array(["2020-01-01"], dtype="datetime64[D]")
+    fig_dict = {"data": [{"type": "scatter", "x": x}]}
+    pio.to_json(fig_dict, validate=False, engine="orjson")
+    assert fig_dict["data"][0]["x"] is x
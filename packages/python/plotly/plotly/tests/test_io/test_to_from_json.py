@@ -3,8 +3,11 @@ import plotly.io as pio
 import pytest
 import plotly
 import json
+import copy
+import gzip
 import sys
 import os
+import six
 
 if sys.version_info >= (3, 3):
     from unittest.mock import MagicMock
@@ -68,6 +71,15 @@ def test_to_json_validate_false(fig1):
     assert pio.to_json(dict1, validate=False) == json.dumps(dict1, **opts)
 
 
+def test_to_json_does_not_modify_input(fig1):
+    dict1 = fig1.to_dict()
+    dict1["data"][0]["uid"] = "trace-uid"
+    expected = copy.deepcopy(dict1)
+
+    pio.to_json(dict1, validate=False)
+    assert dict1 == expected
+
+
 def test_to_json_pretty_print(fig1):
     assert pio.to_json(fig1, remove_uids=False, pretty=True) == json.dumps(
         fig1, **pretty_opts
@@ -123,6 +135,35 @@ def test_from_json_invalid(fig1):
         pio.from_json(bad_json)
 
 
+@pytest.mark.parametrize("fig_type_spec", ["Figure", "FigureWidget"])
+def test_from_json_validate_false(fig1, fig_type_spec):
+    fig1_json = json.dumps(fig1, **opts)
+    fig1_loaded = pio.from_json(fig1_json, output_type=fig_type_spec, validate=False)
+
+    # Check return json
+    assert pio.to_json(fig1_loaded) == pio.to_json(fig1.to_dict())
+
+    # Check property access
+    assert list(fig1_loaded.data[1].dimensions[0]["values"]) == [1, 2, 3]
+    assert fig1_loaded.data[0].marker.color == "green"
+    assert fig1_loaded.layout.title.text == "Figure title"
+
+
+def test_from_json_validate_false_invalid(fig1):
+    dict1 = fig1.to_dict()
+    dict1["data"][0]["marker"]["size"] = -1
+
+    # Invalid values are not detected without validation
+    fig1_loaded = pio.from_json(json.dumps(dict1, **opts), validate=False)
+    assert fig1_loaded.data[0].marker.size == -1
+
+
+def test_read_json_validate_false(fig1):
+    fig1_json = json.dumps(fig1, **opts)
+    fig1_loaded = pio.read_json(six.StringIO(fig1_json), validate=False)
+    assert pio.to_json(fig1_loaded) == pio.to_json(fig1.to_dict())
+
+
 def test_from_json_skip_invalid(fig1):
     dict1 = fig1.to_dict()
 
@@ -225,3 +266,36 @@ def test_write_json_from_file_string(fig1, pretty, remove_uids):
         # Check contents that were written
         expected = pio.to_json(fig1, pretty=pretty, remove_uids=remove_uids)
         assert result == expected
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_write_read_json_gzip(fig1, pretty):
+    with tempfile.TemporaryDirectory() as dir_name:
+        path = os.path.join(dir_name, "fig1.json.gz")
+        pio.write_json(fig1, path, pretty=pretty)
+
+        # Check that the file is compressed
+        with gzip.open(path, "rb") as f:
+            result = f.read().decode("utf8")
+
+        assert result == pio.to_json(fig1, pretty=pretty)
+        assert pio.read_json(path) == pio.from_json(result)
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_write_json_chunked(fig1, pretty, monkeypatch):
+    # Encode arrays and lists in slices of 2 elements
+    monkeypatch.setattr(plotly.io._json, "_json_chunk_size", 2)
+    monkeypatch.setattr(plotly.io._json, "_json_write_size", 1)
+
+    fig1.add_scatter(y=list(range(7)), text=["a", "b", "c", "d", "e"])
+    fig1.update_layout(
+        annotations=[{"text": "A"}, {"text": "B"}, {"text": "C"}], xaxis_range=[0, 10],
+    )
+
+    filemock = MagicMock()
+    pio.write_json(fig1, filemock, pretty=pretty)
+
+    result = "".join(call[0][0] for call in filemock.write.call_args_list)
+    assert filemock.write.call_count > 1
+    assert result == pio.to_json(fig1, pretty=pretty)
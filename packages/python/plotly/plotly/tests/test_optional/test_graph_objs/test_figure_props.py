@@ -0,0 +1,229 @@
+import numpy as np
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from plotly.tests.utils import TestCaseNoTemplate
+
+
+class TestFigurePropsOwnership(TestCaseNoTemplate):
+    def setUp(self):
+        self.x = np.arange(10, dtype="float64")
+        self.y = np.arange(10, 20, dtype="float64")
+
+    def test_constructor_adopts_trace_props(self):
+        fig = go.Figure(data=[go.Scatter(x=self.x, y=self.y)])
+        trace = fig.data[0]
+
+        # Trace properties are stored in the figure's data list
+        self.assertIs(trace._props, fig._data[0])
+        self.assertEqual(trace._orphan_props, {})
+
+        # Validated arrays stay read-only and are not shared with the input
+        self.assertFalse(trace.x.flags.writeable)
+        self.assertFalse(np.shares_memory(trace.x, self.x))
+        np.testing.assert_array_equal(trace.x, self.x)
+
+    def test_add_traces_adopts_trace_props(self):
+        fig = go.Figure()
+        fig.add_traces([go.Scatter(x=self.x), go.Bar(y=self.y)])
+
+        self.assertIs(fig.data[0]._props, fig._data[0])
+        self.assertIs(fig.data[1]._props, fig._data[1])
+        self.assertFalse(fig.data[1].y.flags.writeable)
+
+    def test_orphan_trace_adopted(self):
+        scatter = go.Scatter(x=self.x, marker={"color": "green"})
+        fig = go.Figure(data=[scatter])
+
+        # Orphan traces are adopted by the figure rather than copied
+        self.assertIs(fig.data[0], scatter)
+        self.assertIs(scatter.parent, fig)
+        self.assertIs(scatter._props, fig._data[0])
+
+        fig.data[0].marker.color = "red"
+        self.assertEqual(scatter.marker.color, "red")
+
+    def test_orphan_trace_not_adopted_by_failed_figure(self):
+        scatter = go.Scatter(x=self.x, marker={"color": "green"})
+
+        with self.assertRaises(ValueError):
+            go.Figure(data=[scatter], layout={"bogus": 1})
+
+        with self.assertRaises(TypeError):
+            go.Figure(data=[scatter], bogus=1)
+
+        # The trace is still an orphan with its own properties
+        self.assertIsNone(scatter.parent)
+        self.assertEqual(scatter.marker.color, "green")
+
+        # So it's adopted rather than cloned by the next figure
+        fig = go.Figure(data=[scatter])
+        self.assertIs(fig.data[0], scatter)
+        self.assertIs(scatter.parent, fig)
+
+        fig.data[0].marker.color = "red"
+        self.assertEqual(fig.to_dict()["data"][0]["marker"]["color"], "red")
+
+    def test_unvalidated_trace_validated(self):
+        with go.trusted():
+            invalid = go.Scatter(mode="bogus")
+            scatter = go.Scatter(x=self.x, mode="markers")
+
+        with self.assertRaises(ValueError):
+            go.Figure(data=[invalid])
+
+        # Unvalidated traces are validated and copied rather than adopted
+        fig = go.Figure(data=[scatter])
+        self.assertIsNot(fig.data[0], scatter)
+        self.assertIsNone(scatter.parent)
+        self.assertTrue(fig.data[0]._validate)
+        self.assertEqual(fig.data[0].mode, "markers")
+
+        with self.assertRaises(ValueError):
+            fig.data[0].mode = "bogus"
+
+    def test_orphan_trace_not_modified_by_failed_add_traces(self):
+        fig = make_subplots(rows=1, cols=2)
+        scatter1 = go.Scatter(x=self.x)
+        scatter2 = go.Scatter(x=self.x)
+
+        with self.assertRaises(Exception):
+            fig.add_traces([scatter1, scatter2], rows=[1, 1], cols=[2, 3])
+
+        self.assertEqual(len(fig.data), 0)
+        for scatter in (scatter1, scatter2):
+            self.assertIsNone(scatter.parent)
+            self.assertIsNone(scatter._trace_ind)
+            self.assertIsNone(scatter.xaxis)
+
+    def test_owned_trace_cloned(self):
+        fig1 = go.Figure(data=[go.Scatter(x=self.x, marker={"color": "green"})])
+        fig2 = go.Figure(data=[fig1.data[0]])
+
+        # Traces that belong to another figure are cloned, sharing their
+        # read-only arrays
+        self.assertIsNot(fig2.data[0], fig1.data[0])
+        self.assertIs(fig1.data[0].parent, fig1)
+        self.assertIs(fig2.data[0].x, fig1.data[0].x)
+
+        fig2.data[0].marker.color = "red"
+        self.assertEqual(fig1.data[0].marker.color, "green")
+
+    def test_repeated_orphan_trace_cloned(self):
+        scatter = go.Scatter(x=self.x)
+        fig = go.Figure(data=[scatter, scatter])
+
+        self.assertIs(fig.data[0], scatter)
+        self.assertIsNot(fig.data[1], scatter)
+
+        fig.data[1].name = "B"
+        self.assertIsNone(scatter.name)
+
+    def test_readonly_arrays_shared_by_unvalidated_dict_traces(self):
+        fig1 = go.Figure(data=[go.Scatter(x=self.x)])
+        fig2 = go.Figure(fig1.to_dict(copy=False), _validate=False)
+
+        # Read-only arrays are shared instead of deep copied
+        self.assertIs(fig2.data[0].x, fig1.data[0].x)
+
+    def test_removed_trace_keeps_props(self):
+        fig = go.Figure(data=[go.Scatter(x=self.x), go.Bar(y=self.y)])
+        scatter, bar = fig.data
+        fig.data = [bar]
+
+        self.assertIsNone(scatter.parent)
+        np.testing.assert_array_equal(scatter.x, self.x)
+
+        # The removed trace is an orphan again, so it can be re-adopted
+        fig.add_trace(scatter)
+        self.assertIs(fig.data[1], scatter)
+        np.testing.assert_array_equal(fig.data[1].x, self.x)
+
+    def test_replaced_layout_keeps_props(self):
+        fig = go.Figure(layout={"title": {"text": "A"}})
+        layout = fig.layout
+        fig.layout = {"title": {"text": "B"}}
+
+        self.assertIsNone(layout.parent)
+        self.assertEqual(layout.title.text, "A")
+        self.assertEqual(fig.layout.title.text, "B")
+
+        fig.layout.title.text = "C"
+        self.assertEqual(layout.title.text, "A")
+
+
+class TestUnvalidatedProps(TestCaseNoTemplate):
+    def test_lists_converted_on_access(self):
+        fig = go.Figure(
+            {
+                "data": [
+                    {
+                        "type": "scatter",
+                        "y": [1.5, None, 2.5],
+                        "text": ["a", "b", "c"],
+                        "marker": {"size": [1, 2, 3]},
+                    }
+                ]
+            },
+            _validate=False,
+        )
+
+        digest = fig.content_hash()
+        y = fig.data[0].y
+        self.assertIsInstance(y, np.ndarray)
+        self.assertFalse(y.flags.writeable)
+        np.testing.assert_array_equal(y, [1.5, np.nan, 2.5])
+
+        # Reading a property doesn't change the figure
+        self.assertEqual(fig._data[0]["y"], [1.5, None, 2.5])
+        self.assertEqual(fig.content_hash(), digest)
+
+        # Only data arrays are converted
+        self.assertEqual(fig.data[0].text, ("a", "b", "c"))
+        self.assertEqual(fig.data[0].marker.size, (1, 2, 3))
+
+    def test_validated_lists_unchanged(self):
+        fig = go.Figure({"data": [{"type": "scatter", "y": [1, 2, 3]}]})
+        self.assertEqual(fig.data[0].y, (1, 2, 3))
+
+
+class TestFigureContentHash(TestCaseNoTemplate):
+    def test_arrays_and_lists_hash_equal(self):
+        fig1 = go.Figure(data=[go.Heatmap(z=np.arange(6).reshape(2, 3))])
+        fig2 = go.Figure(data=[go.Heatmap(z=[[0.0, 1, 2], [3, 4, 5]])])
+        self.assertEqual(fig1.content_hash(), fig2.content_hash())
+        self.assertEqual(fig1, fig2)
+
+    def test_array_values_hashed(self):
+        fig1 = go.Figure(data=[go.Scatter(y=np.array([1.0, np.nan, -0.0]))])
+        fig2 = go.Figure(data=[go.Scatter(y=np.array([1.0, np.nan, 0.0]))])
+        fig3 = go.Figure(data=[go.Scatter(y=np.array([1.0, np.nan, 2.0]))])
+        self.assertEqual(fig1.content_hash(), fig2.content_hash())
+        self.assertNotEqual(fig1.content_hash(), fig3.content_hash())
+
+    def test_large_integers(self):
+        fig1 = go.Figure(data=[go.Scatter(y=np.array([2 ** 60], dtype="int64"))])
+        fig2 = go.Figure(data=[go.Scatter(y=[2 ** 60 + 1])])
+        fig3 = go.Figure(data=[go.Scatter(y=[2 ** 60])])
+        self.assertNotEqual(fig1.content_hash(), fig2.content_hash())
+        self.assertEqual(fig1.content_hash(), fig3.content_hash())
+
+    def test_datetime_arrays(self):
+        x = np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[ns]")
+        fig1 = go.Figure(data=[go.Scatter(x=x)])
+        fig2 = go.Figure(data=[go.Scatter(x=x + np.timedelta64(1, "D"))])
+        self.assertEqual(fig1, go.Figure(data=[go.Scatter(x=x.copy())]))
+        self.assertNotEqual(fig1, fig2)
+
+    def test_hash_cached(self):
+        fig = go.Figure(data=[go.Scatter(y=np.arange(10))])
+        fig.content_hash()
+        digest = fig._trace_digests[0]
+        self.assertIsNotNone(digest)
+
+        # Layout changes don't invalidate trace digests
+        fig.layout.title = "Title"
+        self.assertIs(fig._trace_digests[0], digest)
+
+        fig.data[0].y = np.arange(5)
+        self.assertIsNone(fig._trace_digests[0])
@@ -51,6 +51,13 @@ rng = pd.date_range("1/1/2011", periods=2, freq="H")
 ts = pd.Series([1.5, 2.5], index=rng)
 
 
+class _NumpyListEncoder(_json.JSONEncoder):
+    def default(self, obj):
+        if obj is np.ma.core.masked:
+            return float("nan")
+        return obj.tolist()
+
+
 class TestJSONEncoder(TestCase):
     def test_encode_as_plotly(self):
 
@@ -116,6 +123,11 @@ class TestJSONEncoder(TestCase):
         res = utils.PlotlyJSONEncoder.encode_as_numpy(np.ma.core.masked)
         self.assertTrue(math.isnan(res))
 
+        res = utils.PlotlyJSONEncoder.encode_as_numpy(
+            np.array([[1.5, np.nan], [np.inf, -np.inf]])
+        )
+        self.assertEqual(res, [[1.5, None], [None, None]])
+
     def test_encode_as_datetime(self):
         # should succeed with 'utcoffset', 'isoformat' and '__sub__' attrs
         res = utils.PlotlyJSONEncoder.encode_as_datetime(datetime.datetime(2013, 10, 1))
@@ -263,6 +275,45 @@ class TestJSONEncoder(TestCase):
         print(j1)
         assert j1 == "[1, 2, null]"
 
+    def test_numpy_non_finite_json_encoding(self):
+        for dtype in ["float16", "float32", "float64"]:
+            a = np.array([1, np.nan, np.inf, -np.inf, 2], dtype=dtype)
+            j1 = _json.dumps(a, cls=utils.PlotlyJSONEncoder)
+            assert j1 == "[1.0, null, null, null, 2.0]"
+
+    def test_single_pass_encoding_matches_round_trip(self):
+        obj = {
+            "b": [1, float("nan"), np.ma.core.masked, float("-inf")],
+            "a": np.array([[0.1, np.nan]], dtype="float32"),
+            "c": "NaN and Infinity in a string",
+            "d": u"\u00e9",
+        }
+        for kwargs in [
+            {},
+            dict(sort_keys=True),
+            dict(separators=(",", ":")),
+            dict(indent=2),
+            dict(ensure_ascii=False),
+        ]:
+            encoded = _json.dumps(obj, cls=utils.PlotlyJSONEncoder, **kwargs)
+
+            # Reference: encode, then load and dump to strict JSON
+            dump_kwargs = {k: v for k, v in kwargs.items() if k != "ensure_ascii"}
+            round_trip = _json.dumps(
+                _json.loads(
+                    _json.dumps(obj, cls=_NumpyListEncoder, **kwargs),
+                    parse_constant=lambda const: None,
+                ),
+                **dump_kwargs
+            )
+            assert encoded == round_trip
+
+    def test_invalid_separators_raise(self):
+        with pytest.raises(ValueError):
+            _json.dumps(
+                {"a": [1, 2]}, cls=utils.PlotlyJSONEncoder, separators=(";", "=")
+            )
+
     def test_numpy_dates(self):
         a = np.arange(np.datetime64("2011-07-11"), np.datetime64("2011-07-18"))
         j1 = _json.dumps(a, cls=utils.PlotlyJSONEncoder)
@@ -4,6 +4,7 @@ import textwrap
 from pprint import PrettyPrinter
 
 from _plotly_utils.utils import *
+from _plotly_utils.basevalidators import array_config
 
 
 # Pretty printing
@@ -14,7 +15,7 @@ def _list_repr_elided(v, threshold=200, edgeitems=3, indent=0, width=80):
 
     Parameters
     ----------
-    v : list
+    v : list, tuple or numpy.ndarray
         Input list
     threshold :
         Maximum number of elements to display
@@ -23,7 +24,8 @@ def _list_repr_elided(v, threshold=200, edgeitems=3, indent=0, width=80):
     -------
     str
     """
-    if isinstance(v, list):
+    numpy = get_module("numpy", should_load=False)
+    if isinstance(v, list) or (numpy and isinstance(v, numpy.ndarray)):
         open_char, close_char = "[", "]"
     elif isinstance(v, tuple):
         open_char, close_char = "(", ")"
@@ -1,10 +1,26 @@
 import importlib
+import pickle
+import pkgutil
+
+import _plotly_utils.basevalidators
 from _plotly_utils.basevalidators import LiteralValidator
 
 
 class ValidatorCache(object):
     _cache = {}
 
+    # ### Validator specs ###
+    # Dict from parent path strings to pickled dicts from property names to
+    # (validator class name, params) tuples. The specs are built by codegen
+    # and stored in package_data/validators.pickle, so that validators can be
+    # constructed without importing the thousands of small modules in
+    # plotly.validators. The specs of a parent path are unpickled on first
+    # use. The file records the version of the specs format and a hash of
+    # the plot schema it was built from, and is only used when both match
+    # the generated plotly.validators package.
+    _specs = None
+    _specs_version = 1
+
     @staticmethod
     def get_validator(parent_path, prop_name):
 
@@ -24,11 +40,105 @@ class ValidatorCache(object):
                         lookup_name = match.group(1)
 
                 lookup_name = lookup_name or prop_name
-                class_name = lookup_name.title() + "Validator"
-                validator = getattr(
-                    importlib.import_module("plotly.validators." + parent_path),
-                    class_name,
-                )(plotly_name=prop_name)
+                validator = ValidatorCache._get_validator_from_specs(
+                    parent_path, lookup_name, prop_name
+                )
+                if validator is None:
+                    class_name = lookup_name.title() + "Validator"
+                    validator = getattr(
+                        importlib.import_module("plotly.validators." + parent_path),
+                        class_name,
+                    )(plotly_name=prop_name)
             ValidatorCache._cache[key] = validator
 
         return ValidatorCache._cache[key]
+
+    @staticmethod
+    def _get_validator_from_specs(parent_path, lookup_name, prop_name):
+        """
+        Construct a validator from the validator specs
+
+        Parameters
+        ----------
+        parent_path : str
+            Path string of the parent object (e.g. 'scatter.marker')
+        lookup_name : str
+            Name of the property in the specs (e.g. 'xaxis' for 'xaxis2')
+        prop_name : str
+            Name of the property
+
+        Returns
+        -------
+        BaseValidator or None
+            None if there is no spec for the property
+        """
+        specs = ValidatorCache._load_specs()
+        path_specs = specs.get(parent_path)
+        if path_specs is None:
+            return None
+        elif isinstance(path_specs, bytes):
+            path_specs = pickle.loads(path_specs)
+            specs[parent_path] = path_specs
+
+        spec = path_specs.get(lookup_name)
+        if spec is None:
+            return None
+
+        class_name, params = spec
+        validator_class = getattr(_plotly_utils.basevalidators, class_name)
+        return validator_class(plotly_name=prop_name, **params)
+
+    @staticmethod
+    def _load_specs():
+        """
+        Load the validator specs from package data. If the specs are missing,
+        were written for a different version of the specs format, or were
+        built from a different plot schema than the plotly.validators
+        package, an empty dict is returned, and validators are imported from
+        plotly.validators instead.
+
+        Returns
+        -------
+        dict
+        """
+        if ValidatorCache._specs is None:
+            specs = {}
+            try:
+                blob = pkgutil.get_data("plotly", "package_data/validators.pickle")
+                if blob is not None:
+                    specs = ValidatorCache._specs_from_blob(pickle.loads(blob))
+            except (IOError, OSError, EOFError, pickle.UnpicklingError):
+                # Fall back to importing validators
+                pass
+
+            ValidatorCache._specs = specs
+
+        return ValidatorCache._specs
+
+    @staticmethod
+    def _specs_from_blob(blob):
+        """
+        Get the validator specs from the unpickled validator specs file
+
+        Parameters
+        ----------
+        blob : dict
+            Dict with 'version', 'schema_hash' and 'specs' keys
+
+        Returns
+        -------
+        dict
+            Empty if the specs don't match the plotly.validators package
+        """
+        try:
+            from plotly.validators._schema_hash import __schema_hash__
+        except ImportError:
+            return {}
+
+        if (
+            blob.get("version") != ValidatorCache._specs_version
+            or blob.get("schema_hash") != __schema_hash__
+        ):
+            return {}
+
+        return blob["specs"]
@@ -0,0 +1,3 @@
+# DO NOT EDIT
+# This file is generated by codegen
+__schema_hash__ = "39eb327e021651ecf7f8362be5b461aa30558864a996ea1484c77899c238f276"
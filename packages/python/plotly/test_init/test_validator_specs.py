@@ -0,0 +1,37 @@
+import sys
+from . import version_skip
+
+
+@version_skip
+def test_first_figure_validator_modules_not_imported():
+
+    # plotly not imported yet
+    assert "plotly" not in sys.modules
+
+    # Construct and serialize a first figure
+    import plotly.graph_objects as go
+
+    fig = go.Figure(layout=dict(title="Title", xaxis=dict(title="x", showgrid=False)),)
+    fig.add_scatter(
+        x=[1, 2],
+        y=[3, 4],
+        mode="lines+markers",
+        marker=dict(color="red", size=4, line_width=1),
+        line=dict(dash="dot"),
+    )
+    fig.add_bar(x=[1], y=[2], marker_color="blue", xaxis="x2")
+    fig.to_json()
+
+    # Validators are constructed from the validator specs in package_data,
+    # without importing the modules of the plotly.validators package. Only
+    # the data, frames and layout validators are imported by the Figure
+    # class, and the schema hash that the specs are checked against
+    validator_modules = sorted(
+        m for m in sys.modules if m.startswith("plotly.validators.")
+    )
+    assert validator_modules == [
+        "plotly.validators._data",
+        "plotly.validators._frames",
+        "plotly.validators._layout",
+        "plotly.validators._schema_hash",
+    ]